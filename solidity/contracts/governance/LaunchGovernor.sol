@@ -5,8 +5,10 @@ pragma experimental ABIEncoderV2;
 
 import "../system/PolylaunchConstants.sol";
 import "../../interfaces/BasicLaunchInterface.sol";
+import "../metatx/RelayRecipient.sol";
+import {VentureBondIds} from "../venture-bond/VentureBondIds.sol";
 
-contract GovernorAlpha {
+contract GovernorAlpha is RelayRecipient {
     /// @notice The name of this contract
     string public name;
 
@@ -36,6 +38,9 @@ contract GovernorAlpha {
     /// @notice The address of the launch being governed
     BasicLaunchInterface public basicLaunch;
 
+    /// @notice The launchId of the launch being governed, encoded in the ids of its venture bonds
+    uint256 public launchId;
+
     /// @notice The address of the launch token
     GovernableERC20Interface public launchToken;
 
@@ -114,8 +119,8 @@ contract GovernorAlpha {
 
     /// @notice An event emitted when a new tap increase proposal is created
     event TapIncreaseProposalCreated(
-        uint256 id,
-        address proposer,
+        uint256 indexed id,
+        address indexed proposer,
         uint256 startTime,
         uint256 endTime,
         string description,
@@ -124,8 +129,8 @@ contract GovernorAlpha {
 
     /// @notice An event emitted when a new refund proposal is created
     event RefundProposalCreated(
-        uint256 id,
-        address proposer,
+        uint256 indexed id,
+        address indexed proposer,
         uint256 startTime,
         uint256 endTime,
         string description
@@ -133,32 +138,32 @@ contract GovernorAlpha {
 
     /// @notice An event emitted when a vote has been cast on a proposal
     event VoteCast(
-        address voter,
-        uint256 ventureBondId,
-        uint256 proposalId,
+        address indexed voter,
+        uint256 indexed ventureBondId,
+        uint256 indexed proposalId,
         bool support,
         uint256 votes
     );
 
     /// @notice An event emitted when a proposal has been canceled
-    event ProposalCanceled(uint256 id);
+    event ProposalCanceled(uint256 indexed id);
 
     /// @notice An event emitted when a proposal has been queued in the Timelock
-    event ProposalQueued(uint256 id, uint256 eta);
+    event ProposalQueued(uint256 indexed id, uint256 eta);
 
     /// @notice An event emitted when a proposal has been executed in the Timelock
-    event ProposalExecuted(uint256 id);
+    event ProposalExecuted(uint256 indexed id);
 
     modifier onlyTokenOwner(uint256 tokenId) {
         require(
-            ventureBond.ownerOf(tokenId) == msg.sender,
+            ventureBond.ownerOf(tokenId) == _msgSender(),
             "LaunchGovernor::onlyTokenOwner: Sender does not own a venture bond with the given id"
         );
         _;
     }
 
     modifier holdsVentureBond() {
-        uint256 numberOfTokensOwned = ventureBond.balanceOf(msg.sender);
+        uint256 numberOfTokensOwned = ventureBond.balanceOf(_msgSender());
         require(
             numberOfTokensOwned >= 1,
             "LaunchGovernor::holdsVentureBond: Sender does not own a venture bond"
@@ -168,7 +173,7 @@ contract GovernorAlpha {
 
     modifier isBondAssociatedWithLaunch(uint256 tokenId){
         require(
-            ventureBond.launchAddressAssociatedWithToken(tokenId) == address(basicLaunch),
+            VentureBondIds.launchIdOf(tokenId) == launchId,
             "isBondAssociatedWithLaunch: Token not associated with this launch"
         );
         _;
@@ -178,15 +183,18 @@ contract GovernorAlpha {
         string memory name_,
         address basicLaunch_,
         address launchToken_,
-        address ventureBond_
+        address ventureBond_,
+        address trustedForwarder_
     ) public {
         require(!initialised, "Contract already initialised");
         initialised = true;
 
         name = name_;
         basicLaunch = BasicLaunchInterface(basicLaunch_);
+        launchId = basicLaunch.launchId();
         launchToken = GovernableERC20Interface(launchToken_);
         ventureBond = VentureBondInterface(ventureBond_);
+        _setTrustedForwarder(trustedForwarder_);
     }
 
     function proposeTapIncrease(uint256 newRate, string memory description)
@@ -194,7 +202,7 @@ contract GovernorAlpha {
         returns (uint256)
     {
         require(
-            msg.sender == basicLaunch.launcher(),
+            _msgSender() == basicLaunch.launcher(),
             "LaunchGovernor::proposeTapIncrease: only the launcher can propose a tap increase"
         );
         require(
@@ -222,7 +230,7 @@ contract GovernorAlpha {
         Proposal storage p = proposals[proposalCount];
 
         p.id = proposalCount;
-        p.proposer = msg.sender;
+        p.proposer = _msgSender();
         p.eta = 0;
         p.newRate = newRate;
         p.startTime = startTime;
@@ -236,7 +244,7 @@ contract GovernorAlpha {
 
         emit TapIncreaseProposalCreated(
             p.id,
-            msg.sender,
+            _msgSender(),
             startTime,
             endTime,
             description,
@@ -247,8 +255,8 @@ contract GovernorAlpha {
 
     function proposeRefund(string memory description, uint256 tokenId) public returns (uint256) {
         require(
-            (ventureBond.ownerOf(tokenId) == msg.sender && ventureBond.launchAddressAssociatedWithToken(tokenId) == address(basicLaunch)) ||
-                msg.sender == basicLaunch.launcher(),
+            (ventureBond.ownerOf(tokenId) == _msgSender() && VentureBondIds.launchIdOf(tokenId) == launchId) ||
+                _msgSender() == basicLaunch.launcher(),
             "LaunchGovernor::proposeRefund: Must be launcher or hold a venture bond to propose a refund"
         );
         if (latestRefundProposalId != 0) {
@@ -270,7 +278,7 @@ contract GovernorAlpha {
         Proposal storage p = proposals[proposalCount];
 
         p.id = proposalCount;
-        p.proposer = msg.sender;
+        p.proposer = _msgSender();
         p.eta = 0;
         p.newRate = 0;
         p.startTime = startTime;
@@ -284,7 +292,7 @@ contract GovernorAlpha {
 
         emit RefundProposalCreated(
             p.id,
-            msg.sender,
+            _msgSender(),
             startTime,
             endTime,
             description
@@ -327,7 +335,7 @@ contract GovernorAlpha {
 
         if (proposal.newRate != 0) {
             require(
-                msg.sender == proposal.proposer,
+                _msgSender() == proposal.proposer,
                 "LaunchGovernor::execute: Tap increase proposals can only be executed by the proposer"
             );
             basicLaunch.increaseTap(proposal.newRate);
@@ -391,7 +399,7 @@ contract GovernorAlpha {
         uint256 proposalId,
         bool support
     ) public onlyTokenOwner(ventureBondId) isBondAssociatedWithLaunch(ventureBondId) {
-        return _castVote(msg.sender, ventureBondId, proposalId, support);
+        return _castVote(_msgSender(), ventureBondId, proposalId, support);
     }
 
     function _castVote(
@@ -20,13 +20,14 @@ import {LaunchRedemption} from "./LaunchRedemption.sol";
 import {LaunchGovernance} from "./LaunchGovernance.sol";
 import {LaunchVault} from "./LaunchVault.sol";
 import {LaunchLogger} from "./LaunchLogger.sol";
+import {RelayRecipient} from "../metatx/RelayRecipient.sol";
 
 /**
  * @author PolyLaunch Protocol
  * @title Basic launch
  * @notice A PolyLaunch DAICO launch contract following a fixed price mechanism
  */
-contract BasicLaunch is PolyVault, ReentrancyGuard {
+contract BasicLaunch is PolyVault, ReentrancyGuard, RelayRecipient {
     using SafeERC20 for IERC20;
     using SafeMath for uint256;
     using Counters for Counters.Counter;
@@ -50,7 +51,7 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
      * @notice modifier to check that the configured token launcher is making the call
      */
     modifier onlyLauncher() {
-        require(msg.sender == self.launcher, "Caller must be launcher");
+        require(_msgSender() == self.launcher, "Caller must be launcher");
         _;
     }
 
@@ -107,6 +108,7 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
         address _ventureBondContract,
         address _marketContract,
         address _system,
+        address _trustedForwarder,
         uint256 _launchId
     ) public onlyFactory {
         require(!self.initialised, "Contract already initialised");
@@ -146,6 +148,8 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
         self.marketAddress = _marketContract;
         self.genericNftData = launchInfo._genericNftData;
         self.ipfsHash = launchInfo._ipfsHash;
+        _setTrustedForwarder(_trustedForwarder);
+        self.tokenBalance = launchInfo._totalForSale;
         self.TOKEN.safeTransferFrom(
             msg.sender,
             address(this),
@@ -163,66 +167,69 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
      * @param amount the amount the address would like to invest
      */
     function sendStable(uint256 amount) external {
+        address sender = _msgSender();
         require(block.timestamp >= self.START, "Launch not started");
         require(block.timestamp < self.END, "Launch has ended");
-        require(register.isWhiteListed[msg.sender], "msg.sender not whitelisted");
         if (self.totalFunding.add(amount) > self.FUNDING_CAP){
             amount = self.FUNDING_CAP.sub(self.totalFunding);
             require(amount > 0, "Launch has reached the funding cap");
         }
-        require(
-            self.provided[msg.sender].add(amount) <=
-                self.INDIVIDUAL_FUNDING_CAP,
-            "You have reached the individual funding cap"
+        register.recordContribution(
+            sender,
+            amount,
+            self.INDIVIDUAL_FUNDING_CAP
         );
+        self.totalFunding += amount;
+        self.stableBalance += amount;
         require(
-            self.stable.transferFrom(msg.sender, address(this), amount),
+            self.stable.transferFrom(sender, address(this), amount),
             "Token transfer failed"
         );
-        if (self.provided[msg.sender] == 0) {
-            register.supporterIndex[msg.sender] = register
-                .supporterTracker
-                .current();
-            register.supporterTracker.increment();
-        }
-
-        self.totalFunding += amount;
-        self.provided[msg.sender] += amount;
 
         LaunchLogger(self.polylaunchSystem).logSupporterFundsDeposited(
             address(this),
-            msg.sender,
+            sender,
             amount
         );
     }
 
+    /**
+     * @notice Settle the launch once it has ended, storing whether it succeeded and the tap rates and token
+     * totals derived from the amount raised. Claims and taps finalize the launch automatically if needed.
+     */
+    function finalize() external {
+        require(block.timestamp > self.END, "The offering has not finished");
+        require(!self.finalized, "Launch already finalized");
+        self.finalize();
+    }
+
     /**
      * @notice Claim function for an supporter to either claim and mint their NFT for a successful launch or
      * retrieve their DAI after a failed launch
      */
     function claim() external nonReentrant {
-        self.claim(register);
+        self.claim(register, _msgSender());
     }
 
     /**
      * @notice Launcher withdraws all tokens they provided if the minimum funding amount is not reached.
      */
     function withdrawTokenAfterFailedLaunch() external onlyLauncher {
-        self.withdrawTokenAfterFailedLaunch();
+        self.withdrawTokenAfterFailedLaunch(_msgSender());
     }
 
     /**
      * @notice Launcher withdraws all tokens that were not sold during the sale window.
      */
     function withdrawUnsoldTokens() external onlyLauncher {
-        self.withdrawUnsoldTokens();
+        self.withdrawUnsoldTokens(_msgSender());
     }
 
     /**
      * @notice Launcher tap for receiving DAI that they are entitled to.
      */
     function launcherTap() external onlyLauncher {
-        self.launcherTap();
+        self.launcherTap(_msgSender());
     }
 
     /**
@@ -230,7 +237,7 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
      * @param tokenId the id of the token that the supporter owns
      */
     function supporterTap(uint256 tokenId) external nonReentrant {
-        self.supporterTap(tokenId);
+        self.supporterTap(tokenId, _msgSender());
     }
 
     /**
@@ -248,6 +255,40 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
         self.exitFromVault();
     }
 
+    /**
+     * @notice Launcher tap made by the PolylaunchSystem on behalf of a keeper, funds still go to the fund recipient
+     * @return whether anything was due and tapped
+     */
+    function keeperTap() external returns (bool) {
+        require(msg.sender == self.polylaunchSystem, "Caller must be PolylaunchSystem contract");
+        (uint256 tapDue, ) = keeperStatus();
+        if (tapDue == 0) {
+            return false;
+        }
+        self.launcherTap(msg.sender);
+        return true;
+    }
+
+    /**
+     * @notice send the system its share of the yield accrued in the PolyVault, without exiting the vault
+     * @return the amount of stable sent to the system
+     */
+    function harvest() external returns (uint256) {
+        require(msg.sender == self.polylaunchSystem, "Caller must be PolylaunchSystem contract");
+        return self.harvest();
+    }
+
+    /**
+     * @notice View function for keepers to check what is due from the launch
+     * @return tapDue the stable the launcher could tap and harvestable the yield not yet harvested
+     */
+    function keeperStatus() public view returns (uint256 tapDue, uint256 harvestable) {
+        tapDue = activated
+            ? LaunchUtils.launcherTapDue(self, remainingBalance, lastWithdrawn)
+            : LaunchUtils.launcherTapDue(self, self.stableBalance, self.lastWithdrawn);
+        harvestable = _harvestableYield(self.stable);
+    }
+
     /**
      * @notice View function to check the funds provided to the launch
      * @return the total amount of DAI provided to the launch
@@ -266,7 +307,31 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
         view
         returns (uint256)
     {
-        return self.fundsProvidedByAddress(addr);
+        return register.providedBy(addr);
+    }
+
+    /**
+     * @notice View function to check whether the launch has been finalized and whether it was successful
+     * @return finalized whether the launch has been finalized and successful whether the minimum was raised
+     */
+    function launchOutcome() external view returns (bool finalized, bool successful) {
+        return (self.finalized, self.launchSuccessful);
+    }
+
+    /**
+     * @notice View function to return the stable (DAI) held by the launch according to its internal ledger
+     * @return the stable balance of the launch, excluding funds deposited in a vault
+     */
+    function stableBalance() external view returns (uint256) {
+        return self.stableBalance;
+    }
+
+    /**
+     * @notice View function to return the launch tokens held by the launch according to its internal ledger
+     * @return the token balance of the launch
+     */
+    function tokenBalance() external view returns (uint256) {
+        return self.tokenBalance;
     }
 
     /**
@@ -302,10 +367,10 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
     }
 
     /**
-     * @notice View function to return the ipfs hash of the launch details
+     * @notice View function to return the sha2-256 digest of the ipfs content holding the launch details
      * @return address of the launcher
      */
-    function ipfsHash() public view returns (string memory) {
+    function ipfsHash() public view returns (bytes32) {
         return self.ipfsHash;
     }
 
@@ -466,21 +531,29 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
      * @param tokenId id of the venture bond to claim the refund against
      */
     function claimRefund(uint256 tokenId) external nonReentrant returns (uint256) {
-        return self.claimRefund(tokenId);
+        return self.claimRefund(tokenId, _msgSender());
+    }
+
+    /**
+     * @notice Allows venture bond owners to claim stable refunds on several venture bonds in one transaction.
+     * @param tokenIds ids of the venture bonds to claim the refunds against
+     */
+    function claimRefunds(uint256[] memory tokenIds) external nonReentrant returns (uint256) {
+        return self.claimRefunds(tokenIds, _msgSender());
     }
 
     /**
      * @notice Allows launcher to claim back refunded tokens
      */
     function launcherClaimRefund() external onlyLauncher{
-        return self.launcherClaimRefund();
+        return self.launcherClaimRefund(_msgSender());
     }
 
     /**
      * @notice Allows launcher to update the ipfs hash containing the project description
-     * @param _newIpfsHash ipfs hash containing the new project details
+     * @param _newIpfsHash sha2-256 digest of the ipfs content containing the new project details
      */
-    function updateIpfsHash(string memory _newIpfsHash) external onlyLauncher {
+    function updateIpfsHash(bytes32 _newIpfsHash) external onlyLauncher {
         self.ipfsHash = _newIpfsHash;
     }
 
@@ -496,4 +569,8 @@ contract BasicLaunch is PolyVault, ReentrancyGuard {
         register.removeFromWhitelist(_address);
     }
 
+    function batchSetIndividualCaps(address[] memory _addresses, uint256[] memory _caps) external onlyLauncher {
+        register.batchSetIndividualCaps(_addresses, _caps);
+    }
+
 }
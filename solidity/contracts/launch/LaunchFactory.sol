@@ -26,6 +26,24 @@ contract LaunchFactory is
     ILaunchFactory
 {
     using Counters for Counters.Counter;
+
+    /**
+     * @notice struct to store the contracts of a launch, start and end times are packed alongside the addresses
+     */
+    struct LaunchRecord {
+        address launch;
+        uint64 startTime;
+        address governor;
+        uint64 endTime;
+        address token;
+    }
+
+    /**
+     * @notice filters for enumerating launches, Active launches have started and not ended, Successful launches
+     * have ended having raised more than their minimum funding
+     */
+    enum LaunchFilter {Active, Ended, Successful}
+
     // address of the launch contract used as template for proxies
     address public baseBasicLaunchAddress;
     // address of the Venture Bond contract
@@ -36,10 +54,14 @@ contract LaunchFactory is
     address public baseGovernorAddress;
     // address of the Vault registry contract
     address private vaultRegistryAddress;
+    // address of the EIP-2771 forwarder trusted by launches and governors
+    address public trustedForwarderAddress;
     // IERC20 interface for DAI
     IERC20 public stableAddress;
     // tracker for the number of launches
     Counters.Counter public launchIdTracker;
+    // mapping to track the contracts of each launch by launchId
+    mapping(uint256 => LaunchRecord) public launchRecords;
     //   address public baseDutchAuctionAddress; future (example)
     //   address public nftTokenAddress; future (example)
 
@@ -52,7 +74,7 @@ contract LaunchFactory is
             "VentureBondDataRegistry: metadata hash must be non-zero"
         );
         require(
-            bytes(_nftData.tokenURI).length != 0,
+            _nftData.tokenURIDigest != 0,
             "VentureBondDataRegistry: token URI must be non-zero"
         );
         _;
@@ -118,6 +140,17 @@ contract LaunchFactory is
         vaultRegistryAddress = _vaultRegistryAddress;
     }
 
+    /**
+     * @notice sets the forwarder that created launches and governors will trust for meta-transactions
+     * @param _trustedForwarderAddress the address of the EIP-2771 forwarder
+     */
+    function setTrustedForwarderAddress(address _trustedForwarderAddress)
+        public
+        onlySystem
+    {
+        trustedForwarderAddress = _trustedForwarderAddress;
+    }
+
     function getVaultRegistryAddress() public override returns (address) {
         return vaultRegistryAddress;
     }
@@ -130,6 +163,95 @@ contract LaunchFactory is
         return launchIdTracker.current();
     }
 
+    /**
+     * @notice View function to return a page of launch records, in launchId order
+     * @param start the first launchId of the page
+     * @param count the maximum number of records to return
+     * @return records the launch records, shorter than count if the page runs past the last launch
+     */
+    function getLaunchRecords(uint256 start, uint256 count)
+        external
+        view
+        returns (LaunchRecord[] memory records)
+    {
+        uint256 end = _pageEnd(start, count);
+        if (start >= end) {
+            return records;
+        }
+        records = new LaunchRecord[](end - start);
+        for (uint256 i = start; i < end; i++) {
+            records[i - start] = launchRecords[i];
+        }
+    }
+
+    /**
+     * @notice View function to return the ids of the launches matching a filter within a range of launchIds
+     * @param filter the filter to apply, see LaunchFilter
+     * @param start the first launchId to check
+     * @param count the maximum number of launchIds to check
+     * @return ids the matching launchIds and next the launchId to start the following page from
+     * @dev next equals launchIdCounter() once every launch has been checked
+     */
+    function getLaunchIds(
+        LaunchFilter filter,
+        uint256 start,
+        uint256 count
+    ) external view returns (uint256[] memory ids, uint256 next) {
+        next = _pageEnd(start, count);
+        if (start >= next) {
+            return (ids, start);
+        }
+        ids = new uint256[](next - start);
+        uint256 found;
+        for (uint256 i = start; i < next; i++) {
+            if (_matches(launchRecords[i], filter)) {
+                ids[found++] = i;
+            }
+        }
+        // shrink the array to the number of matches
+        assembly {
+            mstore(ids, found)
+        }
+    }
+
+    /**
+     * @notice end of a page of launchIds, capped at the number of launches created
+     */
+    function _pageEnd(uint256 start, uint256 count)
+        private
+        view
+        returns (uint256)
+    {
+        uint256 end = launchIdTracker.current();
+        if (start < end && end - start > count) {
+            end = start + count;
+        }
+        return end;
+    }
+
+    /**
+     * @notice check a launch against a filter
+     */
+    function _matches(LaunchRecord storage record, LaunchFilter filter)
+        private
+        view
+        returns (bool)
+    {
+        if (filter == LaunchFilter.Active) {
+            return
+                block.timestamp >= record.startTime &&
+                block.timestamp <= record.endTime;
+        }
+        if (block.timestamp <= record.endTime) {
+            return false;
+        }
+        if (filter == LaunchFilter.Ended) {
+            return true;
+        }
+        BasicLaunch launch = BasicLaunch(payable(record.launch));
+        return launch.totalFundsProvided() > launch.softCap();
+    }
+
     /**
      * @notice creates a basic launch and emits an event with the associated market and VentureBond addresses of the launch
      * @param launchInfo struct data for launchInfo data to configure the launch, see ILaunchFactory
@@ -147,11 +269,19 @@ contract LaunchFactory is
         address createdGovernorAddr = createClone(baseGovernorAddress);
 
         clone.setOwnership(address(this), msg.sender, createdGovernorAddr);
+        launchRecords[launchId_] = LaunchRecord({
+            launch: createdBasicLaunchAddr,
+            startTime: uint64(launchInfo._startDate),
+            governor: createdGovernorAddr,
+            endTime: uint64(launchInfo._endDate),
+            token: address(launchInfo._token)
+        });
 
         GovernorAlpha governorClone =
             GovernorAlpha(payable(createdGovernorAddr));
         IVentureBond(ventureBondAddress).authoriseLaunch(
-            createdBasicLaunchAddr
+            createdBasicLaunchAddr,
+            launchId_
         );
         require(
             launchInfo._token.transferFrom(
@@ -171,7 +301,8 @@ contract LaunchFactory is
             "Governor",
             createdBasicLaunchAddr,
             address(launchInfo._token),
-            ventureBondAddress
+            ventureBondAddress,
+            trustedForwarderAddress
         );
         LaunchLogger(polylaunchSystemAddress).logBasicLaunchCreated(
             createdBasicLaunchAddr,
@@ -201,6 +332,7 @@ contract LaunchFactory is
             ventureBondAddress,
             marketAddress,
             polylaunchSystemAddress,
+            trustedForwarderAddress,
             launchId
         );
     }
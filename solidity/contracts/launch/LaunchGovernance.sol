@@ -31,6 +31,14 @@ library LaunchGovernance {
         if (self.yieldActivated){
         LaunchVault.exitFromVault(self);
         }
+        // snapshot the stable available per token sold so every claim is paid at the same rate, bonds can
+        // still be claimed in refund mode so the snapshot covers every token sold, not only the claimed ones
+        self.finalize();
+        if (self.soldTokens != 0) {
+            self.refundPerUnit = self.stableBalance.mul(1e18).div(
+                self.soldTokens
+            );
+        }
         LaunchLogger(self.polylaunchSystem).logRefundModeInitiated(
             address(this)
         );
@@ -40,79 +48,121 @@ library LaunchGovernance {
      * @notice Refunds the user according to their token balance and NFT tappable balance
      * @param self Data struct associated with the launch
      * @param tokenId The specific venture bond that the refund is being claimed on
+     * @param sender the original caller, must own the venture bond
+     * @return the amount of stable refunded
      */
-    function claimRefund(LaunchUtils.Data storage self, uint256 tokenId)
-        internal
-        returns (uint256)
-    {
+    function claimRefund(
+        LaunchUtils.Data storage self,
+        uint256 tokenId,
+        address sender
+    ) public returns (uint256) {
         require(
             self.isRefundMode == true,
             "claimRefund: Launch is not in refund mode"
         );
+        (uint256 amountDue, uint256 tokensReturned) =
+            _refundBond(self, tokenId, sender, self.TOKEN.balanceOf(sender));
+        _settleRefund(self, sender, amountDue, tokensReturned);
+        return amountDue;
+    }
+
+    /**
+     * @notice Refunds the user for several venture bonds at once, moving tokens and stable in a single transfer each
+     * @param self Data struct associated with the launch
+     * @param tokenIds The venture bonds that the refund is being claimed on
+     * @param sender the original caller, must own every venture bond
+     * @return amountDue the total amount of stable refunded
+     */
+    function claimRefunds(
+        LaunchUtils.Data storage self,
+        uint256[] memory tokenIds,
+        address sender
+    ) public returns (uint256 amountDue) {
         require(
-            IERC721(self.ventureBondAddress).ownerOf(tokenId) == msg.sender,
-            "claimRefund: Sender not ventureBond owner"
+            self.isRefundMode == true,
+            "claimRefund: Launch is not in refund mode"
         );
+        uint256 walletBalance = self.TOKEN.balanceOf(sender);
+        uint256 tokensReturned;
+        for (uint256 i = 0; i < tokenIds.length; i++) {
+            (uint256 bondAmountDue, uint256 bondTokensReturned) =
+                _refundBond(self, tokenIds[i], sender, walletBalance);
+            walletBalance = walletBalance.sub(bondTokensReturned);
+            amountDue = amountDue.add(bondAmountDue);
+            tokensReturned = tokensReturned.add(bondTokensReturned);
+        }
+        _settleRefund(self, sender, amountDue, tokensReturned);
+    }
 
+    /**
+     * @notice Books the refund for a single venture bond against the snapshot taken when refund mode was initiated
+     * @param self Data struct associated with the launch
+     * @param tokenId The specific venture bond that the refund is being claimed on
+     * @param sender the original caller, must own the venture bond
+     * @param walletBalance the launch tokens the sender holds that have not yet been returned
+     * @return amountDue the stable owed for the bond and tokensReturned the wallet tokens to be returned for it
+     */
+    function _refundBond(
+        LaunchUtils.Data storage self,
+        uint256 tokenId,
+        address sender,
+        uint256 walletBalance
+    ) private returns (uint256 amountDue, uint256 tokensReturned) {
+        IVentureBond ventureBond = IVentureBond(self.ventureBondAddress);
         require(
-            IVentureBond(self.ventureBondAddress).launchAddressAssociatedWithToken(tokenId) == address(this),
+            IERC721(address(ventureBond)).ownerOf(tokenId) == sender,
+            "claimRefund: Sender not ventureBond owner"
+        );
+        require(
+            LaunchUtils.isLaunchBond(self, tokenId),
             "claimRefund: ventureBond not associated with this launch"
         );
-        uint256 walletBalance = self.TOKEN.balanceOf(msg.sender);
-        uint256 totalSenderBalance =
-            IVentureBond(self.ventureBondAddress).tappableBalance(tokenId).add(
-                walletBalance
-            );
-        uint256 bondVotingPower =
-            IVentureBond(self.ventureBondAddress).votingPower(tokenId);
+        uint256 tappableBalance = ventureBond.tappableBalance(tokenId);
+        uint256 bondVotingPower = ventureBond.votingPower(tokenId);
 
         uint256 refundableBalance =
-            LaunchUtils.min(totalSenderBalance, bondVotingPower);
-        uint256 amountDue =
-            self.stable.balanceOf(address(this)).mul(refundableBalance).div(
-                self.totalVotingPower
-            );
-        uint256 tappableBalance =
-            IVentureBond(self.ventureBondAddress).tappableBalance(tokenId);
-        
-        if (totalSenderBalance > bondVotingPower) {
-            self.TOKEN.safeTransferFrom(
-                msg.sender,
-                address(this),
-                refundableBalance.sub(tappableBalance)
-            );
-            self.refundableTokens = self.refundableTokens.add(refundableBalance);
-        } else {
-            self.TOKEN.safeTransferFrom(
-                msg.sender,
-                address(this),
-                walletBalance
-            );
-            self.refundableTokens = self.refundableTokens.add(refundableBalance);
-        }
+            LaunchUtils.min(tappableBalance.add(walletBalance), bondVotingPower);
+        amountDue = refundableBalance.mul(self.refundPerUnit).div(1e18);
+        tokensReturned = refundableBalance.sub(tappableBalance);
 
-        self.totalVotingPower.sub(refundableBalance);
-        IVentureBond(self.ventureBondAddress).updateVotingPower(
+        self.refundableTokens = self.refundableTokens.add(refundableBalance);
+        self.totalVotingPower = self.totalVotingPower.sub(refundableBalance);
+        ventureBond.updateVotingPower(
             tokenId,
             bondVotingPower - refundableBalance,
-            msg.sender
+            sender
         );
         if (tappableBalance != 0) {
-            IVentureBond(self.ventureBondAddress).updateTappableBalance(
-                tokenId,
-                0,
-                msg.sender
-            );
+            ventureBond.updateTappableBalance(tokenId, 0, sender);
         }
 
-        self.stable.safeTransfer(msg.sender, amountDue);
         LaunchLogger(self.polylaunchSystem).logRefundClaimed(
             address(this),
-            msg.sender,
+            sender,
             amountDue,
             tokenId
         );
-        return amountDue;
+    }
+
+    /**
+     * @notice Collects the returned tokens from the sender and pays out their refund
+     * @param self Data struct associated with the launch
+     * @param sender the address being refunded
+     * @param amountDue the stable owed to the sender
+     * @param tokensReturned the launch tokens to be collected from the sender's wallet
+     */
+    function _settleRefund(
+        LaunchUtils.Data storage self,
+        address sender,
+        uint256 amountDue,
+        uint256 tokensReturned
+    ) private {
+        self.tokenBalance = self.tokenBalance.add(tokensReturned);
+        self.stableBalance = self.stableBalance.sub(amountDue);
+        if (tokensReturned != 0) {
+            self.TOKEN.safeTransferFrom(sender, address(this), tokensReturned);
+        }
+        self.stable.safeTransfer(sender, amountDue);
     }
 
     /**
@@ -123,7 +173,7 @@ library LaunchGovernance {
     function increaseTap(LaunchUtils.Data storage self, uint256 newRate)
         public
     {
-        LaunchRedemption.launcherTap(self);
+        LaunchRedemption.launcherTap(self, msg.sender);
 
         LaunchLogger(self.polylaunchSystem).logTapIncreased(
             address(this),
@@ -136,18 +186,18 @@ library LaunchGovernance {
     /**
      * @notice allows the launcher to claim back any refunded tokens
      * @param self Data struct associated with the launch
+     * @param sender the original caller, the launcher
      */
-    function launcherClaimRefund(LaunchUtils.Data storage self) internal {
+    function launcherClaimRefund(LaunchUtils.Data storage self, address sender)
+        internal
+    {
         require(
             self.isRefundMode == true,
             "claimRefund: Launch is not in refund mode"
         );
         uint256 redeemable = self.refundableTokens;
         self.refundableTokens = 0;
-        self.TOKEN.safeTransferFrom(
-                address(this),
-                msg.sender,
-                redeemable
-        );
+        self.tokenBalance = self.tokenBalance.sub(redeemable);
+        self.TOKEN.safeTransfer(sender, redeemable);
     }
 }
@@ -6,8 +6,37 @@ contract LaunchLogger {
       Every state transition should fire a log
       That log should have ALL necessary info for off-chain actors
       Everyone should be able to ENTIRELY rely on log messages
+
+    Schema versions:
+      1 - only the launch address (and the tapper/account where present) is indexed
+      2 - the supporter, tokenId, launchId and vaultId of an event are indexed as well, so deposits by a wallet,
+          the history of a bond or the launches of a vault can be filtered by the node with eth_getLogs.
+          Governor proposal and vote events index the proposal id, proposer, voter and bond.
+      3 - BasicLaunchCreated carries the sha2-256 digest of the launch details as bytes32 instead of an ipfs
+          hash string
+      Indexing a parameter does not change the event signature, indexers must check the version
+      before decoding.
     */
 
+    // version of the event schema emitted by the system and the governors it creates
+    uint256 public constant LOG_SCHEMA_VERSION = 3;
+
+    // ===== LaunchUtils =====
+
+    event LaunchFinalized(
+        address indexed launchAddress,
+        bool successful,
+        uint256 launcherTapRate
+    );
+
+    function logLaunchFinalized(
+        address launchAddress,
+        bool successful,
+        uint256 launcherTapRate
+    ) external {
+        emit LaunchFinalized(launchAddress, successful, launcherTapRate);
+    }
+
     // ===== LaunchRedemption =====
 
     event LauncherFundsTapped(
@@ -29,7 +58,7 @@ contract LaunchLogger {
     event SupporterFundsTapped(
         address indexed launchAddress,
         address indexed tapper,
-        uint256 tokenId,
+        uint256 indexed tokenId,
         uint256 amount,
         uint256 newTappableBalance
     );
@@ -70,9 +99,9 @@ contract LaunchLogger {
 
     event RefundClaimed(
         address indexed launchAddress,
-        address addr,
+        address indexed addr,
         uint256 amount,
-        uint256 tokenId
+        uint256 indexed tokenId
     );
 
     function logRefundClaimed(
@@ -123,23 +152,20 @@ contract LaunchLogger {
     event VaultFundsDeposited(
         address indexed launchAddress,
         uint256 amount,
-        uint256 vaultProvider,
-        uint256 vaultId
+        address vaultAdapter,
+        uint256 indexed vaultId
     );
 
     function logVaultFundsDeposited(
         address launchAddress,
         uint256 amount,
-        uint256 vaultProvider,
+        address vaultAdapter,
         uint256 vaultId
     ) external {
-        emit VaultFundsDeposited(launchAddress, amount, vaultProvider, vaultId);
+        emit VaultFundsDeposited(launchAddress, amount, vaultAdapter, vaultId);
     }
 
-    event VaultFundsTapped(
-        address indexed launchAddress,
-        uint256 indexed amount
-    );
+    event VaultFundsTapped(address indexed launchAddress, uint256 amount);
 
     function logVaultFundsTapped(address launchAddress, uint256 amount)
         external
@@ -147,6 +173,14 @@ contract LaunchLogger {
         emit VaultFundsTapped(launchAddress, amount);
     }
 
+    event VaultHarvested(address indexed launchAddress, uint256 amount);
+
+    function logVaultHarvested(address launchAddress, uint256 amount)
+        external
+    {
+        emit VaultHarvested(launchAddress, amount);
+    }
+
     event VaultExited(address indexed launchAddress);
 
     function logVaultExited(address launchAddress) external {
@@ -160,8 +194,8 @@ contract LaunchLogger {
         address ventureBondAddress,
         address marketAddress,
         address governorAddress,
-        uint256 launchId,
-        string ipfsHash
+        uint256 indexed launchId,
+        bytes32 ipfsHash
     );
 
     function logBasicLaunchCreated(
@@ -170,7 +204,7 @@ contract LaunchLogger {
         address _marketAddr,
         address _governorAddr,
         uint256 _launchId,
-        string calldata _ipfsHash
+        bytes32 _ipfsHash
     ) external {
         emit BasicLaunchCreated(
             _basicLaunchAddr,
@@ -186,7 +220,7 @@ contract LaunchLogger {
 
     event SupporterFundsDeposited(
         address indexed launchAddress,
-        address sender,
+        address indexed sender,
         uint256 amount
     );
 
@@ -27,23 +27,18 @@ library LaunchRedemption {
      * @notice function to allow a launcher to tap the DAI that they are entitled to. Changes the lastWithdrawnTime
      * in the contract
      * @param self Data struct associated with the launch
+     * @param sender the original caller, the launcher or the governor
      */
-    function launcherTap(LaunchUtils.Data storage self) internal {
-        if (block.timestamp > self.END && !self.launchSuccessful) {
-            if (self.totalFunding > self.MINIMUM_FUNDING) {
-                self.launchSuccessful = true;
-                self.launcherTapRate = self.totalFunding.div(self.launcherVestingPeriod);
-            }
-        }
+    function launcherTap(LaunchUtils.Data storage self, address sender)
+        internal
+    {
+        self.finalize();
         require(
             self.launchSuccessful,
             "The minimum amount was not raised or the launch has not finished"
         );
         if (self.yieldActivated) {
-            address vaultRegistry =
-                ILaunchFactory(self.launchFactory).getVaultRegistryAddress();
             IPolyVault(address(this))._launcherYieldTap(
-                vaultRegistry,
                 self.launcherTapRate,
                 self.stable,
                 self.fundRecipient,
@@ -54,11 +49,12 @@ library LaunchRedemption {
             uint256 withdrawable = LaunchUtils.getLauncherWithdrawableFunds(self);
             require(withdrawable > 0, "There are no funds to withdraw");
             self.lastWithdrawn = block.timestamp;
+            self.stableBalance = self.stableBalance.sub(withdrawable);
             self.stable.safeTransfer(self.fundRecipient, withdrawable);
 
             LaunchLogger(self.polylaunchSystem).logLauncherFundsTapped(
                 address(this),
-                msg.sender,
+                sender,
                 self.fundRecipient,
                 withdrawable
             );
@@ -71,18 +67,21 @@ library LaunchRedemption {
      * and lastWithdrawnTime of the NFT provided
      * @param self Data struct associated with the launch
      * @param tokenId tokenId that the caller owns
+     * @param sender the original caller, must own the venture bond
      */
-    function supporterTap(LaunchUtils.Data storage self, uint256 tokenId)
-        internal
-    {
+    function supporterTap(
+        LaunchUtils.Data storage self,
+        uint256 tokenId,
+        address sender
+    ) internal {
         require(self.launchSuccessful, "Launch Unsuccessful.");
         require(
-            IERC721(self.ventureBondAddress).ownerOf(tokenId) == msg.sender,
+            IERC721(self.ventureBondAddress).ownerOf(tokenId) == sender,
             "Not your ventureBond"
         );
 
         require(
-            IVentureBond(self.ventureBondAddress).launchAddressAssociatedWithToken(tokenId) == address(this),
+            LaunchUtils.isLaunchBond(self, tokenId),
             "supporterTap: ventureBond not associated with this launch"
         );
 
@@ -96,23 +95,24 @@ library LaunchRedemption {
         IVentureBond(self.ventureBondAddress).updateLastWithdrawnTime(
             tokenId,
             block.timestamp,
-            msg.sender
+            sender
         );
         IVentureBond(self.ventureBondAddress).updateTappableBalance(
             tokenId,
             newTappableBalance,
-            msg.sender
+            sender
         );
         //dealing with wei rounding errors for the last withdrawer
-        uint256 tokenBalance_ = self.TOKEN.balanceOf(address(this));
+        uint256 tokenBalance_ = self.tokenBalance;
         if ( tokenBalance_ < withdrawable){
             withdrawable = tokenBalance_;
         }
-        self.TOKEN.safeTransfer(msg.sender, withdrawable);
+        self.tokenBalance = tokenBalance_ - withdrawable;
+        self.TOKEN.safeTransfer(sender, withdrawable);
 
         LaunchLogger(self.polylaunchSystem).logSupporterFundsTapped(
             address(this),
-            msg.sender,
+            sender,
             tokenId,
             withdrawable,
             newTappableBalance
@@ -122,18 +122,24 @@ library LaunchRedemption {
     /**
      * @notice Launcher can withdraw the tokens sent to the contract upon an unsuccessful launch
      * @param self Data struct associated with the launch
+     * @param sender the original caller, the launcher
      */
-    function withdrawTokenAfterFailedLaunch(LaunchUtils.Data storage self)
-        internal
-    {
+    function withdrawTokenAfterFailedLaunch(
+        LaunchUtils.Data storage self,
+        address sender
+    ) internal {
         require(self.END < block.timestamp, "Launch not ended");
+        self.finalize();
         require(
-            self.totalFunding < self.MINIMUM_FUNDING,
+            !self.launchSuccessful,
             "Launch successful"
         );
+        uint256 tokenBalance_ = self.tokenBalance;
+        self.tokenBalance = 0;
+        self.unsoldTokens = 0;
         self.TOKEN.safeTransfer(
-            msg.sender,
-            self.TOKEN.balanceOf(address(this))
+            sender,
+            tokenBalance_
         );
         LaunchLogger(self.polylaunchSystem).logTokensWithdrawnAfterFailedLaunch(
             address(this)
@@ -143,16 +149,19 @@ library LaunchRedemption {
     /**
      * @notice Launcher can withdraw the tokens sent to the contract that were not sold during the window
      * @param self Data struct associated with the launch
+     * @param sender the original caller, the launcher
      */
-    function withdrawUnsoldTokens(LaunchUtils.Data storage self)
+    function withdrawUnsoldTokens(LaunchUtils.Data storage self, address sender)
         internal
     {
         require(self.END < block.timestamp, "The offering must be completed");
-        uint256 soldTokens = (self.totalFunding.mul(self.FIXED_SWAP_RATE)).div(1e18);
-        require(soldTokens < self.TOTAL_TOKENS_FOR_SALE, "All tokens sold");
-        uint256 unsoldTokens = self.TOTAL_TOKENS_FOR_SALE.sub(soldTokens);
+        self.finalize();
+        uint256 unsoldTokens = self.unsoldTokens;
+        require(unsoldTokens > 0, "All tokens sold");
+        self.unsoldTokens = 0;
+        self.tokenBalance = self.tokenBalance.sub(unsoldTokens);
         self.TOKEN.safeTransfer(
-            msg.sender,
+            sender,
             unsoldTokens
         );
         LaunchLogger(self.polylaunchSystem).logUnsoldTokensWithdrawn(
@@ -166,36 +175,36 @@ library LaunchRedemption {
      * retrieve their DAI after a failed launch
      * @param self Data struct associated with the launch
      * @param register Register struct associated with the launch
+     * @param sender the original caller, the supporter
      */
     function claim(
         LaunchUtils.Data storage self,
-        PreLaunchRegistry.Register storage register
+        PreLaunchRegistry.Register storage register,
+        address sender
     ) internal {
         require(
             block.timestamp > self.END,
             "The offering has not finished"
         );
+        PreLaunchRegistry.Supporter storage supporter =
+            register.supporters[sender];
+        uint256 userProvided = supporter.provided;
         require(
-            self.provided[msg.sender] > 0,
+            userProvided > 0,
             "msg.sender not eligible"
         );
 
-        if (block.timestamp > self.END && !self.launchSuccessful) {
-            if (self.totalFunding > self.MINIMUM_FUNDING) {
-                self.launchSuccessful = true;
-                self.launcherTapRate = self.totalFunding.div(self.launcherVestingPeriod);
-            }
-        }
+        self.finalize();
 
+        supporter.provided = 0;
         if (self.launchSuccessful) {
-            _claimVentureBond(self, register);
+            _claimVentureBond(self, register, sender, userProvided, supporter.index);
         } else {
-            uint256 userProvided = self.provided[msg.sender];
-            self.provided[msg.sender] = 0;
-            self.stable.safeTransfer(msg.sender, userProvided);
+            self.stableBalance = self.stableBalance.sub(userProvided);
+            self.stable.safeTransfer(sender, userProvided);
             LaunchLogger(self.polylaunchSystem).logFundsWithdrawn(
                 address(this),
-                msg.sender,
+                sender,
                 userProvided
             );
         }
@@ -203,26 +212,29 @@ library LaunchRedemption {
 
 
     /**
-     * @notice Mints a Venture Bond token for the msg.sender, the tokenURI and metadataURI will need to be fixed later on
+     * @notice Mints a Venture Bond token for the sender, the tokenURI and metadataURI will need to be fixed later on
      * @param self Data struct associated with the launch
      * @param register Register struct associated with the launch
+     * @param sender the supporter the venture bond is minted for
+     * @param userProvided the amount (DAI) the supporter provided to the launch
+     * @param i the index of the supporter in the register
      */
     function _claimVentureBond(
         LaunchUtils.Data storage self,
-        PreLaunchRegistry.Register storage register
+        PreLaunchRegistry.Register storage register,
+        address sender,
+        uint256 userProvided,
+        uint256 i
     ) private {
-        uint256 userProvided = self.provided[msg.sender];
-        
         uint256 tokenAmount =
             (userProvided.mul(self.FIXED_SWAP_RATE)).div(1e18);
         self.totalVotingPower += tokenAmount;
         uint256 tapRate = tokenAmount.div(self.supporterVestingPeriod);
-        uint256 i = register.supporterIndex[msg.sender];
         IVentureBond.MediaData memory _nftData = register.nftData[i];
         // if the token launcher hasnt assigned data to this nft then mint a basic one with just the important data
         if (_nftData.metadataHash == 0) {
             _nftData = IVentureBond.MediaData({
-                tokenURI: self.genericNftData.tokenURI,
+                tokenURIDigest: self.genericNftData.tokenURIDigest,
                 metadataHash: self.genericNftData.metadataHash
             });
         }
@@ -233,9 +245,8 @@ library LaunchRedemption {
                 tappableBalance: tokenAmount,
                 votingPower: tokenAmount
             });
-        delete self.provided[msg.sender];
         delete register.nftData[i];
         register.isIndexMinted[i] = true;
-        IVentureBond(self.ventureBondAddress).mint(msg.sender, _nftData, vbParams);
+        IVentureBond(self.ventureBondAddress).mint(sender, _nftData, vbParams);
     }
 }
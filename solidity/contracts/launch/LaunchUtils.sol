@@ -7,6 +7,8 @@ import "@openzeppelin/contracts/math/SafeMath.sol";
 import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
 
 import "../../interfaces/IVentureBond.sol";
+import {VentureBondIds} from "../venture-bond/VentureBondIds.sol";
+import {LaunchLogger} from "./LaunchLogger.sol";
 
 /**
  * @author PolyLaunch Protocol
@@ -49,8 +51,6 @@ library LaunchUtils {
         uint256 supporterVestingPeriod;
         // launcher who will receive stable funds
         address fundRecipient;
-        // mapping to hold the amount an address has provided to the launch in DAI
-        mapping(address => uint256) provided;
         // total funding a launch has received
         uint256 totalFunding;
         // the last time a launcher tapped their funds
@@ -61,6 +61,8 @@ library LaunchUtils {
         address launchFactory;
         // whether the launch was successful
         bool launchSuccessful;
+        // whether the launch outcome and settlement values have been computed, packed with launchSuccessful
+        bool finalized;
         // Venture Bond address associated with the launch
         address ventureBondAddress;
         // Market address associated with the launch
@@ -77,10 +79,49 @@ library LaunchUtils {
         bool isRefundMode;
         // number of refundable tokens a launcher can withdraw
         uint256 refundableTokens;
+        // stable refunded per unit of voting power (1e18 precision), snapshotted when refund mode is initiated
+        uint256 refundPerUnit;
         // polylaunch system address
         address polylaunchSystem;
         // hash storing launch details such as name, logo, description
-        string ipfsHash;
+        bytes32 ipfsHash;
+        // stable (DAI) held by the launch, tracked internally so payouts ignore stray transfers
+        uint256 stableBalance;
+        // launch tokens held by the launch, tracked internally so payouts ignore stray transfers
+        uint256 tokenBalance;
+        // tokens sold during the launch, set on finalisation
+        uint256 soldTokens;
+        // tokens left unsold that the launcher can still withdraw, set on finalisation
+        uint256 unsoldTokens;
+    }
+
+    /**
+     * @notice settle the outcome of the launch once it has ended, caching the values the claim and tap paths
+     * depend on, and log LaunchFinalized. Does nothing before the end of the launch or if the launch is already
+     * finalized.
+     * @param self Data struct associated with the launch
+     */
+    function finalize(Data storage self) internal {
+        if (self.finalized || block.timestamp <= self.END) {
+            return;
+        }
+        self.finalized = true;
+        if (self.totalFunding > self.MINIMUM_FUNDING) {
+            self.launchSuccessful = true;
+            self.launcherTapRate = self.totalFunding.div(self.launcherVestingPeriod);
+            uint256 soldTokens = (self.totalFunding.mul(self.FIXED_SWAP_RATE)).div(1e18);
+            self.soldTokens = soldTokens;
+            if (soldTokens < self.TOTAL_TOKENS_FOR_SALE) {
+                self.unsoldTokens = self.TOTAL_TOKENS_FOR_SALE - soldTokens;
+            }
+        } else {
+            self.unsoldTokens = self.TOTAL_TOKENS_FOR_SALE;
+        }
+        LaunchLogger(self.polylaunchSystem).logLaunchFinalized(
+            address(this),
+            self.launchSuccessful,
+            self.launcherTapRate
+        );
     }
 
     /**
@@ -94,17 +135,46 @@ library LaunchUtils {
         view
         returns (uint256)
     {
-        if (!self.launchSuccessful) {
+        return launcherTapDue(self, self.stableBalance, self.lastWithdrawn);
+    }
+
+    /**
+     * @notice Get the stable the launcher could tap, without requiring the launch to be finalized first
+     * @param self Data struct associated with the launch
+     * @param available the stable left to the launcher, held by the launch or in its vault
+     * @param since the last time the launcher tapped
+     * @return the stable due to the launcher, zero if the launch was not successful or is in refund mode
+     */
+    function launcherTapDue(
+        Data storage self,
+        uint256 available,
+        uint256 since
+    ) internal view returns (uint256) {
+        uint256 rate = self.launcherTapRate;
+        if (!self.finalized) {
+            if (block.timestamp <= self.END || self.totalFunding <= self.MINIMUM_FUNDING) {
+                return 0;
+            }
+            rate = self.totalFunding.div(self.launcherVestingPeriod);
+        } else if (!self.launchSuccessful || self.isRefundMode) {
             return 0;
         }
-        uint256 stableBalance = self.stable.balanceOf(address(this));
-        uint256 withdrawable =
-            self.launcherTapRate.mul(block.timestamp.sub(self.lastWithdrawn));
+        uint256 withdrawable = rate.mul(block.timestamp.sub(since));
+        return withdrawable < available ? withdrawable : available;
+    }
 
-        if (stableBalance < withdrawable) {
-            withdrawable = stableBalance;
-        }
-        return withdrawable;
+    /**
+     * @notice Check that a VentureBond was minted by the launch, using the launchId encoded in the bond id
+     * @param self Data struct associated with the launch
+     * @param tokenId the bond to be checked
+     * @return true if the bond belongs to the launch
+     */
+    function isLaunchBond(Data storage self, uint256 tokenId)
+        internal
+        view
+        returns (bool)
+    {
+        return VentureBondIds.launchIdOf(tokenId) == self.launchId;
     }
 
     /**
@@ -149,20 +219,6 @@ library LaunchUtils {
         return self.totalFunding;
     }
 
-    /**
-     * @notice return the funds provided by an address
-     * @param self Data struct associated with the launch
-     * @param addr the address to be checked
-     * @return the funds (DAI) provided by the address
-     */
-    function fundsProvidedByAddress(Data storage self, address addr)
-        internal
-        view
-        returns (uint256)
-    {
-        return self.provided[addr];
-    }
-
     /**
      * @notice return the start time of the launch
      * @param self Data struct associated with the launch
@@ -33,17 +33,12 @@ library LaunchVault {
             "LaunchVault: Your funds are already in a vault pool"
         );
         require(!self.isRefundMode, "LaunchVault: The launch is in refund mode");
-        if (block.timestamp > self.END && !self.launchSuccessful) {
-            if (self.totalFunding > self.MINIMUM_FUNDING) {
-                self.launchSuccessful = true;
-                self.launcherTapRate = self.totalFunding.div(self.launcherVestingPeriod);
-            }
-        }
+        self.finalize();
         require(
             self.launchSuccessful,
             "LaunchVault: The launch was not successful or has not concluded"
         );
-        uint256 _startingBalance = self.stable.balanceOf(address(this));
+        uint256 _startingBalance = self.stableBalance;
         require(
             _startingBalance != 0,
             "LaunchVault: No funds to deposit into the Vault"
@@ -57,6 +52,7 @@ library LaunchVault {
             self.stable,
             self.polylaunchSystem
         );
+        self.stableBalance = 0;
         self.yieldActivated = true;
     }
 
@@ -66,10 +62,22 @@ library LaunchVault {
      */
     function exitFromVault(LaunchUtils.Data storage self) internal {
         require(self.yieldActivated, "LaunchVault: Yield has not been activated");
-        address vaultRegistry =
-            ILaunchFactory(self.launchFactory).getVaultRegistryAddress();
-        IPolyVault(address(this))._exitFromVault(vaultRegistry, self.stable, self.polylaunchSystem);
+        uint256 retained =
+            IPolyVault(address(this))._exitFromVault(self.stable, self.polylaunchSystem);
+        self.stableBalance = self.stableBalance.add(retained);
         self.yieldActivated = false;
     }
 
+    /**
+     * @notice send the system its share of the yield accrued in the PolyVault without exiting it
+     * @param self Data storage struct for the launch
+     * @return the amount of stable sent to the system, zero if the launch has no vault or nothing to harvest
+     */
+    function harvest(LaunchUtils.Data storage self) internal returns (uint256) {
+        if (!self.yieldActivated) {
+            return 0;
+        }
+        return IPolyVault(address(this))._harvest(self.stable, self.polylaunchSystem);
+    }
+
 }
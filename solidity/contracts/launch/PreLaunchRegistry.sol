@@ -3,19 +3,32 @@ pragma experimental ABIEncoderV2;
 
 import "../../interfaces/IVentureBond.sol";
 import {Counters} from "@openzeppelin/contracts/utils/Counters.sol";
+import "@openzeppelin/contracts/math/SafeMath.sol";
 
 library PreLaunchRegistry {
     using Counters for Counters.Counter;
+    using SafeMath for uint256;
+
+    // everything the launch tracks about a single supporter, packed into one storage slot
+    struct Supporter {
+        // whether the address is whitelisted
+        bool isWhiteListed;
+        // order of investment, used to look up the nft data of the supporter
+        uint32 index;
+        // the max amount this address may provide (DAI), zero means the launch wide individual cap applies
+        uint104 cap;
+        // the amount the address has provided to the launch (DAI)
+        uint112 provided;
+    }
+
     struct Register {
         // mapping to store the nft Data by index
         mapping(uint256 => IVentureBond.MediaData) nftData;
         // mapping to track whether a token has been minted or not
         mapping(uint256 => bool) isIndexMinted;
-        // mapping to track order of investment
-        mapping(address => uint256) supporterIndex;
-        // mapping to track whether an address is whitelisted
-        mapping(address => bool) isWhiteListed;
-        // counter to track latest supporterIndex
+        // mapping to hold the packed record of each supporter
+        mapping(address => Supporter) supporters;
+        // counter to track latest supporter index
         Counters.Counter supporterTracker;
     }
 
@@ -28,7 +41,7 @@ library PreLaunchRegistry {
             "VentureBondDataRegistry: metadata hash must be non-zero"
         );
         require(
-            bytes(_nftData.tokenURI).length != 0,
+            _nftData.tokenURIDigest != 0,
             "VentureBondDataRegistry: token URI must be non-empty"
         );
         _;
@@ -94,8 +107,92 @@ library PreLaunchRegistry {
         }
     }
 
+    /**
+     * @notice record a contribution from a supporter, checking the whitelist and the individual cap and assigning
+     * the supporter an index on their first contribution. The record is read and written back once.
+     * @param self Register struct associated with the launch
+     * @param supporter the address making the contribution
+     * @param amount the amount (DAI) being contributed
+     * @param defaultCap the launch wide individual funding cap, used when the supporter has no cap of their own
+     */
+    function recordContribution(
+        Register storage self,
+        address supporter,
+        uint256 amount,
+        uint256 defaultCap
+    ) internal {
+        Supporter memory record = self.supporters[supporter];
+        require(record.isWhiteListed, "msg.sender not whitelisted");
+        uint256 newProvided = uint256(record.provided).add(amount);
+        require(
+            newProvided <= (record.cap == 0 ? defaultCap : record.cap),
+            "You have reached the individual funding cap"
+        );
+        require(
+            newProvided <= type(uint112).max,
+            "PreLaunchRegistry: provided amount too large"
+        );
+        if (record.provided == 0) {
+            uint256 index = self.supporterTracker.current();
+            require(
+                index <= type(uint32).max,
+                "PreLaunchRegistry: too many supporters"
+            );
+            record.index = uint32(index);
+            self.supporterTracker.increment();
+        }
+        record.provided = uint112(newProvided);
+        self.supporters[supporter] = record;
+    }
+
+    /**
+     * @notice return the funds provided by an address
+     * @param self Register struct associated with the launch
+     * @param supporter the address to be checked
+     * @return the funds (DAI) provided by the address
+     */
+    function providedBy(Register storage self, address supporter)
+        internal
+        view
+        returns (uint256)
+    {
+        return self.supporters[supporter].provided;
+    }
+
+    /**
+     * @notice set a cap on the amount an address may provide, overriding the launch wide individual cap
+     * @param self Register struct associated with the launch
+     * @param _address the address to be capped
+     * @param _cap the max amount (DAI) the address may provide, zero restores the launch wide cap
+     */
+    function setIndividualCap(
+        Register storage self,
+        address _address,
+        uint256 _cap
+    ) internal {
+        require(
+            _cap <= type(uint104).max,
+            "PreLaunchRegistry: cap too large"
+        );
+        self.supporters[_address].cap = uint104(_cap);
+    }
+
+    function batchSetIndividualCaps(
+        Register storage self,
+        address[] memory _addresses,
+        uint256[] memory _caps
+    ) internal {
+        require(
+            _addresses.length == _caps.length,
+            "PreLaunchRegistry: Arrays must be the same length"
+        );
+        for (uint256 i = 0; i < _addresses.length; i++) {
+            setIndividualCap(self, _addresses[i], _caps[i]);
+        }
+    }
+
     function addToWhitelist(Register storage self, address _address) internal {
-        self.isWhiteListed[_address] = true;
+        self.supporters[_address].isWhiteListed = true;
     }
 
     function batchAddToWhitelist(Register storage self, address[] memory _addresses) internal {
@@ -105,6 +202,6 @@ library PreLaunchRegistry {
     }
 
     function removeFromWhitelist(Register storage self, address _address) internal {
-        self.isWhiteListed[_address] = false;
+        self.supporters[_address].isWhiteListed = false;
     }
 }
\ No newline at end of file
@@ -0,0 +1,196 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+pragma experimental ABIEncoderV2;
+
+import "../launch/BasicLaunch.sol";
+import "../launch/LaunchFactory.sol";
+import "../venture-bond/VentureBond.sol";
+
+/**
+ * @author PolyLaunch Protocol
+ * @title Polylaunch Lens
+ * @notice Stateless view contract that gathers the state of launches so clients can load them in one eth_call
+ */
+contract PolylaunchLens {
+    using SafeMath for uint256;
+
+    struct LaunchView {
+        uint256 launchId;
+        address launchAddress;
+        address launcher;
+        address governor;
+        address token;
+        address ventureBond;
+        address market;
+        uint256 startTime;
+        uint256 endTime;
+        uint256 softCap;
+        uint256 hardCap;
+        uint256 individualCap;
+        uint256 salePrice;
+        uint256 tokensForSale;
+        uint256 totalFundsProvided;
+        uint256 stableBalance;
+        uint256 tokenBalance;
+        uint256 launcherTapRate;
+        uint256 launcherVestingPeriod;
+        uint256 supporterVestingPeriod;
+        uint256 totalVotingPower;
+        bool finalized;
+        bool successful;
+        bool vaultActivated;
+        uint256 vaultId;
+        uint256 vaultRemainingBalance;
+        bytes32 ipfsHash;
+    }
+
+    struct BondView {
+        uint256 tokenId;
+        address launchAddress;
+        uint256 launchId;
+        address token;
+        uint256 tapRate;
+        uint256 lastWithdrawnTime;
+        uint256 tappableBalance;
+        uint256 votingPower;
+        // tokens the owner could tap now, as computed by LaunchUtils.getSupporterWithdrawableFunds
+        uint256 withdrawable;
+        bool successful;
+    }
+
+    /**
+     * @notice View function to return the state of a launch
+     * @param launch the launch to be read
+     * @return v the state of the launch
+     */
+    function getLaunch(BasicLaunch launch)
+        public
+        view
+        returns (LaunchView memory v)
+    {
+        v.launchId = launch.launchId();
+        v.launchAddress = address(launch);
+        v.launcher = launch.launcher();
+        v.governor = launch.governor();
+        v.token = address(launch.tokenForLaunch());
+        v.ventureBond = launch.launchVentureBondAddress();
+        v.market = launch.launchMarketAddress();
+        v.startTime = launch.launchStartTime();
+        v.endTime = launch.launchEndTime();
+        v.softCap = launch.softCap();
+        v.hardCap = launch.hardCap();
+        v.individualCap = launch.individualCap();
+        v.salePrice = launch.salePrice();
+        v.tokensForSale = launch.tokensForSale();
+        v.totalFundsProvided = launch.totalFundsProvided();
+        v.stableBalance = launch.stableBalance();
+        v.tokenBalance = launch.tokenBalance();
+        v.launcherTapRate = launch.launcherTapRate();
+        v.launcherVestingPeriod = launch.launcherVestingPeriod();
+        v.supporterVestingPeriod = launch.supporterVestingPeriod();
+        v.totalVotingPower = launch.totalVotingPower();
+        (v.finalized, v.successful) = launch.launchOutcome();
+        v.vaultActivated = launch.activated();
+        v.vaultId = launch.selectedVaultId();
+        v.vaultRemainingBalance = launch.remainingBalance();
+        v.ipfsHash = launch.ipfsHash();
+    }
+
+    /**
+     * @notice View function to return the state of a page of launches, in launchId order
+     * @param factory the factory the launches were created by
+     * @param start the first launchId of the page
+     * @param count the maximum number of launches to return
+     * @return views the state of each launch, shorter than count if the page runs past the last launch
+     */
+    function getLaunches(
+        LaunchFactory factory,
+        uint256 start,
+        uint256 count
+    ) external view returns (LaunchView[] memory views) {
+        LaunchFactory.LaunchRecord[] memory records =
+            factory.getLaunchRecords(start, count);
+        views = new LaunchView[](records.length);
+        for (uint256 i = 0; i < records.length; i++) {
+            views[i] = getLaunch(BasicLaunch(payable(records[i].launch)));
+        }
+    }
+
+    /**
+     * @notice View function to return the state of a list of launches
+     * @param launches the launches to be read
+     * @return views the state of each launch, in the order provided
+     */
+    function getLaunchesByAddress(BasicLaunch[] calldata launches)
+        external
+        view
+        returns (LaunchView[] memory views)
+    {
+        views = new LaunchView[](launches.length);
+        for (uint256 i = 0; i < launches.length; i++) {
+            views[i] = getLaunch(launches[i]);
+        }
+    }
+
+    /**
+     * @notice View function to return a VentureBond with its live withdrawable amount and launch details
+     * @param ventureBond the VentureBond contract
+     * @param tokenId the bond to be read
+     * @return v the state of the bond
+     */
+    function getBond(VentureBond ventureBond, uint256 tokenId)
+        public
+        view
+        returns (BondView memory v)
+    {
+        BasicLaunch launch =
+            BasicLaunch(
+                payable(ventureBond.launchAddressAssociatedWithToken(tokenId))
+            );
+        v.tokenId = tokenId;
+        v.launchAddress = address(launch);
+        v.launchId = launch.launchId();
+        v.token = address(launch.tokenForLaunch());
+        v.tapRate = ventureBond.tapRate(tokenId);
+        v.lastWithdrawnTime = ventureBond.lastWithdrawnTime(tokenId);
+        v.tappableBalance = ventureBond.tappableBalance(tokenId);
+        v.votingPower = ventureBond.votingPower(tokenId);
+        (, v.successful) = launch.launchOutcome();
+        if (v.successful) {
+            v.withdrawable = v.tapRate.mul(
+                block.timestamp.sub(v.lastWithdrawnTime)
+            );
+            if (v.tappableBalance < v.withdrawable) {
+                v.withdrawable = v.tappableBalance;
+            }
+        }
+    }
+
+    /**
+     * @notice View function to return a page of the VentureBonds held by an owner
+     * @param ventureBond the VentureBond contract
+     * @param owner the holder of the bonds
+     * @param start the index of the first bond of the page in the owner's token list
+     * @param count the maximum number of bonds to return
+     * @return views the state of each bond and total the number of bonds held by the owner
+     */
+    function getBondsOfOwner(
+        VentureBond ventureBond,
+        address owner,
+        uint256 start,
+        uint256 count
+    ) external view returns (BondView[] memory views, uint256 total) {
+        total = ventureBond.balanceOf(owner);
+        if (start >= total) {
+            return (views, total);
+        }
+        uint256 end = total - start > count ? start + count : total;
+        views = new BondView[](end - start);
+        for (uint256 i = start; i < end; i++) {
+            views[i - start] = getBond(
+                ventureBond,
+                ventureBond.tokenOfOwnerByIndex(owner, i)
+            );
+        }
+    }
+}
@@ -0,0 +1,194 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+pragma experimental ABIEncoderV2;
+
+import "@openzeppelin/contracts/drafts/EIP712.sol";
+
+/**
+ * @author PolyLaunch Protocol
+ * @title Polylaunch Forwarder
+ * @notice EIP-2771 forwarder trusted by launches, venture bonds and governors. A relayer submits requests
+ * signed by users (e.g. sendStable, claim, supporterTap, claimRefund, castVote) either one at a time or in batches.
+ */
+contract PolylaunchForwarder is EIP712 {
+    struct ForwardRequest {
+        // signer of the request, appended to the calldata forwarded to the target
+        address from;
+        // contract being called
+        address to;
+        // wei sent along with the call, the forwarder holds no ether so any request with a value fails
+        uint256 value;
+        // gas forwarded to the call
+        uint256 gas;
+        // nonce of the signer, must match the current nonce
+        uint256 nonce;
+        // calldata of the call
+        bytes data;
+    }
+
+    bytes32 private constant _TYPEHASH =
+        keccak256(
+            "ForwardRequest(address from,address to,uint256 value,uint256 gas,uint256 nonce,bytes data)"
+        );
+
+    // mapping to track the next valid nonce of a signer
+    mapping(address => uint256) private _nonces;
+
+    event RequestExecuted(
+        address indexed from,
+        address indexed to,
+        uint256 nonce,
+        bool success
+    );
+
+    constructor() EIP712("PolylaunchForwarder", "0.0.1") {}
+
+    /**
+     * @notice View function to return the next valid nonce of a signer
+     * @param from signer to be checked
+     * @return the next valid nonce
+     */
+    function getNonce(address from) public view returns (uint256) {
+        return _nonces[from];
+    }
+
+    /**
+     * @notice View function to return the EIP712 domain separator requests are signed against
+     * @return the domain separator of the forwarder
+     */
+    function domainSeparator() external view returns (bytes32) {
+        return _domainSeparatorV4();
+    }
+
+    /**
+     * @notice check that a request is signed by its sender and carries the sender's current nonce
+     * @param req the request to be checked
+     * @param signature EIP712 signature of the request
+     * @return true if the request can be executed, false rather than a revert for a malformed signature
+     */
+    function verify(ForwardRequest calldata req, bytes calldata signature)
+        public
+        view
+        returns (bool)
+    {
+        address signer =
+            _recover(
+                _hashTypedDataV4(
+                    keccak256(
+                        abi.encode(
+                            _TYPEHASH,
+                            req.from,
+                            req.to,
+                            req.value,
+                            req.gas,
+                            req.nonce,
+                            keccak256(req.data)
+                        )
+                    )
+                ),
+                signature
+            );
+        return
+            _nonces[req.from] == req.nonce &&
+            signer != address(0) &&
+            signer == req.from;
+    }
+
+    /**
+     * @notice execute a single signed request
+     * @param req the request to be executed
+     * @param signature EIP712 signature of the request
+     * @return success whether the call succeeded and returndata the data returned by the call
+     */
+    function execute(ForwardRequest calldata req, bytes calldata signature)
+        external
+        returns (bool success, bytes memory returndata)
+    {
+        require(
+            verify(req, signature),
+            "PolylaunchForwarder: signature does not match request"
+        );
+        return _execute(req);
+    }
+
+    /**
+     * @notice execute a batch of signed requests in one transaction
+     * @param reqs list of requests to be executed
+     * @param signatures list of EIP712 signatures, the signature and its request in reqs must correspond
+     * @return successes whether each request was executed successfully
+     * @dev requests that fail verification or revert are skipped rather than reverting the whole batch
+     */
+    function batchExecute(
+        ForwardRequest[] calldata reqs,
+        bytes[] calldata signatures
+    ) external returns (bool[] memory successes) {
+        require(
+            reqs.length == signatures.length,
+            "PolylaunchForwarder: Arrays must be the same length"
+        );
+        successes = new bool[](reqs.length);
+        for (uint256 i = 0; i < reqs.length; i++) {
+            if (verify(reqs[i], signatures[i])) {
+                (successes[i], ) = _execute(reqs[i]);
+            }
+        }
+    }
+
+    /**
+     * @notice recover the signer of a digest with the checks of ECDSA.recover, returning the zero address instead of
+     * reverting so a malformed signature cannot revert a whole batch
+     * @param digest the EIP712 digest of the request
+     * @param signature 65 byte signature of the digest
+     * @return the signer, or the zero address if the signature is malformed or invalid
+     */
+    function _recover(bytes32 digest, bytes memory signature)
+        private
+        pure
+        returns (address)
+    {
+        if (signature.length != 65) {
+            return address(0);
+        }
+        bytes32 r;
+        bytes32 s;
+        uint8 v;
+        // solhint-disable-next-line no-inline-assembly
+        assembly {
+            r := mload(add(signature, 0x20))
+            s := mload(add(signature, 0x40))
+            v := byte(0, mload(add(signature, 0x60)))
+        }
+        // reject malleable signatures, see ECDSA.recover
+        if (
+            uint256(s) >
+            0x7FFFFFFFFFFFFFFFFFFFFFFFFFFFFFFF5D576E7357A4501DDFE92F46681B20A0 ||
+            (v != 27 && v != 28)
+        ) {
+            return address(0);
+        }
+        return ecrecover(digest, v, r, s);
+    }
+
+    /**
+     * @notice consume the nonce of the request and call the target with the signer appended to the calldata
+     * @param req the request to be executed
+     */
+    function _execute(ForwardRequest calldata req)
+        private
+        returns (bool success, bytes memory returndata)
+    {
+        _nonces[req.from] = req.nonce + 1;
+
+        // solhint-disable-next-line avoid-low-level-calls
+        (success, returndata) = req.to.call{gas: req.gas, value: req.value}(
+            abi.encodePacked(req.data, req.from)
+        );
+        // make sure the relayer provided enough gas for the call, see https://ronan.eth.link/blog/ethereum-gas-dangers/
+        require(
+            gasleft() > req.gas / 63,
+            "PolylaunchForwarder: insufficient gas for request"
+        );
+
+        emit RequestExecuted(req.from, req.to, req.nonce, success);
+    }
+}
@@ -0,0 +1,62 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/utils/Context.sol";
+
+/**
+ * @author PolyLaunch Protocol
+ * @title Relay Recipient
+ * @notice EIP-2771 recipient, allows a trusted forwarder to relay calls on behalf of the original sender.
+ * When a call comes through the trusted forwarder the original sender is read from the last 20 bytes of calldata.
+ * @dev the forwarder is kept in storage rather than as an immutable so that it can be set on clones during init
+ */
+abstract contract RelayRecipient is Context {
+    // address of the forwarder that is trusted to append the original sender to calldata
+    address private _trustedForwarder;
+
+    /**
+     * @notice View function to return the trusted forwarder
+     * @return address of the trusted forwarder
+     */
+    function trustedForwarder() public view returns (address) {
+        return _trustedForwarder;
+    }
+
+    /**
+     * @notice check whether an address is the trusted forwarder
+     * @param forwarder address to be checked
+     * @return true if the address is the trusted forwarder
+     */
+    function isTrustedForwarder(address forwarder) public view returns (bool) {
+        return forwarder != address(0) && forwarder == _trustedForwarder;
+    }
+
+    /**
+     * @notice set the trusted forwarder
+     * @param forwarder address of the forwarder to trust
+     */
+    function _setTrustedForwarder(address forwarder) internal {
+        _trustedForwarder = forwarder;
+    }
+
+    /**
+     * @notice return the original sender of the call, unwrapping calls relayed through the trusted forwarder
+     * @return sender the original sender of the call
+     */
+    function _msgSender()
+        internal
+        view
+        virtual
+        override
+        returns (address payable sender)
+    {
+        if (msg.data.length >= 20 && isTrustedForwarder(msg.sender)) {
+            // solhint-disable-next-line no-inline-assembly
+            assembly {
+                sender := shr(96, calldataload(sub(calldatasize(), 20)))
+            }
+        } else {
+            sender = msg.sender;
+        }
+    }
+}
@@ -0,0 +1,270 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
+import "@openzeppelin/contracts/math/SafeMath.sol";
+import "@openzeppelin/contracts/math/Math.sol";
+import "@openzeppelin/contracts/utils/ReentrancyGuard.sol";
+import "../../interfaces/IPolyVaultAdapter.sol";
+import "../system/PolylaunchSystemAuthority.sol";
+import "../proxy/CloneFactory.sol";
+
+/**
+ * @title PolyPool, a yield vault shared by every launch that selects it
+ * @notice Launches deposit stable for internal shares instead of opening their own position with a protocol.
+ * Deposits sit in a liquid reserve and taps are paid from it, the pool only mints and redeems against the
+ * underlying vault when it is rebalanced, so one protocol interaction is shared by many launches.
+ * The pool is registered in the PolyVaultRegistry like any other vault, with the PooledVaultAdapter, and holds its
+ * own position in the underlying vault through a clone of the underlying vault's adapter.
+ * @author Polylaunch Protocol
+ */
+contract PolyPool is PolylaunchSystemAuthority, ReentrancyGuard, CloneFactory {
+    using SafeMath for uint256;
+    using SafeERC20 for IERC20;
+
+    // denominator of the reserve ratio
+    uint256 private constant RATIO_BASE = 10000;
+
+    // virtual shares, backed by as many virtual wei of stable, added to the totals when pricing shares. A donation
+    // to the pool's position mostly accrues to them, so inflating the share price costs far more than the rounding
+    // it can take from later depositors
+    uint256 private constant VIRTUAL_SHARES = 1e6;
+
+    // shortfall of a redemption tolerated as rounding by the underlying vault, in wei of stable
+    uint256 private constant REDEMPTION_TOLERANCE = 100;
+
+    // the stablecoin held by the pool
+    IERC20 public stable;
+
+    // the vault/pool contract the pool invests in
+    address public underlyingVault;
+
+    // the clone of the underlying vault's adapter holding the pool's position, see polyvault/adapters
+    address public underlyingAdapter;
+
+    // share of total assets kept liquid in the pool, out of RATIO_BASE
+    uint256 public reserveRatio;
+
+    // liquid stable held by the pool, tracked internally so stray transfers do not change the share price
+    uint256 public reserve;
+
+    // total shares issued by the pool
+    uint256 public totalShares;
+
+    // shares held by each depositor
+    mapping(address => uint256) public sharesOf;
+
+    event PoolDeposit(address indexed account, uint256 amount, uint256 shares);
+    event PoolWithdrawal(
+        address indexed account,
+        address recipient,
+        uint256 amount,
+        uint256 shares
+    );
+    event PoolRebalanced(uint256 invested, uint256 divested, uint256 reserve);
+
+    constructor(
+        address polylaunchSystemAddress,
+        IERC20 _stable,
+        address _underlyingVault,
+        address _underlyingAdapter,
+        uint256 _reserveRatio
+    ) PolylaunchSystemAuthority(polylaunchSystemAddress) {
+        require(
+            _reserveRatio <= RATIO_BASE,
+            "PolyPool: reserve ratio too high"
+        );
+        stable = _stable;
+        underlyingVault = _underlyingVault;
+        underlyingAdapter = createClone(_underlyingAdapter);
+        IPolyVaultAdapter(underlyingAdapter).initialize(address(this));
+        reserveRatio = _reserveRatio;
+    }
+
+    /**
+     * @notice View function to return the value of the pool's position in the underlying vault
+     * @return the invested balance of the pool
+     */
+    function investedBalance() public view returns (uint256) {
+        return
+            IPolyVaultAdapter(underlyingAdapter).balanceOf(
+                underlyingVault,
+                stable,
+                underlyingAdapter
+            );
+    }
+
+    /**
+     * @notice View function to return the total stable value of the pool
+     * @return the reserve plus the invested balance
+     */
+    function totalAssets() public view returns (uint256) {
+        return reserve.add(investedBalance());
+    }
+
+    /**
+     * @notice View function to return the stable value of an account's shares
+     * @param account the depositor to be checked
+     * @return the stable value of the account's shares
+     */
+    function balanceOfUnderlying(address account)
+        external
+        view
+        returns (uint256)
+    {
+        return
+            sharesOf[account].mul(totalAssets().add(VIRTUAL_SHARES)).div(
+                totalShares.add(VIRTUAL_SHARES)
+            );
+    }
+
+    /**
+     * @notice deposit stable into the reserve in exchange for shares
+     * @param amount the amount of stable to deposit
+     * @return shares the number of shares issued
+     */
+    function deposit(uint256 amount)
+        external
+        nonReentrant
+        returns (uint256 shares)
+    {
+        shares = amount.mul(totalShares.add(VIRTUAL_SHARES)).div(
+            totalAssets().add(VIRTUAL_SHARES)
+        );
+        require(shares > 0, "PolyPool: deposit too small");
+        totalShares = totalShares.add(shares);
+        sharesOf[msg.sender] = sharesOf[msg.sender].add(shares);
+        reserve = reserve.add(amount);
+        stable.safeTransferFrom(msg.sender, address(this), amount);
+        emit PoolDeposit(msg.sender, amount, shares);
+    }
+
+    /**
+     * @notice withdraw an amount of stable, burning the shares it is worth
+     * @param amount the amount of stable to withdraw
+     * @param recipient the address the stable is sent to
+     * @return the amount of stable sent to the recipient
+     */
+    function withdraw(uint256 amount, address recipient)
+        external
+        nonReentrant
+        returns (uint256)
+    {
+        uint256 assets = totalAssets().add(VIRTUAL_SHARES);
+        // round the shares burnt up so a withdrawal never takes value from other depositors
+        uint256 shares =
+            amount.mul(totalShares.add(VIRTUAL_SHARES)).add(assets - 1).div(
+                assets
+            );
+        return _redeem(shares, amount, recipient);
+    }
+
+    /**
+     * @notice redeem every share held by the caller
+     * @return the amount of stable sent to the caller
+     */
+    function exit() external nonReentrant returns (uint256) {
+        uint256 shares = sharesOf[msg.sender];
+        return
+            _redeem(
+                shares,
+                shares.mul(totalAssets().add(VIRTUAL_SHARES)).div(
+                    totalShares.add(VIRTUAL_SHARES)
+                ),
+                msg.sender
+            );
+    }
+
+    /**
+     * @notice move the reserve back to its target by investing the surplus or divesting the shortfall in one
+     * interaction with the underlying vault
+     */
+    function rebalance() external nonReentrant {
+        uint256 reserve_ = reserve;
+        uint256 target = totalAssets().mul(reserveRatio).div(RATIO_BASE);
+        uint256 invested;
+        uint256 divested;
+        if (reserve_ > target) {
+            invested = reserve_ - target;
+            reserve = target;
+            stable.safeApprove(underlyingAdapter, invested);
+            IPolyVaultAdapter(underlyingAdapter).activate(
+                underlyingVault,
+                stable,
+                invested
+            );
+        } else if (reserve_ < target) {
+            divested = _divest(target - reserve_);
+        }
+        emit PoolRebalanced(invested, divested, reserve);
+    }
+
+    /**
+     * @notice sets the share of total assets kept liquid in the pool
+     * @param _reserveRatio the new reserve ratio, out of 10000
+     */
+    function setReserveRatio(uint256 _reserveRatio) external onlySystem {
+        require(
+            _reserveRatio <= RATIO_BASE,
+            "PolyPool: reserve ratio too high"
+        );
+        reserveRatio = _reserveRatio;
+    }
+
+    /**
+     * @notice burn shares and pay out stable from the reserve, divesting only the shortfall if the reserve is short.
+     * Reverts if the underlying vault cannot return the shortfall, rather than paying less for the shares burnt
+     * @param shares the shares to burn
+     * @param amount the amount of stable owed
+     * @param recipient the address the stable is sent to
+     * @return the amount of stable sent to the recipient
+     */
+    function _redeem(
+        uint256 shares,
+        uint256 amount,
+        address recipient
+    ) private returns (uint256) {
+        require(
+            shares <= sharesOf[msg.sender],
+            "PolyPool: insufficient shares"
+        );
+        sharesOf[msg.sender] -= shares;
+        totalShares = totalShares.sub(shares);
+
+        if (reserve < amount) {
+            _divest(amount - reserve);
+            require(
+                reserve.add(REDEMPTION_TOLERANCE) >= amount,
+                "PolyPool: insufficient liquidity"
+            );
+            // protocols may round a redemption down by a few wei
+            amount = Math.min(amount, reserve);
+        }
+        reserve = reserve - amount;
+        stable.safeTransfer(recipient, amount);
+        emit PoolWithdrawal(msg.sender, recipient, amount, shares);
+        return amount;
+    }
+
+    /**
+     * @notice withdraw stable from the underlying vault into the reserve
+     * @param amount the amount of stable wanted
+     * @return received the amount of stable received
+     */
+    function _divest(uint256 amount) private returns (uint256 received) {
+        amount = Math.min(amount, investedBalance());
+        if (amount == 0) {
+            return 0;
+        }
+        uint256 balance = stable.balanceOf(address(this));
+        IPolyVaultAdapter(underlyingAdapter).withdraw(
+            underlyingVault,
+            stable,
+            amount,
+            address(this)
+        );
+        received = stable.balanceOf(address(this)).sub(balance);
+        reserve = reserve.add(received);
+    }
+}
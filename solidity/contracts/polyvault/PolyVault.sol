@@ -4,39 +4,46 @@ pragma experimental ABIEncoderV2;
 import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
 import "@openzeppelin/contracts/math/SafeMath.sol";
-import "../../interfaces/ICErc20.sol";
-import "../../interfaces/IVault.sol";
-import "../../interfaces/ILendingPool.sol";
+import "../../interfaces/IPolyVaultAdapter.sol";
 import "../../interfaces/IPolyVaultRegistry.sol";
 import {LaunchLogger} from "../launch/LaunchLogger.sol";
+import "../proxy/CloneFactory.sol";
 import "../system/PolylaunchConstants.sol";
 
 /**
  * @title PolyVault associated with a particular Polylaunch contract,
  *        logic for interacting with interest bearing protocols is handled here.
+ * @notice The position in a vault is held by a clone of its registered adapter created on deposit and owned by the
+ *         launch, the adapter can only move the stable approved to it on deposit.
  * @author Polylaunch Protocol
  */
 
-contract PolyVault{
+contract PolyVault is CloneFactory {
     using SafeMath for uint256;
     using SafeERC20 for IERC20;
 
+    // the contract address of the vault selected by the launcher, cached on deposit
+    address public selectedVaultAddress;
+
     // the id of the current vault selected by the launcher
     // (refer to VaultRegistry to view the information for the vault id)
-    uint256 public selectedVaultId;
-
-    // the id of the current vault provider selected by the launcher
-    uint256 public selectedVaultProvider;
+    uint64 public selectedVaultId;
 
     // whether the vault has been activated by the launcher
     bool public activated;
 
+    // the clone of the selected vault's adapter holding the launch's position, created on deposit
+    address public selectedVaultAdapter;
+
     // the last time the launcher tapped from the vault.
     uint256 public lastWithdrawn;
 
     // the remaining balance in stable available to the launcher
     uint256 public remainingBalance;
 
+    // yield already harvested on behalf of the launch, left in the vault until exit
+    uint256 public retainedYield;
+
     /**
      * @notice modifier to check that configured launch is making a call
      */
@@ -48,7 +55,8 @@ contract PolyVault{
         _;
     }
     /**
-     * @notice deposit function to place funds into a vault/pool
+     * @notice deposit function to place funds into a vault/pool through a new clone of the vault's adapter, caching
+     * the vault address and the clone so later taps and exits do not need to query the registry
      * @param _vaultRegistry the address of the registry that the PolyVault will get information from
      * @param _vaultId the unique identifier of the vault the launcher would like to deposit funds to
      * @param _startingBalance the balance being deposited into the PolyVault
@@ -62,148 +70,86 @@ contract PolyVault{
         IERC20 _stable,
         address _system
     ) external onlySelf {
-        IPolyVaultRegistry vaultRegistry = IPolyVaultRegistry(_vaultRegistry);
-        IPolyVaultRegistry.Vault memory selectedVault =
-            vaultRegistry.getRegisteredVault(_vaultId);
         require(
-            selectedVault.vaultActive,
+            !activated,
+            "PolyVault: Your funds are already in a vault"
+        );
+        (address _vaultAddress, address _vaultAdapter, bool _vaultActive) =
+            IPolyVaultRegistry(_vaultRegistry).getVaultDescriptor(_vaultId);
+        require(
+            _vaultActive,
             "Vault: The selected vaultId is inactive"
         );
-        uint256 _vaultProvider = selectedVault.vaultProvider;
-        if (_vaultProvider == 1) {
-            _activateCompound(_stable, _startingBalance, selectedVault);
-        } else if (_vaultProvider == 2) {
-            _activateYearnVault(_stable, _startingBalance, selectedVault);
-        } else if (_vaultProvider == 3) {
-            _activateAave(_stable, _startingBalance, selectedVault);
-        }
-        selectedVaultId = _vaultId;
-        selectedVaultProvider = _vaultProvider;
+        address _position = createClone(_vaultAdapter);
+        IPolyVaultAdapter(_position).initialize(address(this));
+        _stable.safeApprove(_position, _startingBalance);
+        IPolyVaultAdapter(_position).activate(
+            _vaultAddress,
+            _stable,
+            _startingBalance
+        );
+        selectedVaultAddress = _vaultAddress;
+        selectedVaultId = uint64(_vaultId);
+        activated = true;
+        selectedVaultAdapter = _position;
         remainingBalance = _startingBalance;
         lastWithdrawn = block.timestamp;
-        activated = true;
         LaunchLogger(_system).logVaultFundsDeposited(
             address(this),
             _startingBalance,
-            _vaultProvider,
+            _vaultAdapter,
             _vaultId
         );
     }
 
     /**
      * @notice exit from the PolyVault and remove funds from any interest bearing protocols
-     * @param _vaultRegistry the address of the registry that the PolyVault will get information from
      * @param _stable the IERC20 interface of the stablecoin being used
      * @param _system the address of the factory that will receive a portion of the interest generated by the funds
+     * @return the amount of stable redeemed from the vault that was kept by the launch
      * @dev only callable from the launch contract
      */
     function _exitFromVault(
-        address _vaultRegistry,
         IERC20 _stable,
         address _system
-    ) external onlySelf {
+    ) external onlySelf returns (uint256) {
         require(activated, "PolyVault: Your funds are not currently staked");
-        IPolyVaultRegistry.Vault memory selectedVault =
-            IPolyVaultRegistry(_vaultRegistry).getRegisteredVault(selectedVaultId);
-
-        if (selectedVault.vaultProvider == 1) {
-            ICErc20 compoundContract =
-                ICErc20(selectedVault.vaultContractAddress);
-            uint256 compoundBalance = compoundContract.balanceOf(address(this));
-            compoundContract.redeem(compoundBalance);
-        }
-        if (selectedVault.vaultProvider == 2) {
-            uint256 sharePrice =
-                IVault(selectedVault.vaultContractAddress).pricePerShare();
-            uint256 redeemResult =
-                IVault(selectedVault.vaultContractAddress).withdraw();
-        }
-        if (selectedVault.vaultProvider == 3) {
-            ILendingPool(selectedVault.vaultContractAddress).withdraw(address(_stable), type(uint256).max, address(this));
-        }
-        uint256 newBalance = _stable.balanceOf(address(this));
+        uint256 startingBalance = _stable.balanceOf(address(this));
+        IPolyVaultAdapter(selectedVaultAdapter).exit(
+            selectedVaultAddress,
+            _stable
+        );
+        uint256 redeemed = _stable.balanceOf(address(this)).sub(startingBalance);
+        uint256 owed = remainingBalance.add(retainedYield);
+        delete selectedVaultAddress;
+        delete selectedVaultId;
+        delete selectedVaultAdapter;
+        delete retainedYield;
         activated = false;
-        selectedVaultId = 0;
-        selectedVaultProvider = 0;
-        if (newBalance > remainingBalance) {
-            uint256 excess = (newBalance.sub(remainingBalance)).div(PolylaunchConstants.getExcess());
+        if (redeemed > owed) {
+            uint256 excess = (redeemed.sub(owed)).div(PolylaunchConstants.getExcess());
             _stable.safeTransfer(_system, excess);
+            redeemed = redeemed.sub(excess);
         }
         LaunchLogger(_system).logVaultExited(
             address(this)
         );
+        return redeemed;
     }
 
     /**
      * @notice function to allow a launcher to tap their funds from the vault
-     * @param _vaultRegistry the address of the registry that the PolyVault will get information from
      * @param _stableTapRate the wei/sec value that will be used to calculate the tappable funds.
      * @param _stable the IERC20 interface of the stablecoin being used
      * @param _fundRecipient the address to send the tapped funds to
-     * @dev only callable from the launch contract
+     * @dev only callable from the launch contract, uses the vault and adapter cached on deposit
      */
     function _launcherYieldTap(
-        address _vaultRegistry,
         uint256 _stableTapRate,
         IERC20 _stable,
         address _fundRecipient,
         address _system
     ) external onlySelf {
-        IPolyVaultRegistry.Vault memory selectedVault =
-            IPolyVaultRegistry(_vaultRegistry).getRegisteredVault(selectedVaultId);
-        if (selectedVaultProvider == 1) {
-            _tapCompound(selectedVault, _stableTapRate, _stable, _fundRecipient, _system);
-        } else if (selectedVaultProvider == 2) {
-            _tapYearn(selectedVault, _stableTapRate, _stable, _fundRecipient, _system);
-        } else if (selectedVaultProvider == 3) {
-            _tapAave(selectedVault, _stableTapRate, _stable, _fundRecipient, _system);
-        }
-    }
-
-    ///
-    /// COMPOUND FUNCTIONS
-    ///
-
-    /**
-     * @notice function to allow PolyVault to deposit funds to Compound protocol
-     * @param _stable the IERC20 interface of the stablecoin being used
-     * @param _stableBalance the amount of _stable to deposit
-     * @param _vault struct containing the vault data for a vault id, pulled from VaultRegistry
-     * @dev only callable from the PolyVault
-     */
-    function _activateCompound(
-        IERC20 _stable,
-        uint256 _stableBalance,
-        IPolyVaultRegistry.Vault memory _vault
-    ) internal {
-        require(
-            !activated,
-            "PolyVault: Your funds are already in a Compound pool"
-        );
-        // Approve transfer on the ERC20 contract
-        _stable.approve(_vault.vaultContractAddress, _stableBalance);
-        activated = true;
-        // Mint cTokens
-        uint256 mintResult =
-            ICErc20(_vault.vaultContractAddress).mint(_stableBalance);
-        require(mintResult == 0, "mintResult error");
-    }
-
-    /**
-     * @notice function to allow PolyVault to tap the funds for the launcher from the Compound Protocol.
-     * @param _vault struct containing the vault data for a vault id, pulled from VaultRegistry
-     * @param _stableTapRate the wei/sec value associated with the launch to be used to calculate the tappable balance
-     * @param _stable the IERC20 interface of the stablecoin being used
-     * @param _fundRecipient the address where the tapped funds should be sent to
-     * @dev only callable from the PolyVault
-     */
-    function _tapCompound(
-        IPolyVaultRegistry.Vault memory _vault,
-        uint256 _stableTapRate,
-        IERC20 _stable,
-        address _fundRecipient,
-        address _system
-    ) internal {
         require(activated, "PolyVault: Yield has not been activated");
         uint256 withdrawable =
             _stableTapRate.mul(block.timestamp.sub(lastWithdrawn));
@@ -213,136 +159,65 @@ contract PolyVault{
         remainingBalance = remainingBalance.sub(withdrawable);
         lastWithdrawn = block.timestamp;
 
-        // Retrieve your asset based on an amount of the asset
-        uint256 redeemResult =
-            ICErc20(_vault.vaultContractAddress).redeemUnderlying(withdrawable);
-        require(redeemResult == 0, "redeemResult error");
-        _stable.safeTransfer(_fundRecipient, withdrawable);
+        uint256 tapped =
+            IPolyVaultAdapter(selectedVaultAdapter).withdraw(
+                selectedVaultAddress,
+                _stable,
+                withdrawable,
+                _fundRecipient
+            );
         LaunchLogger(_system).logVaultFundsTapped(
             address(this),
-            withdrawable
+            tapped
         );
     }
 
-    ///
-    /// YEARN V2 FUNCTIONS
-    ///
-
     /**
-     * @notice function to allow PolyVault to deposit funds to Yearn Vaults v2
+     * @notice send the system its share of the yield accrued since deposit or the last harvest, the share
+     * kept by the launch is recorded in retainedYield so it is not charged again on exit
      * @param _stable the IERC20 interface of the stablecoin being used
-     * @param _stableBalance the amount of _stable to deposit
-     * @param _vault struct containing the vault data for a vault id, pulled from VaultRegistry
-     * @dev only callable from the PolyVault
-     */
-    function _activateYearnVault(
-        IERC20 _stable,
-        uint256 _stableBalance,
-        IPolyVaultRegistry.Vault memory _vault
-    ) internal {
-        require(
-            !activated,
-            "PolyVault: Your funds are already in a Yearn vault"
-        );
-        // Approve transfer on the ERC20 contract
-        _stable.approve(_vault.vaultContractAddress, _stableBalance);
-        activated = true;
-        // Deposit to yVault v2
-        IVault(_vault.vaultContractAddress).deposit(_stableBalance);
-    }
-
-    /**
-     * @notice function to allow PolyVault to tap the funds for the launcher from Yearn Vaults v2.
-     * @param _vault struct containing the vault data for a vault id, pulled from VaultRegistry
-     * @param _stableTapRate the wei/sec value associated with the launch to be used to calculate the tappable balance
-     * @param _stable the IERC20 interface of the stablecoin being used
-     * @param _fundRecipient the address where the tapped funds should be sent to
-     * @dev only callable from the PolyVault, rounding errors exist during the share price calculation
+     * @param _system the address of the system that receives its share of the yield
+     * @return the amount of stable sent to the system
+     * @dev only callable from the launch contract
      */
-    function _tapYearn(
-        IPolyVaultRegistry.Vault memory _vault,
-        uint256 _stableTapRate,
-        IERC20 _stable,
-        address _fundRecipient,
-        address _system
-    ) internal {
-        require(activated, "PolyVault: Yield has not been activated");
-        uint256 withdrawable =
-            _stableTapRate.mul(block.timestamp.sub(lastWithdrawn));
-        if (remainingBalance < withdrawable) {
-            withdrawable = remainingBalance;
+    function _harvest(IERC20 _stable, address _system)
+        external
+        onlySelf
+        returns (uint256)
+    {
+        uint256 excess = _harvestableYield(_stable);
+        uint256 share = excess.div(PolylaunchConstants.getExcess());
+        if (share == 0) {
+            return 0;
         }
-        uint256 sharePrice =
-            IVault(_vault.vaultContractAddress).pricePerShare();
-        uint256 withdrawableShares = (withdrawable.mul(1e18)).div(sharePrice);
-        lastWithdrawn = block.timestamp;
-        // Retrieve your asset based on the amount of shares
-        uint256 redeemed =
-            IVault(_vault.vaultContractAddress).withdraw(withdrawableShares);
-        remainingBalance = remainingBalance.sub(withdrawable);
-        _stable.safeTransfer(_fundRecipient, redeemed);
-        LaunchLogger(_system).logVaultFundsTapped(
-            address(this),
-            redeemed
-        );
+        retainedYield = retainedYield.add(excess.sub(share));
+        uint256 harvested =
+            IPolyVaultAdapter(selectedVaultAdapter).withdraw(
+                selectedVaultAddress,
+                _stable,
+                share,
+                _system
+            );
+        LaunchLogger(_system).logVaultHarvested(address(this), harvested);
+        return harvested;
     }
 
-    ///
-    /// AAVE FUNCTIONS
-    ///
-
     /**
-     * @notice function to allow PolyVault to deposit funds to AAVE Lending pools
+     * @notice yield accrued in the vault that has not yet been harvested
      * @param _stable the IERC20 interface of the stablecoin being used
-     * @param _stableBalance the amount of _stable to deposit
-     * @param _vault struct containing the vault data for a vault id, pulled from VaultRegistry
-     * @dev only callable from the PolyVault
+     * @return the unharvested yield in stable, zero if the vault is not activated
      */
-    function _activateAave(
-        IERC20 _stable,
-        uint256 _stableBalance,
-        IPolyVaultRegistry.Vault memory _vault
-    ) internal {
-        require(
-            !activated,
-            "PolyVault: Your funds are already in an Aave pool"
-        );
-        // Approve transfer on the ERC20 contract
-        _stable.approve(_vault.vaultContractAddress, _stableBalance);
-        activated = true;
-        // Mint Aave
-        ILendingPool(_vault.vaultContractAddress).deposit(address(_stable), _stableBalance, address(this), 0);
-    }
-
-    /**
-     * @notice function to allow PolyVault to tap the funds for the launcher from the Aave Protocol.
-     * @param _vault struct containing the vault data for a vault id, pulled from VaultRegistry
-     * @param _stableTapRate the wei/sec value associated with the launch to be used to calculate the tappable balance
-     * @param _stable the IERC20 interface of the stablecoin being used
-     * @param _fundRecipient the address where the tapped funds should be sent to
-     * @dev only callable from the PolyVault
-     */
-    function _tapAave(
-        IPolyVaultRegistry.Vault memory _vault,
-        uint256 _stableTapRate,
-        IERC20 _stable,
-        address _fundRecipient,
-        address _system
-    ) internal {
-        require(activated, "PolyVault: Yield has not been activated");
-        uint256 withdrawable =
-            _stableTapRate.mul(block.timestamp.sub(lastWithdrawn));
-        if (remainingBalance < withdrawable) {
-            withdrawable = remainingBalance;
+    function _harvestableYield(IERC20 _stable) internal view returns (uint256) {
+        if (!activated) {
+            return 0;
         }
-        remainingBalance = remainingBalance.sub(withdrawable);
-        lastWithdrawn = block.timestamp;
-
-        // Retrieve your asset based on an amount of the asset
-        ILendingPool(_vault.vaultContractAddress).withdraw(address(_stable), withdrawable, _fundRecipient);
-        LaunchLogger(_system).logVaultFundsTapped(
-            address(this),
-            withdrawable
-        );
+        uint256 value =
+            IPolyVaultAdapter(selectedVaultAdapter).balanceOf(
+                selectedVaultAddress,
+                _stable,
+                selectedVaultAdapter
+            );
+        uint256 owed = remainingBalance.add(retainedYield);
+        return value > owed ? value - owed : 0;
     }
 }
@@ -22,13 +22,12 @@ contract PolyVaultRegistry is PolylaunchSystemAuthority, IPolyVaultRegistry {
     /// Struct reference
     ///
 
-    //    // vaultProvider 1 is compound
-    //    // vaultProvider 2 is yearn vaults
+    //    // vaultAdapter is the IPolyVaultAdapter contract used to talk to the vault, e.g. CompoundAdapter
     //    struct Vault {
     //        uint256 vaultId;
     //        address vaultContractAddress;
     //        string vaultDesignation;
-    //        uint256 vaultProvider;
+    //        address vaultAdapter;
     //        bool vaultActive;
     //    }
 
@@ -41,7 +40,8 @@ contract PolyVaultRegistry is PolylaunchSystemAuthority, IPolyVaultRegistry {
     event NewVaultRegistered(
         uint256 indexed vaultId,
         address vaultContractAddress,
-        string vaultDesignation
+        string vaultDesignation,
+        address vaultAdapter
     );
     event VaultRemoved(
         uint256 indexed vaultId,
@@ -57,14 +57,20 @@ contract PolyVaultRegistry is PolylaunchSystemAuthority, IPolyVaultRegistry {
      * @notice Register a new vault for use with PolyVault
      * @param _vaultContractAddress contract address for the specific interest bearing vault/pool
      * @param _vaultDesignation string definition of the vault/pool (for UX)
-     * @param _vaultProvider the id of protocol that is providing the interest bearing vault/pool
+     * @param _vaultAdapter the adapter contract cloned by every launch depositing into the vault/pool, the clone holds
+     * the launch's position. An adapter is trusted with the stable deposited through it, which it can move at will,
+     * but it runs in its own storage and cannot touch the rest of a launch's funds or state
      * @dev only the System can call this function
      */
     function registerNewVault(
         address _vaultContractAddress,
         string calldata _vaultDesignation,
-        uint256 _vaultProvider
+        address _vaultAdapter
     ) external onlySystem {
+        require(
+            _vaultAdapter != address(0),
+            "VaultRegistry: The vault adapter cannot be the zero address"
+        );
         vaultIdTracker.increment();
         uint256 _vaultId = vaultIdTracker.current();
         IPolyVaultRegistry.Vault memory _vault =
@@ -72,7 +78,7 @@ contract PolyVaultRegistry is PolylaunchSystemAuthority, IPolyVaultRegistry {
                 vaultId: _vaultId,
                 vaultContractAddress: _vaultContractAddress,
                 vaultDesignation: _vaultDesignation,
-                vaultProvider: _vaultProvider,
+                vaultAdapter: _vaultAdapter,
                 vaultActive: true
             });
 
@@ -80,7 +86,8 @@ contract PolyVaultRegistry is PolylaunchSystemAuthority, IPolyVaultRegistry {
         emit NewVaultRegistered(
             _vaultId,
             _vaultContractAddress,
-            _vaultDesignation
+            _vaultDesignation,
+            _vaultAdapter
         );
     }
 
@@ -98,6 +105,30 @@ contract PolyVaultRegistry is PolylaunchSystemAuthority, IPolyVaultRegistry {
         return registeredVaults[_vaultId];
     }
 
+    /*
+     * @notice Get the fields of a registered vault needed to deposit into it, without copying the designation string
+     * @param _vaultId the unique identifier for the vault to be viewed
+     * @return vaultContractAddress the vault/pool contract, vaultAdapter the adapter used to interact with it
+     * and vaultActive whether the vault can still be deposited into
+     */
+    function getVaultDescriptor(uint256 _vaultId)
+        external
+        view
+        override
+        returns (
+            address vaultContractAddress,
+            address vaultAdapter,
+            bool vaultActive
+        )
+    {
+        IPolyVaultRegistry.Vault storage _vault = registeredVaults[_vaultId];
+        return (
+            _vault.vaultContractAddress,
+            _vault.vaultAdapter,
+            _vault.vaultActive
+        );
+    }
+
     /*
      * @notice Remove a registered vault
      * @param _vaultId the unique identifier for the vault to be removed
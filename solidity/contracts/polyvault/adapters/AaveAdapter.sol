@@ -0,0 +1,78 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+pragma experimental ABIEncoderV2;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
+import "../../../interfaces/ILendingPool.sol";
+import "./PolyVaultAdapter.sol";
+
+/**
+ * @title PolyVault adapter for Aave lending pools
+ * @author Polylaunch Protocol
+ * @dev cloned for every launch or PolyPool using the vault, see PolyVaultAdapter
+ */
+contract AaveAdapter is PolyVaultAdapter {
+    using SafeERC20 for IERC20;
+
+    /**
+     * @notice deposit the stable approved by the owner into the Aave lending pool, the adapter receives aTokens
+     * @param vault the Aave lending pool
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param amount the amount of stable to deposit
+     */
+    function activate(
+        address vault,
+        IERC20 stable,
+        uint256 amount
+    ) external override onlyOwner {
+        stable.safeTransferFrom(owner, address(this), amount);
+        stable.approve(vault, amount);
+        ILendingPool(vault).deposit(address(stable), amount, address(this), 0);
+    }
+
+    /**
+     * @notice withdraw an amount of stable from the lending pool straight to the recipient
+     * @param vault the Aave lending pool
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param amount the amount of stable to withdraw
+     * @param recipient the address the withdrawn stable is sent to
+     * @return the amount of stable sent to the recipient
+     */
+    function withdraw(
+        address vault,
+        IERC20 stable,
+        uint256 amount,
+        address recipient
+    ) external override onlyOwner returns (uint256) {
+        return ILendingPool(vault).withdraw(address(stable), amount, recipient);
+    }
+
+    /**
+     * @notice withdraw the full aToken balance of the adapter to the owner
+     * @param vault the Aave lending pool
+     * @param stable the IERC20 interface of the stablecoin being used
+     */
+    function exit(address vault, IERC20 stable) external override onlyOwner {
+        ILendingPool(vault).withdraw(address(stable), type(uint256).max, owner);
+    }
+
+    /**
+     * @notice value in stable of the aTokens held by an account, aTokens track the underlying 1:1
+     * @param vault the Aave lending pool
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param account the holder of the aTokens
+     * @return the stable value of the position
+     */
+    function balanceOf(
+        address vault,
+        IERC20 stable,
+        address account
+    ) external view override returns (uint256) {
+        return
+            IERC20(
+                ILendingPool(vault).getReserveData(address(stable)).aTokenAddress
+            )
+                .balanceOf(account);
+    }
+}
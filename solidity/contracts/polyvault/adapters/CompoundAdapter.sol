@@ -0,0 +1,83 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
+import "@openzeppelin/contracts/math/SafeMath.sol";
+import "../../../interfaces/ICErc20.sol";
+import "./PolyVaultAdapter.sol";
+
+/**
+ * @title PolyVault adapter for Compound cTokens
+ * @author Polylaunch Protocol
+ * @dev cloned for every launch or PolyPool using the vault, see PolyVaultAdapter
+ */
+contract CompoundAdapter is PolyVaultAdapter {
+    using SafeERC20 for IERC20;
+    using SafeMath for uint256;
+
+    /**
+     * @notice deposit the stable approved by the owner into Compound, minting cTokens to the adapter
+     * @param vault the cToken contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param amount the amount of stable to deposit
+     */
+    function activate(
+        address vault,
+        IERC20 stable,
+        uint256 amount
+    ) external override onlyOwner {
+        stable.safeTransferFrom(owner, address(this), amount);
+        stable.approve(vault, amount);
+        uint256 mintResult = ICErc20(vault).mint(amount);
+        require(mintResult == 0, "mintResult error");
+    }
+
+    /**
+     * @notice redeem an amount of stable from Compound and send it to the recipient
+     * @param vault the cToken contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param amount the amount of stable to redeem
+     * @param recipient the address the redeemed stable is sent to
+     * @return the amount of stable sent to the recipient
+     */
+    function withdraw(
+        address vault,
+        IERC20 stable,
+        uint256 amount,
+        address recipient
+    ) external override onlyOwner returns (uint256) {
+        uint256 redeemResult = ICErc20(vault).redeemUnderlying(amount);
+        require(redeemResult == 0, "redeemResult error");
+        stable.safeTransfer(recipient, amount);
+        return amount;
+    }
+
+    /**
+     * @notice redeem every cToken held by the adapter and send the stable to the owner
+     * @param vault the cToken contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     */
+    function exit(address vault, IERC20 stable) external override onlyOwner {
+        uint256 redeemResult = ICErc20(vault).redeem(ICErc20(vault).balanceOf(address(this)));
+        require(redeemResult == 0, "redeemResult error");
+        stable.safeTransfer(owner, stable.balanceOf(address(this)));
+    }
+
+    /**
+     * @notice value in stable of the cTokens held by an account, using the last stored exchange rate
+     * @param vault the cToken contract
+     * @param account the holder of the cTokens
+     * @return the stable value of the position
+     */
+    function balanceOf(
+        address vault,
+        IERC20,
+        address account
+    ) external view override returns (uint256) {
+        return
+            ICErc20(vault).balanceOf(account).mul(
+                ICErc20(vault).exchangeRateStored()
+            ) / 1e18;
+    }
+}
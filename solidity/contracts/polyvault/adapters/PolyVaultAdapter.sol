@@ -0,0 +1,33 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "../../../interfaces/IPolyVaultAdapter.sol";
+
+/**
+ * @title Base of the PolyVault provider adapters
+ * @notice The adapter registered for a vault is never called directly. Every launch or PolyPool depositing into the
+ * vault clones it, and the clone holds the position of its owner. Adapters run in their own storage and can only move
+ * the stable their owner approves them for on activate, never the rest of the owner's funds.
+ * @author Polylaunch Protocol
+ */
+abstract contract PolyVaultAdapter is IPolyVaultAdapter {
+    // the launch or PolyPool the position is held for
+    address public owner;
+
+    /**
+     * @notice modifier to check that the owner of the position is making a call
+     */
+    modifier onlyOwner() {
+        require(msg.sender == owner, "PolyVaultAdapter: Caller must be owner");
+        _;
+    }
+
+    /**
+     * @notice set the owner of a freshly cloned adapter
+     * @param _owner the launch or PolyPool the position is held for
+     */
+    function initialize(address _owner) external override {
+        require(owner == address(0), "PolyVaultAdapter: Already initialized");
+        owner = _owner;
+    }
+}
@@ -0,0 +1,71 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "../PolyPool.sol";
+import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
+import "./PolyVaultAdapter.sol";
+
+/**
+ * @title PolyVault adapter for the shared PolyPool
+ * @author Polylaunch Protocol
+ * @dev cloned for every launch or PolyPool using the vault, see PolyVaultAdapter
+ */
+contract PooledVaultAdapter is PolyVaultAdapter {
+    using SafeERC20 for IERC20;
+
+    /**
+     * @notice deposit the stable approved by the owner into the pool in exchange for shares held by the adapter
+     * @param vault the PolyPool contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param amount the amount of stable to deposit
+     */
+    function activate(
+        address vault,
+        IERC20 stable,
+        uint256 amount
+    ) external override onlyOwner {
+        stable.safeTransferFrom(owner, address(this), amount);
+        stable.approve(vault, amount);
+        PolyPool(vault).deposit(amount);
+    }
+
+    /**
+     * @notice withdraw an amount of stable from the pool reserve straight to the recipient
+     * @param vault the PolyPool contract
+     * @param amount the amount of stable to withdraw
+     * @param recipient the address the withdrawn stable is sent to
+     * @return the amount of stable sent to the recipient
+     */
+    function withdraw(
+        address vault,
+        IERC20,
+        uint256 amount,
+        address recipient
+    ) external override onlyOwner returns (uint256) {
+        return PolyPool(vault).withdraw(amount, recipient);
+    }
+
+    /**
+     * @notice redeem every share held by the adapter and send the stable to the owner
+     * @param vault the PolyPool contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     */
+    function exit(address vault, IERC20 stable) external override onlyOwner {
+        stable.safeTransfer(owner, PolyPool(vault).exit());
+    }
+
+    /**
+     * @notice value in stable of the pool shares held by an account
+     * @param vault the PolyPool contract
+     * @param account the holder of the shares
+     * @return the stable value of the position
+     */
+    function balanceOf(
+        address vault,
+        IERC20,
+        address account
+    ) external view override returns (uint256) {
+        return PolyPool(vault).balanceOfUnderlying(account);
+    }
+}
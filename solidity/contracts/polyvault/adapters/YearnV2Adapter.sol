@@ -0,0 +1,81 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
+import "@openzeppelin/contracts/math/SafeMath.sol";
+import "../../../interfaces/IVault.sol";
+import "./PolyVaultAdapter.sol";
+
+/**
+ * @title PolyVault adapter for Yearn Vaults v2
+ * @author Polylaunch Protocol
+ * @dev cloned for every launch or PolyPool using the vault, see PolyVaultAdapter
+ */
+contract YearnV2Adapter is PolyVaultAdapter {
+    using SafeERC20 for IERC20;
+    using SafeMath for uint256;
+
+    /**
+     * @notice deposit the stable approved by the owner into a Yearn vault, the adapter receives vault shares
+     * @param vault the yVault contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param amount the amount of stable to deposit
+     */
+    function activate(
+        address vault,
+        IERC20 stable,
+        uint256 amount
+    ) external override onlyOwner {
+        stable.safeTransferFrom(owner, address(this), amount);
+        stable.approve(vault, amount);
+        IVault(vault).deposit(amount);
+    }
+
+    /**
+     * @notice withdraw the shares worth an amount of stable and send the proceeds to the recipient
+     * @param vault the yVault contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     * @param amount the amount of stable to withdraw
+     * @param recipient the address the withdrawn stable is sent to
+     * @return the amount of stable sent to the recipient
+     * @dev rounding errors exist during the share price calculation
+     */
+    function withdraw(
+        address vault,
+        IERC20 stable,
+        uint256 amount,
+        address recipient
+    ) external override onlyOwner returns (uint256) {
+        uint256 shares = (amount.mul(1e18)).div(IVault(vault).pricePerShare());
+        uint256 redeemed = IVault(vault).withdraw(shares);
+        stable.safeTransfer(recipient, redeemed);
+        return redeemed;
+    }
+
+    /**
+     * @notice withdraw every share held by the adapter and send the stable to the owner
+     * @param vault the yVault contract
+     * @param stable the IERC20 interface of the stablecoin being used
+     */
+    function exit(address vault, IERC20 stable) external override onlyOwner {
+        IVault(vault).withdraw();
+        stable.safeTransfer(owner, stable.balanceOf(address(this)));
+    }
+
+    /**
+     * @notice value in stable of the vault shares held by an account
+     * @param vault the yVault contract
+     * @param account the holder of the shares
+     * @return the stable value of the position
+     */
+    function balanceOf(
+        address vault,
+        IERC20,
+        address account
+    ) external view override returns (uint256) {
+        return
+            IVault(vault).balanceOf(account).mul(IVault(vault).pricePerShare()) /
+            1e18;
+    }
+}
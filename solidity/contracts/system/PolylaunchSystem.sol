@@ -9,9 +9,11 @@ import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
 import "../launch/LaunchFactory.sol";
 import "../launch/BasicLaunch.sol";
 import "../polyvault/PolyVaultRegistry.sol";
+import "../polyvault/PolyPool.sol";
 import "../venture-bond/VentureBond.sol";
 import "../venture-bond/Market.sol";
 import "../governance/LaunchGovernor.sol";
+import "../metatx/PolylaunchForwarder.sol";
 import "../../interfaces/BasicLaunchInterface.sol";
 import "../../interfaces/IMarket.sol";
 import {Decimal} from "../Decimal.sol";
@@ -40,7 +42,8 @@ contract PolylaunchSystem is Ownable, LaunchLogger {
         address baseGovernorAddress,
         address marketAddress,
         address ventureBondAddress,
-        address vaultRegistry
+        address vaultRegistry,
+        address forwarderAddress
     );
 
     constructor(
@@ -52,7 +55,8 @@ contract PolylaunchSystem is Ownable, LaunchLogger {
         PolyVaultRegistry vaultRegistry = new PolyVaultRegistry(address(this));
 
         Market market = new Market(IMarket.BidShares(Decimal.D256(0e18), Decimal.D256(10e18), Decimal.D256(90e18)));
-        VentureBond ventureBond = new VentureBond(address(market), address(this), address(launchFactory));
+        PolylaunchForwarder forwarder = new PolylaunchForwarder();
+        VentureBond ventureBond = new VentureBond(address(market), address(this), address(launchFactory), address(forwarder));
         market.configure(address(ventureBond));
 
         launchFactory.setBaseBasicLaunchAddress(basicLaunch);
@@ -61,6 +65,7 @@ contract PolylaunchSystem is Ownable, LaunchLogger {
         launchFactory.setBaseGovernorAddress(governor);
         launchFactory.setVaultRegistryAddress(address(vaultRegistry));
         launchFactory.setStableContract(stable);
+        launchFactory.setTrustedForwarderAddress(address(forwarder));
 
         emit PolylaunchSystemLaunched(
             address(launchFactory),
@@ -69,7 +74,8 @@ contract PolylaunchSystem is Ownable, LaunchLogger {
             governor,
             address(market),
             address(ventureBond),
-            address(vaultRegistry)
+            address(vaultRegistry),
+            address(forwarder)
         );
     }
 
@@ -78,19 +84,19 @@ contract PolylaunchSystem is Ownable, LaunchLogger {
      * @param _vaultRegistryAddress the address of the vaultRegistry
      * @param _vaultContractAddress contract address for the specific interest bearing vault/pool
      * @param _vaultDesignation string definition of the vault/pool (for UX)
-     * @param _vaultProvider the id of protocol that is providing the interest bearing vault/pool
+     * @param _vaultAdapter the adapter contract for the protocol providing the vault/pool, see polyvault/adapters
      * @dev only the Owner can call this function
      */
     function registerNewVault(
         address _vaultRegistryAddress,
         address _vaultContractAddress,
         string calldata _vaultDesignation,
-        uint256 _vaultProvider
+        address _vaultAdapter
     ) external onlyOwner {
         PolyVaultRegistry(_vaultRegistryAddress).registerNewVault(
             _vaultContractAddress,
             _vaultDesignation,
-            _vaultProvider
+            _vaultAdapter
         );
     }
 
@@ -109,6 +115,71 @@ contract PolylaunchSystem is Ownable, LaunchLogger {
         );
     }
 
+    /*
+     * @notice Set the share of a PolyPool's assets that is kept liquid to pay taps
+     * @param _pool the address of the PolyPool
+     * @param _reserveRatio the new reserve ratio, out of 10000
+     * @dev only the Owner can call this function
+     */
+    function setPoolReserveRatio(address _pool, uint256 _reserveRatio)
+        external
+        onlyOwner
+    {
+        PolyPool(_pool).setReserveRatio(_reserveRatio);
+    }
+
+    /*
+     * @notice Launcher tap across a list of launches, funds go to each launch's fund recipient
+     * @param _launches the launches to tap
+     * @return tapped whether each launch was tapped
+     * @dev launches with nothing due, or whose tap reverts, are skipped rather than reverting the batch
+     */
+    function batchLauncherTap(address[] calldata _launches)
+        external
+        returns (bool[] memory tapped)
+    {
+        tapped = new bool[](_launches.length);
+        for (uint256 i = 0; i < _launches.length; i++) {
+            try BasicLaunch(payable(_launches[i])).keeperTap() returns (bool ok) {
+                tapped[i] = ok;
+            } catch {}
+        }
+    }
+
+    /*
+     * @notice Collect the system's share of vault yield across a list of launches without exiting their vaults
+     * @param _launches the launches to harvest
+     * @return harvested the total stable sent to this contract
+     * @dev launches with nothing to harvest, or whose harvest reverts, are skipped rather than reverting the batch
+     */
+    function batchHarvest(address[] calldata _launches)
+        external
+        returns (uint256 harvested)
+    {
+        for (uint256 i = 0; i < _launches.length; i++) {
+            try BasicLaunch(payable(_launches[i])).harvest() returns (uint256 amount) {
+                harvested += amount;
+            } catch {}
+        }
+    }
+
+    /*
+     * @notice View function for keepers to find the launches with a tap or harvest due in one call
+     * @param _launches the launches to check
+     * @return tapDue the stable each launcher could tap and harvestable the unharvested vault yield of each launch
+     */
+    function keeperStatus(address[] calldata _launches)
+        external
+        view
+        returns (uint256[] memory tapDue, uint256[] memory harvestable)
+    {
+        tapDue = new uint256[](_launches.length);
+        harvestable = new uint256[](_launches.length);
+        for (uint256 i = 0; i < _launches.length; i++) {
+            (tapDue[i], harvestable[i]) = BasicLaunch(payable(_launches[i])).keeperStatus();
+        }
+    }
+
     /*
      * @notice Collect balance from this contract
      * @param _tokens Tokens to collect
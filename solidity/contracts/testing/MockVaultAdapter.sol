@@ -0,0 +1,46 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
+import "../polyvault/adapters/PolyVaultAdapter.sol";
+import "./MockYieldVault.sol";
+
+/*
+* @dev PolyVault adapter for MockYieldVault, lets the adapter paths be tested and benchmarked without a mainnet fork
+*/
+
+contract MockVaultAdapter is PolyVaultAdapter {
+    using SafeERC20 for IERC20;
+
+    function activate(
+        address vault,
+        IERC20 stable,
+        uint256 amount
+    ) external override onlyOwner {
+        stable.safeTransferFrom(owner, address(this), amount);
+        stable.approve(vault, amount);
+        MockYieldVault(vault).deposit(amount);
+    }
+
+    function withdraw(
+        address vault,
+        IERC20,
+        uint256 amount,
+        address recipient
+    ) external override onlyOwner returns (uint256) {
+        return MockYieldVault(vault).withdrawUnderlying(amount, recipient);
+    }
+
+    function exit(address vault, IERC20 stable) external override onlyOwner {
+        stable.safeTransfer(owner, MockYieldVault(vault).withdrawAll());
+    }
+
+    function balanceOf(
+        address vault,
+        IERC20,
+        address account
+    ) external view override returns (uint256) {
+        return MockYieldVault(vault).balanceOfUnderlying(account);
+    }
+}
@@ -0,0 +1,70 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/token/ERC20/ERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+import "@openzeppelin/contracts/token/ERC20/SafeERC20.sol";
+import "@openzeppelin/contracts/math/SafeMath.sol";
+
+/*
+* @dev share based yield vault used for testing and offline gas benchmarking. Yield is simulated by sending
+* stable straight to the vault, which raises the value of every share, and an illiquid vault by limiting withdrawals.
+*/
+
+contract MockYieldVault is ERC20 {
+    using SafeERC20 for IERC20;
+    using SafeMath for uint256;
+
+    IERC20 public token;
+
+    // most stable paid out by a withdrawal of underlying
+    uint256 public withdrawalLimit = uint256(-1);
+
+    constructor(IERC20 token_) ERC20("Mock Yield Vault", "mvDAI") {
+        token = token_;
+    }
+
+    function totalAssets() public view returns (uint256) {
+        return token.balanceOf(address(this));
+    }
+
+    function pricePerShare() external view returns (uint256) {
+        uint256 supply = totalSupply();
+        return supply == 0 ? 1e18 : totalAssets().mul(1e18).div(supply);
+    }
+
+    function balanceOfUnderlying(address account) external view returns (uint256) {
+        uint256 supply = totalSupply();
+        return supply == 0 ? 0 : balanceOf(account).mul(totalAssets()).div(supply);
+    }
+
+    function deposit(uint256 amount) external returns (uint256 shares) {
+        uint256 supply = totalSupply();
+        shares = supply == 0 ? amount : amount.mul(supply).div(totalAssets());
+        token.safeTransferFrom(msg.sender, address(this), amount);
+        _mint(msg.sender, shares);
+    }
+
+    function setWithdrawalLimit(uint256 limit) external {
+        withdrawalLimit = limit;
+    }
+
+    function withdrawUnderlying(uint256 amount, address recipient) external returns (uint256) {
+        if (amount > withdrawalLimit) {
+            amount = withdrawalLimit;
+        }
+        // round the shares burnt up so the vault never pays out more than the shares are worth
+        uint256 assets = totalAssets();
+        uint256 shares = amount.mul(totalSupply()).add(assets - 1).div(assets);
+        _burn(msg.sender, shares);
+        token.safeTransfer(recipient, amount);
+        return amount;
+    }
+
+    function withdrawAll() external returns (uint256 amount) {
+        uint256 shares = balanceOf(msg.sender);
+        amount = shares.mul(totalAssets()).div(totalSupply());
+        _burn(msg.sender, shares);
+        token.safeTransfer(msg.sender, amount);
+    }
+}
@@ -0,0 +1,41 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+/**
+ * @author PolyLaunch Protocol
+ * @title Multihash
+ * @notice Rebuilds IPFS content identifiers from the sha2-256 digests stored on chain
+ */
+library Multihash {
+    bytes internal constant ALPHABET =
+        "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz";
+
+    /**
+     * @notice encode a sha2-256 digest as a CIDv0 ("Qm...") string
+     * @param digest the sha2-256 digest of the content
+     * @return the base58 encoding of the multihash 0x1220 ++ digest
+     * @dev only used in views, the multihash never starts with a zero byte so there are no leading '1's
+     */
+    function toCIDv0(bytes32 digest) internal pure returns (string memory) {
+        bytes memory source = abi.encodePacked(uint8(0x12), uint8(0x20), digest);
+        uint8[] memory digits = new uint8[](47);
+        uint256 length = 1;
+        for (uint256 i = 0; i < source.length; i++) {
+            uint256 carry = uint8(source[i]);
+            for (uint256 j = 0; j < length; j++) {
+                carry += uint256(digits[j]) * 256;
+                digits[j] = uint8(carry % 58);
+                carry = carry / 58;
+            }
+            while (carry > 0) {
+                digits[length++] = uint8(carry % 58);
+                carry = carry / 58;
+            }
+        }
+        bytes memory result = new bytes(length);
+        for (uint256 k = 0; k < length; k++) {
+            result[k] = ALPHABET[digits[length - 1 - k]];
+        }
+        return string(result);
+    }
+}
@@ -4,7 +4,6 @@ pragma solidity 0.7.4;
 pragma experimental ABIEncoderV2;
 
 import "@openzeppelin/contracts/token/ERC721/ERC721.sol";
-import {Counters} from "@openzeppelin/contracts/utils/Counters.sol";
 import {SafeMath} from "@openzeppelin/contracts/math/SafeMath.sol";
 import {Math} from "@openzeppelin/contracts/math/Math.sol";
 import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
@@ -14,14 +13,17 @@ import {
 import {Decimal} from "../Decimal.sol";
 import {IMarket} from "../../interfaces/IMarket.sol";
 import "../../interfaces/IVentureBond.sol";
+import {RelayRecipient} from "../metatx/RelayRecipient.sol";
+import {VentureBondIds} from "./VentureBondIds.sol";
+import {Multihash} from "./Multihash.sol";
+import "../../interfaces/BasicLaunchInterface.sol";
 
 /**
  * @title The Polylaunch VentureBond NFT contract, loosely inspired by the Zora Protocol
  * @notice This contract provides an interface to mint ventureBond with a market
  * owned by the creator.
  */
-contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
-    using Counters for Counters.Counter;
+contract VentureBond is ERC721, IVentureBond, ReentrancyGuard, RelayRecipient {
     using SafeMath for uint256;
 
     /* *******
@@ -41,8 +43,14 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
     // Mapping from token to previous owner of the token
     mapping(uint256 => address) public previousTokenOwners;
 
-    // Mapping from tokenId to its corresponding launch address
-    mapping(uint256 => address) public tokenAssociatedLaunch; 
+    // Mapping from launchId to its launch address, the launchId of a token is encoded in its id, see VentureBondIds
+    mapping(uint256 => address) public launchAddressById;
+
+    // Mapping from launch address to its launchId
+    mapping(address => uint256) public launchIdOfLaunch;
+
+    // Mapping from launchId to the number of bonds minted by the launch
+    mapping(uint256 => uint256) public bondsMintedByLaunch;
 
     // Mapping from token id to creator address
     mapping(uint256 => address) public tokenCreators;
@@ -50,14 +58,18 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
     // Mapping from token id to sha256 hash of metadata
     mapping(uint256 => bytes32) public tokenMetadataHashes;
 
+    // Mapping from token id to the sha2-256 digest of its ipfs content, see tokenURI
+    mapping(uint256 => bytes32) public tokenURIDigests;
+
+    // Mapping from launchId to the base prepended to the ipfs content identifier of its tokens
+    mapping(uint256 => string) public launchBaseURI;
+
     // Mapping from token id to venture bond parameters, see IVentureBond
     mapping(uint256 => VentureBondParams) public tokenVentureBondParams;
 
     // Mapping to track launches that are allowed to mint venture bonds
     mapping(address => bool) public isAuthorisedLaunch;
 
-    Counters.Counter private tokenIdTracker;
-
     /* *********
      * Modifiers
      * *********
@@ -111,7 +123,7 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
      */
     modifier onlyAssociatedToken(uint256 tokenId) {
         require(
-            tokenAssociatedLaunch[tokenId] == msg.sender,
+            launchAddressById[VentureBondIds.launchIdOf(tokenId)] == msg.sender,
             "VentureBond: msg.sender is not the associated launch to this token"
         );
         _; 
@@ -135,31 +147,33 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
      */
     modifier onlyTokenCreated(uint256 tokenId) {
         require(
-            tokenIdTracker.current() > tokenId,
+            bondsMintedByLaunch[VentureBondIds.launchIdOf(tokenId)] >
+                VentureBondIds.indexOf(tokenId),
             "VentureBond: token with that id does not exist"
         );
         _;
     }
 
     /**
-     * @notice Ensure that the provided URI is not empty
+     * @notice Ensure that the provided URI digest is not empty
      */
-    modifier onlyValidURI(string memory uri) {
+    modifier onlyValidURI(bytes32 uriDigest) {
         require(
-            bytes(uri).length != 0,
+            uriDigest != 0,
             "VentureBond: specified uri must be non-empty"
         );
         _;
     }
 
     /**
-     * @notice On deployment, set the market contract address system contract and factory contract
+     * @notice On deployment, set the market contract address system contract, factory contract and trusted forwarder
      * ERC721 metadata interface
      */
-    constructor(address marketContractAddr, address systemContractAddr, address factoryContractAddr) public ERC721("Polylaunch", "POLYLAUNCH") {
+    constructor(address marketContractAddr, address systemContractAddr, address factoryContractAddr, address trustedForwarderAddr) public ERC721("Polylaunch", "POLYLAUNCH") {
         marketContract = marketContractAddr;
         systemContract = systemContractAddr;
         factoryContract = factoryContractAddr;
+        _setTrustedForwarder(trustedForwarderAddr);
     }
 
     /* **************
@@ -230,7 +244,40 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
     override
     onlyTokenCreated(tokenId) 
     returns (address) {
-        return tokenAssociatedLaunch[tokenId];
+        return launchAddressById[VentureBondIds.launchIdOf(tokenId)];
+    }
+
+    /**
+     * @notice Return the URI of a token, built from the base of its launch and the ipfs content identifier
+     * of its digest
+     */
+    function tokenURI(uint256 tokenId)
+        public
+        view
+        override
+        onlyExistingToken(tokenId)
+        returns (string memory)
+    {
+        return
+            string(
+                abi.encodePacked(
+                    launchBaseURI[VentureBondIds.launchIdOf(tokenId)],
+                    Multihash.toCIDv0(tokenURIDigests[tokenId])
+                )
+            );
+    }
+
+    /**
+     * @notice View function to return the ids of the bonds minted by a launch, they are firstId to firstId + count - 1
+     * @param launchId the launchId of the launch
+     * @return firstId the id of the first bond of the launch and count the number of bonds minted by the launch
+     */
+    function launchBondRange(uint256 launchId)
+        external
+        view
+        returns (uint256 firstId, uint256 count)
+    {
+        return (VentureBondIds.encode(launchId, 0), bondsMintedByLaunch[launchId]);
     }
 
     /* ****************
@@ -257,8 +304,26 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
     /**
      * @notice see IVentureBond
      */
-    function authoriseLaunch(address launch) external override onlyFactory {
+    function authoriseLaunch(address launch, uint256 launchId) external override onlyFactory {
         isAuthorisedLaunch[launch] = true;
+        launchAddressById[launchId] = launch;
+        launchIdOfLaunch[launch] = launchId;
+        launchBaseURI[launchId] = "ipfs://";
+    }
+
+    /**
+     * @notice Set the base of the token URIs of a launch's bonds, e.g. an ipfs gateway
+     * @param launchId the launchId of the launch
+     * @param baseURI the base prepended to the ipfs content identifier of each token
+     * @dev only the launcher of the launch can call this function
+     */
+    function setLaunchBaseURI(uint256 launchId, string calldata baseURI) external {
+        require(
+            launchAddressById[launchId] != address(0) &&
+                BasicLaunchInterface(launchAddressById[launchId]).launcher() == _msgSender(),
+            "VentureBond: caller is not the launcher"
+        );
+        launchBaseURI[launchId] = baseURI;
     }
 
     /* ****************
@@ -285,7 +350,7 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
         public
         override
         nonReentrant
-        onlyApprovedOrOwner(msg.sender, tokenId)
+        onlyApprovedOrOwner(_msgSender(), tokenId)
     {
         IMarket(marketContract).setAsk(tokenId, ask);
     }
@@ -297,7 +362,7 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
         external
         override
         nonReentrant
-        onlyApprovedOrOwner(msg.sender, tokenId)
+        onlyApprovedOrOwner(_msgSender(), tokenId)
     {
         IMarket(marketContract).removeAsk(tokenId);
     }
@@ -311,8 +376,8 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
         nonReentrant
         onlyExistingToken(tokenId)
     {
-        require(msg.sender == bid.bidder, "Market: Bidder must be msg sender");
-        IMarket(marketContract).setBid(tokenId, bid, msg.sender);
+        require(_msgSender() == bid.bidder, "Market: Bidder must be msg sender");
+        IMarket(marketContract).setBid(tokenId, bid, _msgSender());
     }
 
     /**
@@ -324,7 +389,7 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
         nonReentrant
         onlyTokenCreated(tokenId)
     {
-        IMarket(marketContract).removeBid(tokenId, msg.sender);
+        IMarket(marketContract).removeBid(tokenId, _msgSender());
     }
 
     /**
@@ -334,7 +399,7 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
         public
         override
         nonReentrant
-        onlyApprovedOrOwner(msg.sender, tokenId)
+        onlyApprovedOrOwner(_msgSender(), tokenId)
     {
         IMarket(marketContract).acceptBid(tokenId, bid);
     }
@@ -437,20 +502,21 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
         address creator,
         MediaData memory data,
         VentureBondParams memory ventureBondParams
-    ) internal onlyValidURI(data.tokenURI){
+    ) internal onlyValidURI(data.tokenURIDigest){
         require(
             data.metadataHash != 0,
             "VentureBond: metadata hash must be non-zero"
         );
 
-        uint256 tokenId = tokenIdTracker.current();
+        uint256 launchId = launchIdOfLaunch[msg.sender];
+        uint256 index = bondsMintedByLaunch[launchId];
+        uint256 tokenId = VentureBondIds.encode(launchId, index);
 
         _safeMint(creator, tokenId);
-        tokenIdTracker.increment();
+        bondsMintedByLaunch[launchId] = index + 1;
         _setTokenMetadataHash(tokenId, data.metadataHash);
-        _setTokenURI(tokenId, data.tokenURI);
+        tokenURIDigests[tokenId] = data.tokenURIDigest;
         tokenVentureBondParams[tokenId] = ventureBondParams;
-        tokenAssociatedLaunch[tokenId] = msg.sender;
 
         tokenCreators[tokenId] = systemContract;
         previousTokenOwners[tokenId] = systemContract;
@@ -512,4 +578,16 @@ contract VentureBond is ERC721, IVentureBond, ReentrancyGuard {
         super._transfer(from, to, tokenId);
     }
 
+    /**
+     * @notice resolve the sender through the trusted forwarder so ERC721 approvals and transfers can be relayed
+     */
+    function _msgSender()
+        internal
+        view
+        override(Context, RelayRecipient)
+        returns (address payable)
+    {
+        return RelayRecipient._msgSender();
+    }
+
 }
\ No newline at end of file
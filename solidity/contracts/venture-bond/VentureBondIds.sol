@@ -0,0 +1,45 @@
+// SPDX-License-Identifier: MIT
+pragma solidity 0.7.4;
+
+/**
+ * @author PolyLaunch Protocol
+ * @title VentureBond ids
+ * @notice A VentureBond id carries the launchId of its launch in the high 128 bits and the index of the bond
+ * within the launch in the low 128 bits, so the launch of a bond is known without a lookup and the bonds of
+ * launch N are the ids from N << 128 upwards
+ */
+library VentureBondIds {
+    uint256 internal constant LAUNCH_ID_SHIFT = 128;
+
+    /**
+     * @notice build the id of a bond
+     * @param launchId the launchId of the launch minting the bond
+     * @param index the number of bonds already minted by the launch
+     * @return the id of the bond
+     */
+    function encode(uint256 launchId, uint256 index)
+        internal
+        pure
+        returns (uint256)
+    {
+        require(
+            launchId < (1 << LAUNCH_ID_SHIFT) && index < (1 << LAUNCH_ID_SHIFT),
+            "VentureBondIds: id out of range"
+        );
+        return (launchId << LAUNCH_ID_SHIFT) | index;
+    }
+
+    /**
+     * @notice the launchId of the launch that minted a bond
+     */
+    function launchIdOf(uint256 tokenId) internal pure returns (uint256) {
+        return tokenId >> LAUNCH_ID_SHIFT;
+    }
+
+    /**
+     * @notice the index of a bond within its launch
+     */
+    function indexOf(uint256 tokenId) internal pure returns (uint256) {
+        return uint128(tokenId);
+    }
+}
@@ -0,0 +1,7 @@
+# indexer.columnar and indexer.vesting need numpy and indexer.rpc needs aiohttp; they are left out of the package
+# namespace so the rest of the indexer runs without them, import those modules directly.
+from indexer.backfill import backfill, partition
+from indexer.decoder import EventDecoder, build_decoders, decode_log
+from indexer.history import LaunchHistory
+from indexer.indexer import Indexer
+from indexer.store import EventStore
@@ -0,0 +1,88 @@
+"""
+Parallel historical backfill. The contracts of the system are discovered first from its creation events, then the
+block range is split into partitions whose logs are fetched and decoded by a pool of worker processes. Partitions
+are committed to the store in block order as they complete, so the cursor only ever moves forward and an
+interrupted backfill resumes like the incremental indexer.
+"""
+
+import multiprocessing
+import os
+from indexer.indexer import Indexer
+from indexer.store import EventStore
+
+# partitions per worker, several per worker keep the pool busy when the logs are not spread evenly over the range
+PARTITIONS_PER_WORKER = 4
+
+# indexer of the worker process, set up once by init_worker
+_worker = None
+
+
+def partition(start, end, parts):
+    """
+    Split the inclusive block range start..end into at most parts contiguous ranges
+    """
+    size = max(1, -(-(end - start + 1) // parts))
+    return [(s, min(s + size - 1, end)) for s in range(start, end + 1, size)]
+
+
+def init_worker(endpoint_uri, system_address, decoders, contracts, launch_by_id, batch_size):
+    from web3 import Web3
+
+    global _worker
+    _worker = Indexer(
+        Web3(Web3.HTTPProvider(endpoint_uri)),
+        EventStore(),
+        system_address,
+        None,
+        batch_size=batch_size,
+        decoders=decoders,
+    )
+    _worker.contracts.update(contracts)
+    _worker.launch_by_id.update(launch_by_id)
+
+
+def fetch_partition(block_range):
+    start, end = block_range
+    events = []
+    blocks = []
+    while start <= end:
+        batch_end = min(start + _worker.batch_size - 1, end)
+        batch_events, _, _, batch_blocks = _worker.collect(start, batch_end)
+        events += batch_events
+        blocks += batch_blocks
+        start = batch_end + 1
+    return block_range, events, blocks
+
+
+def backfill(indexer, endpoint_uri, to_block=None, workers=None, partitions=None):
+    """
+    Index every block from the cursor of the indexer up to to_block with a pool of worker processes
+    @param indexer Indexer whose store receives the events
+    @param endpoint_uri http endpoint of the node, each worker opens its own connection to it
+    @param workers number of worker processes, defaults to the number of cores
+    @param partitions number of block ranges the backfill is split into
+    @return the number of events written
+    """
+    to_block = indexer.head() if to_block is None else to_block
+    start = indexer.next_block()
+    if start > to_block:
+        return 0
+    indexer.discover(start, to_block)
+
+    workers = workers or os.cpu_count()
+    ranges = partition(start, to_block, partitions or workers * PARTITIONS_PER_WORKER)
+    init_args = (
+        endpoint_uri,
+        indexer.system,
+        indexer.decoders,
+        indexer.contracts,
+        indexer.launch_by_id,
+        indexer.batch_size,
+    )
+    written = 0
+    with multiprocessing.Pool(workers, init_worker, init_args) as pool:
+        # imap yields in submission order, so partitions are merged in block order
+        for (_, end), events, blocks in pool.imap(fetch_partition, ranges):
+            indexer.commit(end, events, blocks=blocks)
+            written += len(events)
+    return written
@@ -0,0 +1,339 @@
+"""
+Append only columnar copy of the launch events, for analytical scans that sqlite rows are too slow for. Every event
+type has a directory of fixed width little endian column files: block, log index, timestamp, the index of the launch
+and one or more columns per argument. uint256 amounts are split in two uint64 columns (lo, hi) and so must fit in
+128 bits, addresses are replaced by their id in an append only dictionary shared by every event type, and bond
+token ids keep only their index within the launch.
+
+Columns are read back as read only memory maps, scans run over them without copying. Rows are kept in block order,
+which lets a reorg be rolled back by truncating the files, and the block of the last row committed is kept in a
+cursor file so a crash between two column writes is repaired on the next open.
+"""
+
+import json
+import os
+import numpy as np
+
+MASK_64 = (1 << 64) - 1
+BOND_INDEX_MASK = (1 << 128) - 1
+
+# columns common to every event type
+ROW_COLUMNS = (
+    ("block", "<u8"),
+    ("log_index", "<u4"),
+    ("timestamp", "<u8"),
+    ("launch", "<u4"),
+)
+
+ARG_DTYPES = {"address": "<u4", "bond": "<u8"}
+
+# arguments kept for every event type written in columns, by kind
+LAYOUTS = {
+    "SupporterFundsDeposited": (("sender", "address"), ("amount", "amount")),
+    "SupporterFundsTapped": (
+        ("tapper", "address"),
+        ("tokenId", "bond"),
+        ("amount", "amount"),
+        ("newTappableBalance", "amount"),
+    ),
+    "LauncherFundsTapped": (
+        ("tapper", "address"),
+        ("recipient", "address"),
+        ("amount", "amount"),
+    ),
+    "RefundClaimed": (("addr", "address"), ("tokenId", "bond"), ("amount", "amount")),
+    "FundsWithdrawn": (("account", "address"), ("amount", "amount")),
+    "VaultFundsTapped": (("amount", "amount"),),
+    "VaultHarvested": (("amount", "amount"),),
+}
+
+
+def columns_of(event):
+    """
+    Column names and dtypes of an event type, in file order
+    """
+    columns = list(ROW_COLUMNS)
+    for arg, kind in LAYOUTS[event]:
+        if kind == "amount":
+            columns += [(f"{arg}_lo", "<u8"), (f"{arg}_hi", "<u8")]
+        else:
+            columns.append((arg, ARG_DTYPES[kind]))
+    return columns
+
+
+def split_amounts(amounts):
+    """
+    Split python ints into (lo, hi) uint64 arrays
+    """
+    if any(a >> 128 for a in amounts):
+        raise ValueError("Amount does not fit in 128 bits")
+    lo = np.array([a & MASK_64 for a in amounts], dtype="<u8")
+    hi = np.array([a >> 64 for a in amounts], dtype="<u8")
+    return lo, hi
+
+
+def join_amounts(lo, hi):
+    """
+    Python ints of (lo, hi) uint64 arrays, exact but not vectorised, for the few rows of a result
+    """
+    return [int(h) << 64 | int(l) for l, h in zip(lo, hi)]
+
+
+def approximate_amounts(lo, hi):
+    """
+    float64 values of (lo, hi) uint64 arrays, for plots and ratios where 53 bits of precision are enough
+    """
+    return hi.astype(np.float64) * 2.0 ** 64 + lo.astype(np.float64)
+
+
+def limbs(lo, hi, bits=32):
+    # limbs of the amounts, lowest first
+    mask = (1 << bits) - 1
+    return [(half >> shift) & mask for half in (lo, hi) for shift in range(0, 64, bits)]
+
+
+def combine_limbs(sums, bits=32):
+    return sum(int(s) << (bits * i) for i, s in enumerate(sums))
+
+
+def sum_amounts(lo, hi):
+    """
+    Exact sum of (lo, hi) uint64 arrays
+    """
+    # 32 bit limbs sum in uint64 without overflow for up to 2**32 rows
+    return combine_limbs([limb.sum(dtype=np.uint64) for limb in limbs(lo, hi)])
+
+
+def group_sums(keys, lo, hi):
+    """
+    Exact sums of amounts grouped by integer keys, such as dictionary ids or days
+    @return (sorted keys that have rows, list of python int sums)
+    """
+    if len(keys) == 0:
+        return keys[:0], []
+    if np.all(keys[1:] >= keys[:-1]):
+        # sorted keys, such as the days of rows in block order, are summed by runs
+        starts = np.concatenate(([0], np.flatnonzero(keys[1:] != keys[:-1]) + 1))
+        sums = [np.add.reduceat(limb, starts, dtype=np.uint64) for limb in limbs(lo, hi)]
+        return keys[starts], [combine_limbs(group) for group in zip(*sums)]
+    offset = keys.min()
+    groups = (keys - offset).astype(np.intp)
+    present = np.flatnonzero(np.bincount(groups))
+    # bincount sums in float64, 16 bit limbs keep every sum exact for up to 2**37 rows
+    sums = [np.bincount(groups, weights=limb)[present] for limb in limbs(lo, hi, bits=16)]
+    return present + offset, [combine_limbs(group, bits=16) for group in zip(*sums)]
+
+
+class AddressDictionary:
+    """
+    Append only mapping of addresses to dense ids, one address per line of a text file
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.addresses = []
+        if os.path.exists(path):
+            with open(path) as f:
+                self.addresses = f.read().split()
+        self.ids = {address: i for i, address in enumerate(self.addresses)}
+        self.pending = []
+
+    def id(self, address):
+        if address not in self.ids:
+            self.ids[address] = len(self.addresses)
+            self.addresses.append(address)
+            self.pending.append(address)
+        return self.ids[address]
+
+    def flush(self):
+        if self.pending:
+            with open(self.path, "a") as f:
+                f.write("".join(f"{address}\n" for address in self.pending))
+            self.pending = []
+
+
+class ColumnStore:
+    """
+    Columnar event files in a directory, fed by an Indexer through its columns argument
+    @param path directory of the store, created if missing
+    """
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        self.addresses = AddressDictionary(os.path.join(path, "addresses.txt"))
+        self.launches = AddressDictionary(os.path.join(path, "launches.txt"))
+        cursor_path = os.path.join(path, "cursor")
+        self.cursor = None
+        if os.path.exists(cursor_path):
+            with open(cursor_path) as f:
+                self.cursor = int(f.read())
+        for event in LAYOUTS:
+            self._repair(event)
+
+    def _file(self, event, column):
+        return os.path.join(self.path, event, f"{column}.bin")
+
+    def rows(self, event):
+        """
+        Number of rows of an event type, the shortest of its columns
+        """
+        return min(
+            os.path.getsize(self._file(event, column)) // np.dtype(dtype).itemsize
+            if os.path.exists(self._file(event, column))
+            else 0
+            for column, dtype in columns_of(event)
+        )
+
+    def _truncate(self, event, rows):
+        for column, dtype in columns_of(event):
+            path = self._file(event, column)
+            if os.path.exists(path):
+                os.truncate(path, rows * np.dtype(dtype).itemsize)
+
+    def _repair(self, event):
+        # drop the rows of an interrupted write, and those past the cursor
+        rows = self.rows(event) if self.cursor is not None else 0
+        if rows:
+            rows = int(np.searchsorted(self.column(event, "block", rows), self.cursor, "right"))
+        self._truncate(event, rows)
+
+    def column(self, event, column, rows=None):
+        """
+        Read only memory map of a column, without copying
+        """
+        rows = self.rows(event) if rows is None else rows
+        dtype = dict(columns_of(event))[column]
+        if rows == 0:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(self._file(event, column), dtype=dtype, mode="r", shape=(rows,))
+
+    def scan(self, event):
+        """
+        Every column of an event type as read only memory maps of the same length
+        @return dict of column name to array
+        """
+        rows = self.rows(event)
+        return {column: self.column(event, column, rows) for column, _ in columns_of(event)}
+
+    def write(self, event, columns):
+        """
+        Append rows to an event type, the bulk path used by append
+        @param columns dict of column name to array, every column of the event type and of the same length
+        """
+        os.makedirs(os.path.join(self.path, event), exist_ok=True)
+        for column, dtype in columns_of(event):
+            with open(self._file(event, column), "ab") as f:
+                np.asarray(columns[column], dtype=dtype).tofile(f)
+
+    def set_cursor(self, block_number):
+        # written through a rename, a torn cursor would lose every row past it on the next open
+        path = os.path.join(self.path, "cursor")
+        with open(path + ".tmp", "w") as f:
+            f.write(str(block_number))
+        os.replace(path + ".tmp", path)
+        self.cursor = block_number
+
+    def append(self, to_block, events, blocks):
+        """
+        Append the events of a committed batch, in the formats of EventStore.commit_batch
+        @param to_block the last block covered by the batch
+        @param events list of (block_number, log_index, tx_hash, address, event, launch, args) tuples
+        @param blocks list of (block_number, hash, parent_hash, timestamp) checkpoints, covering every event block
+        """
+        if self.cursor is not None and to_block <= self.cursor:
+            return
+        after = -1 if self.cursor is None else self.cursor
+        timestamps = {b[0]: b[3] for b in blocks}
+        by_event = {}
+        for row in sorted(events, key=lambda e: (e[0], e[1])):
+            if row[0] > after and row[4] in LAYOUTS and row[5] is not None:
+                by_event.setdefault(row[4], []).append(
+                    (row[0], row[1], timestamps[row[0]], row[5], row[6])
+                )
+
+        for event, rows in by_event.items():
+            columns = {
+                "block": [r[0] for r in rows],
+                "log_index": [r[1] for r in rows],
+                "timestamp": [r[2] for r in rows],
+                "launch": [self.launches.id(r[3]) for r in rows],
+            }
+            for arg, kind in LAYOUTS[event]:
+                values = [r[4][arg] for r in rows]
+                if kind == "amount":
+                    columns[f"{arg}_lo"], columns[f"{arg}_hi"] = split_amounts(values)
+                elif kind == "address":
+                    columns[arg] = [self.addresses.id(v) for v in values]
+                else:
+                    columns[arg] = [v & BOND_INDEX_MASK for v in values]
+            by_event[event] = columns
+
+        # ids are on disk before the rows that use them
+        self.addresses.flush()
+        self.launches.flush()
+        for event, columns in by_event.items():
+            self.write(event, columns)
+        self.set_cursor(to_block)
+
+    def catch_up(self, store):
+        """
+        Append the events an EventStore committed past the cursor of the column store, for a column store added to
+        an existing index
+        """
+        to_block = store.get_cursor()
+        if to_block is None or (self.cursor is not None and to_block <= self.cursor):
+            return
+        after = -1 if self.cursor is None else self.cursor
+        rows = store.conn.execute(
+            "SELECT e.block_number, e.log_index, e.tx_hash, e.address, e.event, e.launch, e.args, b.timestamp "
+            "FROM events e JOIN blocks b ON b.block_number = e.block_number WHERE e.block_number > ?",
+            (after,),
+        ).fetchall()
+        events = [tuple(row[:6]) + (json.loads(row[6]),) for row in rows]
+        blocks = [(row[0], None, None, row[7]) for row in rows]
+        self.append(to_block, events, blocks)
+
+    def rollback(self, block_number):
+        """
+        Remove every row after block_number, undoing the blocks of a reorg
+        """
+        for event in LAYOUTS:
+            rows = self.rows(event)
+            if rows:
+                blocks = self.column(event, "block", rows)
+                self._truncate(event, int(np.searchsorted(blocks, block_number, "right")))
+        if self.cursor is not None and self.cursor > block_number:
+            self.set_cursor(block_number)
+
+    def funding_by_launch(self):
+        """
+        Total deposits of every launch
+        @return dict of launch address to amount raised
+        """
+        columns = self.scan("SupporterFundsDeposited")
+        keys, sums = group_sums(columns["launch"], columns["amount_lo"], columns["amount_hi"])
+        return {self.launches.addresses[k]: s for k, s in zip(keys, sums)}
+
+    def funding_curve(self, launch):
+        """
+        Cumulative amount raised by a launch after each of its deposits
+        @return (timestamps, float64 cumulative amounts)
+        """
+        columns = self.scan("SupporterFundsDeposited")
+        if launch not in self.launches.ids:
+            return np.empty(0, dtype="<u8"), np.empty(0)
+        selected = columns["launch"] == self.launches.ids[launch]
+        amounts = approximate_amounts(columns["amount_lo"][selected], columns["amount_hi"][selected])
+        return columns["timestamp"][selected], np.cumsum(amounts)
+
+    def volume_by_day(self, event="SupporterFundsTapped", amount="amount"):
+        """
+        Exact daily totals of an amount column, days counted from the unix epoch
+        @return (days, list of python int totals)
+        """
+        columns = self.scan(event)
+        # rows are in block order so the days are already sorted
+        return group_sums(
+            columns["timestamp"] // 86400, columns[f"{amount}_lo"], columns[f"{amount}_hi"]
+        )
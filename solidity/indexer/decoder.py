@@ -0,0 +1,126 @@
+"""
+Topic to decoder tables for the events emitted by the Polylaunch contracts. The tables are built once from the
+contract ABIs and only hold plain python data, so they can be shipped to worker processes.
+"""
+
+from eth_abi import decode_abi
+from eth_utils import keccak, to_checksum_address
+
+# contracts tracked by the indexer, keyed by the name used for them in the store
+CONTRACT_KINDS = ("system", "venture_bond", "market", "governor")
+
+
+def abi_type(param):
+    # canonical type of an abi parameter, structs are expanded to tuples
+    if not param["type"].startswith("tuple"):
+        return param["type"]
+    inner = ",".join(abi_type(component) for component in param["components"])
+    return f"({inner}){param['type'][len('tuple'):]}"
+
+
+def event_signature(event):
+    return f"{event['name']}({','.join(abi_type(i) for i in event['inputs'])})"
+
+
+def event_topic(event):
+    return "0x" + keccak(text=event_signature(event)).hex()
+
+
+def to_hex(value):
+    if isinstance(value, str):
+        return value if value.startswith("0x") else "0x" + value
+    return "0x" + bytes(value).hex()
+
+
+def to_bytes(value):
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def normalise(type_, value):
+    # convert decoded values to json friendly python values
+    if type_.endswith("]"):
+        inner = type_[: type_.rindex("[")]
+        return [normalise(inner, v) for v in value]
+    if type_.startswith("("):
+        types = split_tuple(type_)
+        return [normalise(t, v) for t, v in zip(types, value)]
+    if type_ == "address":
+        return to_checksum_address(value)
+    if type_.startswith("bytes"):
+        return "0x" + bytes(value).hex()
+    return value
+
+
+def split_tuple(type_):
+    # split "(a,(b,c),d)" into ["a", "(b,c)", "d"]
+    types, depth, current = [], 0, ""
+    for char in type_[1:-1]:
+        if char == "," and depth == 0:
+            types.append(current)
+            current = ""
+            continue
+        depth += char == "("
+        depth -= char == ")"
+        current += char
+    if current:
+        types.append(current)
+    return types
+
+
+class EventDecoder:
+    """
+    Decodes a raw log of one event. Indexed parameters are read from the topics and the rest from the data,
+    the result is a dict of argument name to value in the order of the event declaration.
+    """
+
+    def __init__(self, event):
+        self.name = event["name"]
+        self.topic = event_topic(event)
+        self.inputs = [(i["name"], abi_type(i), i["indexed"]) for i in event["inputs"]]
+        self.data_types = [t for _, t, indexed in self.inputs if not indexed]
+
+    def decode(self, topics, data):
+        values = iter(decode_abi(self.data_types, to_bytes(data)))
+        topics = iter(topics[1:])
+        args = {}
+        for name, type_, indexed in self.inputs:
+            if indexed:
+                topic = to_bytes(next(topics))
+                if type_ in ("string", "bytes") or type_.endswith("]") or type_.startswith("("):
+                    # dynamic indexed values are hashed, only the hash can be recovered
+                    args[name] = "0x" + topic.hex()
+                else:
+                    args[name] = normalise(type_, decode_abi([type_], topic)[0])
+            else:
+                args[name] = normalise(type_, next(values))
+        return args
+
+
+def build_decoders(abis):
+    """
+    Build the topic to decoder table of each contract kind
+    @param abis dict of contract kind to the abi of the contract
+    @return dict of contract kind to a dict of topic0 to EventDecoder
+    """
+    return {
+        kind: {
+            decoder.topic: decoder
+            for decoder in (EventDecoder(e) for e in abi if e["type"] == "event")
+        }
+        for kind, abi in abis.items()
+    }
+
+
+def decode_log(decoders, kind, log):
+    """
+    Decode a raw log emitted by a contract of the given kind
+    @return (event name, args) or None if the topic is not an event of the contract
+    """
+    if not log["topics"]:
+        return None
+    decoder = decoders[kind].get(to_hex(log["topics"][0]))
+    if decoder is None:
+        return None
+    return decoder.name, decoder.decode(log["topics"], log["data"])
@@ -0,0 +1,391 @@
+"""
+Tables derived from the indexed events. They are updated in the transaction that commits a batch of events, and
+a rollback applies the removed events in reverse with the opposite sign, so only the rows touched by the rolled
+back blocks change.
+
+uint256 amounts do not fit sqlite integers and are stored as decimal strings, the per launch and per bond totals
+are kept here so they never have to be summed in sql.
+"""
+
+import json
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS launch_aggregates (
+    launch TEXT PRIMARY KEY,
+    raised TEXT NOT NULL,
+    deposits INTEGER NOT NULL,
+    supporters INTEGER NOT NULL,
+    launcher_tapped TEXT NOT NULL,
+    launcher_taps INTEGER NOT NULL,
+    supporter_tapped TEXT NOT NULL,
+    supporter_taps INTEGER NOT NULL,
+    refunded TEXT NOT NULL,
+    refunds INTEGER NOT NULL,
+    withdrawn TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS launch_supporters (
+    launch TEXT NOT NULL,
+    supporter TEXT NOT NULL,
+    provided TEXT NOT NULL,
+    deposits INTEGER NOT NULL,
+    PRIMARY KEY (launch, supporter)
+);
+CREATE INDEX IF NOT EXISTS launch_supporters_by_supporter ON launch_supporters (supporter);
+CREATE TABLE IF NOT EXISTS bond_aggregates (
+    token_id TEXT PRIMARY KEY,
+    launch TEXT,
+    tapped TEXT NOT NULL,
+    taps INTEGER NOT NULL,
+    remaining TEXT NOT NULL,
+    refunded TEXT NOT NULL,
+    refunds INTEGER NOT NULL,
+    refund_cleared TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bond_aggregates_by_launch ON bond_aggregates (launch);
+CREATE TABLE IF NOT EXISTS bond_owners (
+    token_id TEXT PRIMARY KEY,
+    launch TEXT,
+    owner TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS bond_owners_by_owner ON bond_owners (owner);
+CREATE TABLE IF NOT EXISTS vote_tallies (
+    governor TEXT NOT NULL,
+    proposal_id INTEGER NOT NULL,
+    launch TEXT,
+    for_votes TEXT NOT NULL,
+    against_votes TEXT NOT NULL,
+    voters INTEGER NOT NULL,
+    PRIMARY KEY (governor, proposal_id)
+);
+CREATE INDEX IF NOT EXISTS vote_tallies_by_launch ON vote_tallies (launch);
+CREATE TABLE IF NOT EXISTS vote_receipts (
+    governor TEXT NOT NULL,
+    proposal_id INTEGER NOT NULL,
+    token_id TEXT NOT NULL,
+    launch TEXT,
+    voter TEXT NOT NULL,
+    support INTEGER NOT NULL,
+    votes TEXT NOT NULL,
+    PRIMARY KEY (governor, proposal_id, token_id)
+);
+CREATE INDEX IF NOT EXISTS vote_receipts_by_voter ON vote_receipts (voter);
+CREATE TABLE IF NOT EXISTS market_bids (
+    token_id TEXT NOT NULL,
+    bidder TEXT NOT NULL,
+    launch TEXT,
+    amount TEXT NOT NULL,
+    currency TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    sell_on_share TEXT NOT NULL,
+    PRIMARY KEY (token_id, bidder)
+);
+CREATE INDEX IF NOT EXISTS market_bids_by_bidder ON market_bids (bidder);
+CREATE TABLE IF NOT EXISTS market_asks (
+    token_id TEXT PRIMARY KEY,
+    launch TEXT,
+    amount TEXT,
+    currency TEXT,
+    replaced TEXT NOT NULL
+);
+"""
+
+
+class Table:
+    """
+    Write-back cache of the rows of one derived table touched by a batch
+    @param keys the primary key columns
+    @param columns the other columns with their zero value, int zeros of amount columns are stored as text
+    @param amounts the columns holding uint256 amounts
+    """
+
+    def __init__(self, conn, name, keys, columns, amounts=()):
+        self.conn = conn
+        self.name = name
+        self.keys = keys
+        self.columns = columns
+        self.amounts = amounts
+        self.rows = {}
+        # keys without a stored row, written on flush only if they no longer hold the defaults
+        self.created = set()
+
+    def load(self, key):
+        where = " AND ".join(f"{k} = ?" for k in self.keys)
+        row = self.conn.execute(
+            f"SELECT * FROM {self.name} WHERE {where}", key
+        ).fetchone()
+        if row is None:
+            return None
+        row = {c: row[c] for c in self.columns}
+        for column in self.amounts:
+            row[column] = int(row[column])
+        return row
+
+    def find(self, key):
+        """
+        Row of a key, or None if it has none. Unlike get, a missing row is not created
+        """
+        if key in self.rows:
+            return self.rows[key]
+        row = self.load(key)
+        if row is not None:
+            self.rows[key] = row
+        return row
+
+    def get(self, key):
+        if self.rows.get(key, 0) is None:
+            # recreated after being deleted in the same batch
+            self.rows[key] = dict(self.columns)
+        if key not in self.rows:
+            row = self.load(key)
+            if row is None:
+                row = dict(self.columns)
+                self.created.add(key)
+            self.rows[key] = row
+        return self.rows[key]
+
+    def delete(self, key):
+        self.rows[key] = None
+
+    def flush(self):
+        where = " AND ".join(f"{k} = ?" for k in self.keys)
+        columns = ", ".join(self.keys + tuple(self.columns))
+        values = ", ".join("?" for _ in self.keys + tuple(self.columns))
+        for key, row in self.rows.items():
+            if row is None:
+                self.conn.execute(f"DELETE FROM {self.name} WHERE {where}", key)
+                continue
+            if key in self.created and row == self.columns:
+                continue
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO {self.name} ({columns}) VALUES ({values})",
+                key
+                + tuple(
+                    str(row[c]) if c in self.amounts else row[c] for c in self.columns
+                ),
+            )
+
+
+def derived_tables(conn):
+    return {
+        "launches": Table(
+            conn,
+            "launch_aggregates",
+            ("launch",),
+            {
+                "raised": 0,
+                "deposits": 0,
+                "supporters": 0,
+                "launcher_tapped": 0,
+                "launcher_taps": 0,
+                "supporter_tapped": 0,
+                "supporter_taps": 0,
+                "refunded": 0,
+                "refunds": 0,
+                "withdrawn": 0,
+            },
+            ("raised", "launcher_tapped", "supporter_tapped", "refunded", "withdrawn"),
+        ),
+        "supporters": Table(
+            conn,
+            "launch_supporters",
+            ("launch", "supporter"),
+            {"provided": 0, "deposits": 0},
+            ("provided",),
+        ),
+        "bonds": Table(
+            conn,
+            "bond_aggregates",
+            ("token_id",),
+            {
+                "launch": None,
+                "tapped": 0,
+                "taps": 0,
+                "remaining": 0,
+                "refunded": 0,
+                "refunds": 0,
+                "refund_cleared": 0,
+            },
+            ("tapped", "remaining", "refunded", "refund_cleared"),
+        ),
+        "owners": Table(
+            conn, "bond_owners", ("token_id",), {"launch": None, "owner": None}
+        ),
+        "tallies": Table(
+            conn,
+            "vote_tallies",
+            ("governor", "proposal_id"),
+            {"launch": None, "for_votes": 0, "against_votes": 0, "voters": 0},
+            ("for_votes", "against_votes"),
+        ),
+        "receipts": Table(
+            conn,
+            "vote_receipts",
+            ("governor", "proposal_id", "token_id"),
+            {"launch": None, "voter": None, "support": 0, "votes": 0},
+            ("votes",),
+        ),
+        "bids": Table(
+            conn,
+            "market_bids",
+            ("token_id", "bidder"),
+            {
+                "launch": None,
+                "amount": 0,
+                "currency": None,
+                "recipient": None,
+                "sell_on_share": 0,
+            },
+            ("amount", "sell_on_share"),
+        ),
+        # an open ask has an amount, asks overwritten by AskCreated are kept in replaced to be restored on rollback
+        "asks": Table(
+            conn,
+            "market_asks",
+            ("token_id",),
+            {"launch": None, "amount": None, "currency": None, "replaced": "[]"},
+        ),
+    }
+
+
+def sale_price(conn, launch):
+    row = conn.execute(
+        "SELECT sale_price FROM launches WHERE launch = ?", (launch,)
+    ).fetchone()
+    return 0 if row is None else int(row[0])
+
+
+def set_bid(bids, launch, token_id, bid):
+    amount, currency, bidder, recipient, sell_on_share = bid
+    bids.get((token_id, bidder)).update(
+        launch=launch,
+        amount=amount,
+        currency=currency,
+        recipient=recipient,
+        sell_on_share=sell_on_share[0],
+    )
+
+
+def set_ask(asks, launch, token_id, ask):
+    amount, currency = ask if ask is not None else (None, None)
+    if amount == 0 and currency == ZERO_ADDRESS:
+        amount, currency = None, None
+    asks.get((token_id,)).update(
+        launch=launch, amount=None if amount is None else str(amount), currency=currency
+    )
+
+
+def apply_events(conn, events, sign=1):
+    """
+    Update the derived tables with a list of events, sign=-1 undoes them
+    @param conn sqlite connection, the caller owns the transaction
+    @param events list of (address, event, launch, args) tuples in block order
+    """
+    tables = derived_tables(conn)
+    launches = tables["launches"]
+    bonds = tables["bonds"]
+    for address, name, launch, args in events if sign > 0 else reversed(events):
+        if name == "SupporterFundsDeposited":
+            totals = launches.get((launch,))
+            supporter = tables["supporters"].get((launch, args["sender"]))
+            totals["raised"] += sign * args["amount"]
+            totals["deposits"] += sign
+            if supporter["deposits"] == 0:
+                totals["supporters"] += 1
+            supporter["provided"] += sign * args["amount"]
+            supporter["deposits"] += sign
+            if supporter["deposits"] == 0:
+                totals["supporters"] -= 1
+                tables["supporters"].delete((launch, args["sender"]))
+        elif name == "LauncherFundsTapped":
+            totals = launches.get((launch,))
+            totals["launcher_tapped"] += sign * args["amount"]
+            totals["launcher_taps"] += sign
+        elif name == "FundsWithdrawn":
+            launches.get((launch,))["withdrawn"] += sign * args["amount"]
+        elif name == "TokenMinted":
+            key = (str(args["tokenId"]),)
+            if sign < 0:
+                bonds.delete(key)
+                continue
+            bond = bonds.get(key)
+            bond["launch"] = launch
+            # the bond can tap the launch tokens bought with everything its owner provided, unknown if the deposits
+            # were not indexed
+            supporter = tables["supporters"].find((launch, args["owner"]))
+            if supporter is not None:
+                bond["remaining"] = supporter["provided"] * sale_price(conn, launch) // 10 ** 18
+        elif name == "SupporterFundsTapped":
+            totals = launches.get((launch,))
+            totals["supporter_tapped"] += sign * args["amount"]
+            totals["supporter_taps"] += sign
+            bond = bonds.get((str(args["tokenId"]),))
+            bond["tapped"] += sign * args["amount"]
+            bond["taps"] += sign
+            bond["remaining"] -= sign * args["amount"]
+        elif name == "RefundClaimed":
+            totals = launches.get((launch,))
+            totals["refunded"] += sign * args["amount"]
+            totals["refunds"] += sign
+            bond = bonds.get((str(args["tokenId"]),))
+            bond["refunded"] += sign * args["amount"]
+            bond["refunds"] += sign
+            # a refund clears the tappable balance, undoing the first refund of a bond restores it
+            if sign > 0:
+                bond["refund_cleared"] += bond["remaining"]
+                bond["remaining"] = 0
+            elif bond["refunds"] == 0:
+                bond["remaining"] += bond["refund_cleared"]
+                bond["refund_cleared"] = 0
+        elif name == "Transfer" and "tokenId" in args:
+            owner = args["to"] if sign > 0 else args["from"]
+            key = (str(args["tokenId"]),)
+            if owner == ZERO_ADDRESS:
+                tables["owners"].delete(key)
+            else:
+                tables["owners"].get(key).update(launch=launch, owner=owner)
+        elif name == "VoteCast":
+            tally = tables["tallies"].get((address, args["proposalId"]))
+            tally["launch"] = launch
+            tally["for_votes" if args["support"] else "against_votes"] += sign * args["votes"]
+            tally["voters"] += sign
+            key = (address, args["proposalId"], str(args["ventureBondId"]))
+            if sign > 0:
+                tables["receipts"].get(key).update(
+                    launch=launch,
+                    voter=args["voter"],
+                    support=int(args["support"]),
+                    votes=args["votes"],
+                )
+            else:
+                tables["receipts"].delete(key)
+        elif name == "BidCreated":
+            token_id = str(args["tokenId"])
+            if sign > 0:
+                set_bid(tables["bids"], launch, token_id, args["bid"])
+            else:
+                tables["bids"].delete((token_id, args["bid"][2]))
+        elif name in ("BidRemoved", "BidFinalized"):
+            token_id = str(args["tokenId"])
+            if sign > 0:
+                tables["bids"].delete((token_id, args["bid"][2]))
+            else:
+                set_bid(tables["bids"], launch, token_id, args["bid"])
+        elif name == "AskCreated":
+            token_id = str(args["tokenId"])
+            ask = tables["asks"].get((token_id,))
+            replaced = json.loads(ask["replaced"])
+            if sign > 0:
+                replaced.append([ask["amount"], ask["currency"]])
+                set_ask(tables["asks"], launch, token_id, args["ask"])
+            else:
+                amount, currency = replaced.pop()
+                ask.update(amount=amount, currency=currency)
+            ask["replaced"] = json.dumps(replaced)
+        elif name == "AskRemoved":
+            token_id = str(args["tokenId"])
+            set_ask(tables["asks"], launch, token_id, None if sign > 0 else args["ask"])
+
+    for table in tables.values():
+        table.flush()
@@ -0,0 +1,132 @@
+"""
+Point in time queries over launch state. The state of a launch is folded from its events; compacted snapshots of
+the folded state are written every SNAPSHOT_INTERVAL blocks that saw events of the launch, so a query replays only
+the events between the nearest snapshot and the block asked for.
+
+The launcher tap rate follows the contract: it is zero until the LaunchFinalized of the launch, set to the rate it
+logs and replaced by every TapIncreased.
+"""
+
+import json
+
+SNAPSHOT_INTERVAL = 1000
+
+
+def initial_state():
+    return {
+        "raised": 0,
+        "launcher_tapped": 0,
+        "supporter_tapped": 0,
+        "refunded": 0,
+        "finalized": False,
+        "successful": False,
+        "tap_rate": 0,
+        "refund_mode": False,
+        "vault_activated": False,
+        "vault_id": 0,
+    }
+
+
+def fold(state, name, args):
+    """
+    Apply one event of a launch to its state
+    """
+    if name == "SupporterFundsDeposited":
+        state["raised"] += args["amount"]
+    elif name == "LauncherFundsTapped":
+        state["launcher_tapped"] += args["amount"]
+    elif name == "SupporterFundsTapped":
+        state["supporter_tapped"] += args["amount"]
+    elif name == "RefundClaimed":
+        state["refunded"] += args["amount"]
+    elif name == "LaunchFinalized":
+        state["finalized"] = True
+        state["successful"] = args["successful"]
+        state["tap_rate"] = args["launcherTapRate"]
+    elif name == "TapIncreased":
+        state["tap_rate"] = args["newRate"]
+    elif name == "RefundModeInitiated":
+        state["refund_mode"] = True
+    elif name == "VaultFundsDeposited":
+        state["vault_activated"] = True
+        state["vault_id"] = args["vaultId"]
+    elif name == "VaultExited":
+        state["vault_activated"] = False
+    return state
+
+
+class LaunchHistory:
+    """
+    Time travel queries over the launches of an EventStore
+    @param store EventStore kept up to date by an Indexer
+    @param interval number of blocks between the snapshots of a launch
+    """
+
+    def __init__(self, store, interval=SNAPSHOT_INTERVAL):
+        self.store = store
+        self.conn = store.conn
+        self.interval = interval
+
+    def params(self, launch):
+        row = self.conn.execute(
+            "SELECT * FROM launches WHERE launch = ?", (launch,)
+        ).fetchone()
+        if row is None:
+            raise ValueError(f"Unknown launch {launch}")
+        return dict(row)
+
+    def snapshot_before(self, launch, block_number):
+        row = self.conn.execute(
+            "SELECT block_number, state FROM launch_snapshots WHERE launch = ? AND block_number <= ? "
+            "ORDER BY block_number DESC LIMIT 1",
+            (launch, block_number),
+        ).fetchone()
+        if row is None:
+            return -1, initial_state()
+        return row["block_number"], json.loads(row["state"])
+
+    def events(self, launch, after, up_to):
+        return self.conn.execute(
+            "SELECT block_number, event, args FROM events "
+            "WHERE launch = ? AND block_number > ? AND block_number <= ? "
+            "ORDER BY block_number, log_index",
+            (launch, after, up_to),
+        )
+
+    def state_at(self, launch, block_number):
+        """
+        State of a launch after every event up to and including block_number
+        """
+        # unknown launches raise rather than reading as a launch without events
+        self.params(launch)
+        snapshot_block, state = self.snapshot_before(launch, block_number)
+        for _, name, args in self.events(launch, snapshot_block, block_number):
+            fold(state, name, json.loads(args))
+        return state
+
+    def compact(self):
+        """
+        Write the snapshots due since the last compaction for every launch, up to the cursor of the store
+        @return the number of snapshots written
+        """
+        cursor = self.store.get_cursor()
+        if cursor is None:
+            return 0
+        snapshots = []
+        for launch in [l["launch"] for l in self.store.launches()]:
+            snapshot_block, state = self.snapshot_before(launch, cursor)
+            # a snapshot is taken at the end of every interval the launch had events in
+            pending = None
+            for block_number, name, args in self.events(launch, snapshot_block, cursor):
+                boundary = (block_number // self.interval + 1) * self.interval - 1
+                if pending is not None and boundary != pending:
+                    snapshots.append((launch, pending, json.dumps(state)))
+                fold(state, name, json.loads(args))
+                pending = boundary
+            if pending is not None and pending <= cursor:
+                snapshots.append((launch, pending, json.dumps(state)))
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO launch_snapshots VALUES (?, ?, ?)", snapshots
+            )
+        return len(snapshots)
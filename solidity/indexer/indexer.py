@@ -0,0 +1,318 @@
+"""
+Incremental indexer for the events of a Polylaunch system. The PolylaunchSystem (which emits every LaunchLogger
+event), the VentureBond, the Market and the governor of every launch are followed; the VentureBond and Market are
+discovered from PolylaunchSystemLaunched and the governors from BasicLaunchCreated, so indexing from the block the
+system was deployed in needs nothing but the system address.
+"""
+
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+from indexer.decoder import build_decoders, decode_log, to_hex
+
+# errors raised by nodes when a log query covers too many blocks or results
+RANGE_ERRORS = (ValueError, OSError)
+LAUNCH_ID_SHIFT = 128
+# times a batch is collected again when its logs and headers come from different chains
+MAX_RECOLLECTS = 5
+# system events that create the contracts followed, kept whatever launch they name
+CREATION_EVENTS = ("PolylaunchSystemLaunched", "BasicLaunchCreated")
+# launch parameters that are fixed at creation but not logged, read once when the launch is discovered
+LAUNCH_PARAMS = ("salePrice", "softCap", "launchEndTime", "launcherVestingPeriod")
+LAUNCH_PARAM_SELECTORS = {
+    name: "0x" + function_signature_to_4byte_selector(f"{name}()").hex()
+    for name in LAUNCH_PARAMS
+}
+
+
+def launch_address_arg(args):
+    return args.get("launchAddress", args.get("basicLaunchAddress"))
+
+
+class Indexer:
+    """
+    Follows a Polylaunch system and writes its decoded events to an EventStore
+    @param web3 connected web3 instance
+    @param store EventStore the events are written to
+    @param system_address address of the PolylaunchSystem
+    @param abis dict of contract kind ("system", "venture_bond", "market", "governor") to abi
+    @param start_block block to start from when the store has no cursor yet
+    @param batch_size initial number of blocks per eth_getLogs query, adapted to what the node accepts
+    @param confirmations number of blocks behind the head to stop at
+    @param decoders topic to decoder tables built by build_decoders, used instead of abis when given
+    @param columns optional ColumnStore (indexer.columnar) that every committed batch is also appended to
+    """
+
+    def __init__(
+        self,
+        web3,
+        store,
+        system_address,
+        abis,
+        start_block=0,
+        batch_size=2000,
+        max_batch_size=10000,
+        confirmations=0,
+        decoders=None,
+        columns=None,
+    ):
+        self.web3 = web3
+        self.store = store
+        self.system = to_checksum_address(system_address)
+        self.decoders = decoders or build_decoders(abis)
+        self.start_block = start_block
+        self.batch_size = batch_size
+        self.max_batch_size = max_batch_size
+        self.confirmations = confirmations
+        self.contracts = store.contracts()
+        self.launch_by_id = {l["launch_id"]: l["launch"] for l in store.launches()}
+        self.columns = columns
+        if columns is not None:
+            columns.catch_up(store)
+
+    def head(self):
+        return self.web3.eth.blockNumber - self.confirmations
+
+    def next_block(self):
+        cursor = self.store.get_cursor()
+        return self.start_block if cursor is None else cursor + 1
+
+    def sync(self, to_block=None):
+        """
+        Index every block from the cursor up to to_block (the head by default), one transaction per batch
+        @return the number of events written
+        """
+        to_block = self.head() if to_block is None else to_block
+        start = self.next_block()
+        written = 0
+        while True:
+            rolled_back = self.check_reorg()
+            if rolled_back is not None:
+                start = rolled_back + 1
+                to_block = min(to_block, self.head())
+            if start > to_block:
+                break
+            batch_size = self.batch_size
+            end = min(start + batch_size - 1, to_block)
+            written += self.index_range(start, end)
+            if self.batch_size == batch_size:
+                self.batch_size = min(batch_size * 2, self.max_batch_size)
+            start = end + 1
+        return written
+
+    def index_range(self, start, end):
+        events, contracts, launches, blocks = self.collect(start, end)
+        self.commit(end, events, contracts, launches, blocks)
+        return len(events)
+
+    def commit(self, end, events, contracts=(), launches=(), blocks=()):
+        # the column store follows the sqlite one, a batch lost in between is caught up on the next start
+        self.store.commit_batch(end, events, contracts, launches, blocks)
+        if self.columns is not None:
+            self.columns.append(end, events, blocks)
+
+    def collect(self, start, end):
+        """
+        Fetch and decode the events of a block range without writing them. The logs and the block headers are
+        separate queries, so a reorg in between would checkpoint the new chain under events of the orphaned one;
+        every log is checked against the header of its block and the batch is collected again on a mismatch.
+        @return (events, contracts, launches, blocks) rows in the format of EventStore.commit_batch
+        """
+        known_contracts = dict(self.contracts)
+        known_launches = dict(self.launch_by_id)
+        for _ in range(MAX_RECOLLECTS):
+            events, contracts, launches, log_hashes = self.fetch(start, end)
+            # blocks with events are checkpointed for their timestamps, and the last block of the range so the
+            # next batch can be linked to it
+            block_numbers = sorted({e[0] for e in events} | {end})
+            blocks = [
+                (block_number, to_hex(header["hash"]), to_hex(header["parentHash"]), header["timestamp"])
+                for block_number, header in zip(block_numbers, self.get_blocks(block_numbers))
+            ]
+            headers = {block[0]: block[1] for block in blocks}
+            if all(headers[block_number] == block_hash for block_number, block_hash in log_hashes):
+                events.sort(key=lambda e: (e[0], e[1]))
+                return events, contracts, launches, blocks
+            # forget the contracts the orphaned logs created before fetching the batch again
+            self.contracts = dict(known_contracts)
+            self.launch_by_id = dict(known_launches)
+        raise ValueError(f"Logs of blocks {start} to {end} do not match their headers")
+
+    def fetch(self, start, end):
+        """
+        Fetch and decode the events of a block range
+        @return (events, contracts, launches, log_hashes) where log_hashes is the set of (block number, block hash)
+        pairs the events were read from
+        """
+        contracts = []
+        launches = []
+        if self.system not in self.contracts:
+            contracts.append((self.system, "system", None, start))
+            self.contracts[self.system] = ("system", None)
+
+        # system logs first, they may add the contracts whose logs are fetched next
+        events = []
+        log_hashes = set()
+        # anyone can call the LaunchLogger functions, events of launches the factory did not create are dropped
+        known_launches = set(self.launch_by_id.values())
+        for log in self.get_logs([self.system], start, end):
+            row = self.decode("system", log)
+            if row is None:
+                continue
+            if row[4] not in CREATION_EVENTS and row[5] is not None and row[5] not in known_launches:
+                continue
+            events.append(row)
+            log_hashes.add((row[0], to_hex(log["blockHash"])))
+            self.track(row, contracts, launches)
+            if row[4] == "BasicLaunchCreated":
+                known_launches.add(row[5])
+
+        followed = [a for a, (kind, _) in self.contracts.items() if kind != "system"]
+        if followed:
+            for log in self.get_logs(followed, start, end):
+                kind = self.contracts[to_checksum_address(log["address"])][0]
+                row = self.decode(kind, log)
+                if row is not None:
+                    events.append(row)
+                    log_hashes.add((row[0], to_hex(log["blockHash"])))
+
+        return events, contracts, launches, log_hashes
+
+    def check_reorg(self):
+        """
+        Check that the chain still builds on the last indexed block. On a mismatch the store is rolled back to the
+        newest checkpoint that is still on the chain.
+        @return the block the store was rolled back to, or None if the chain was not reorganised
+        """
+        cursor = self.store.get_cursor()
+        expected = None if cursor is None else self.store.block_hash(cursor)
+        if expected is None:
+            return None
+        if self.web3.eth.blockNumber > cursor:
+            # the first unindexed block must name the last indexed one as its parent
+            if to_hex(self.web3.eth.getBlock(cursor + 1)["parentHash"]) == expected:
+                return None
+        elif self.on_chain(cursor, expected):
+            return None
+
+        ancestor = self.start_block - 1
+        for number, block_hash in self.store.checkpoints(cursor - 1):
+            if self.on_chain(number, block_hash):
+                ancestor = number
+                break
+        self.store.rollback(ancestor)
+        if self.columns is not None:
+            self.columns.rollback(ancestor)
+        self.contracts = self.store.contracts()
+        self.launch_by_id = {l["launch_id"]: l["launch"] for l in self.store.launches()}
+        return ancestor
+
+    def on_chain(self, block_number, block_hash):
+        if block_number > self.web3.eth.blockNumber:
+            return False
+        return to_hex(self.web3.eth.getBlock(block_number)["hash"]) == block_hash
+
+    def discover(self, start, end):
+        """
+        Find the contracts created by the system in a block range from its creation events alone, so the
+        range can then be fetched in any order
+        """
+        contracts = []
+        launches = []
+        topics = [
+            decoder.topic
+            for decoder in self.decoders["system"].values()
+            if decoder.name in CREATION_EVENTS
+        ]
+        if self.system not in self.contracts:
+            contracts.append((self.system, "system", None, start))
+            self.contracts[self.system] = ("system", None)
+        for log in self.get_logs([self.system], start, end, [topics]):
+            row = self.decode("system", log)
+            if row is not None:
+                self.track(row, contracts, launches)
+        self.store.add_contracts(contracts, launches)
+        return len(launches)
+
+    def track(self, row, contracts, launches):
+        # follow the contracts created by a system event
+        name, args = row[4], row[6]
+        if name == "PolylaunchSystemLaunched":
+            for kind, key in (("venture_bond", "ventureBondAddress"), ("market", "marketAddress")):
+                contracts.append((args[key], kind, None, row[0]))
+                self.contracts[args[key]] = (kind, None)
+        elif name == "BasicLaunchCreated":
+            launch = args["basicLaunchAddress"]
+            governor = args["governorAddress"]
+            contracts.append((governor, "governor", launch, row[0]))
+            self.contracts[governor] = ("governor", launch)
+            if args["launchId"] not in self.launch_by_id:
+                params = self.launch_params(launch)
+                launches.append(
+                    (
+                        args["launchId"],
+                        launch,
+                        governor,
+                        args["ipfsHash"],
+                        str(params["salePrice"]),
+                        str(params["softCap"]),
+                        params["launchEndTime"],
+                        params["launcherVestingPeriod"],
+                        row[0],
+                    )
+                )
+            self.launch_by_id[args["launchId"]] = launch
+
+    def launch_params(self, launch):
+        return {
+            name: int.from_bytes(
+                self.web3.eth.call({"to": launch, "data": selector}), "big"
+            )
+            for name, selector in LAUNCH_PARAM_SELECTORS.items()
+        }
+
+    def get_blocks(self, block_numbers):
+        # a SyncRPC node fetches the headers in batch requests, web3 one at a time
+        if hasattr(self.web3.eth, "getBlocks"):
+            return self.web3.eth.getBlocks(block_numbers)
+        return [self.web3.eth.getBlock(block_number) for block_number in block_numbers]
+
+    def get_logs(self, addresses, start, end, topics=None):
+        # split the range in half whenever the node refuses it, until single blocks
+        params = {"fromBlock": start, "toBlock": end, "address": addresses}
+        if topics is not None:
+            params["topics"] = topics
+        try:
+            return self.web3.eth.getLogs(params)
+        except RANGE_ERRORS:
+            if start == end:
+                raise
+            self.batch_size = max(1, (end - start + 1) // 2)
+            middle = (start + end) // 2
+            return self.get_logs(addresses, start, middle, topics) + self.get_logs(
+                addresses, middle + 1, end, topics
+            )
+
+    def decode(self, kind, log):
+        decoded = decode_log(self.decoders, kind, log)
+        if decoded is None:
+            return None
+        name, args = decoded
+        address = to_checksum_address(log["address"])
+        return (
+            log["blockNumber"],
+            log["logIndex"],
+            to_hex(log["transactionHash"]),
+            address,
+            name,
+            self.launch_of(kind, address, args),
+            args,
+        )
+
+    def launch_of(self, kind, address, args):
+        if kind == "system":
+            return launch_address_arg(args)
+        if kind == "governor":
+            return self.contracts[address][1]
+        token_id = args.get("tokenId")
+        if token_id is None:
+            return None
+        return self.launch_by_id.get(token_id >> LAUNCH_ID_SHIFT)
@@ -0,0 +1,221 @@
+"""
+Asynchronous JSON-RPC client for the Python tooling. Requests share a pool of keep-alive connections, calls are sent
+as JSON-RPC batch arrays, at most a fixed number of requests are in flight at once and requests that fail in
+transit or are throttled by the node are retried with exponential backoff.
+
+RPCClient is the asyncio interface. SyncRPC wraps it in the subset of the web3 interface the Indexer uses, and its
+calls method is how the keeper batches its keeperStatus reads.
+"""
+
+import asyncio
+import itertools
+import random
+import aiohttp
+
+# http statuses of a node that is overloaded or rate limiting, worth retrying
+RETRY_STATUSES = (429, 502, 503, 504)
+# quantities of eth_getLogs and eth_getBlockByNumber results returned as ints, like web3 does
+LOG_QUANTITIES = ("blockNumber", "logIndex", "transactionIndex")
+BLOCK_QUANTITIES = ("number", "timestamp", "gasLimit", "gasUsed", "difficulty", "size")
+
+
+class RPCError(ValueError):
+    """
+    Error returned by the node for a call, a ValueError like the ones web3 raises
+    """
+
+    def __init__(self, error):
+        self.code = error.get("code")
+        self.data = error.get("data")
+        super().__init__(f"{self.code}: {error.get('message')}")
+
+
+def quantity(value):
+    return hex(value) if isinstance(value, int) else value
+
+
+def parse_quantities(result, keys):
+    if result is None:
+        return None
+    return {k: int(v, 16) if k in keys and isinstance(v, str) else v for k, v in result.items()}
+
+
+class RPCClient:
+    """
+    Pooled, batching JSON-RPC client, use as an async context manager
+    @param endpoint_uri http endpoint of the node
+    @param connections size of the keep-alive connection pool
+    @param concurrency maximum number of requests in flight
+    @param batch_size maximum number of calls per batch request
+    @param retries number of retries of a request before giving up
+    @param backoff delay before the first retry in seconds, doubled on every retry
+    @param timeout total timeout of a request in seconds
+    """
+
+    def __init__(
+        self,
+        endpoint_uri,
+        connections=16,
+        concurrency=8,
+        batch_size=100,
+        retries=4,
+        backoff=0.2,
+        timeout=30,
+    ):
+        self.endpoint_uri = endpoint_uri
+        self.connections = connections
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.session = None
+        self.ids = itertools.count()
+        self.stats = {"requests": 0, "calls": 0, "retries": 0}
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def open(self):
+        self.semaphore = asyncio.Semaphore(self.concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.connections),
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    async def post(self, payload):
+        for attempt in range(self.retries + 1):
+            try:
+                async with self.semaphore:
+                    self.stats["requests"] += 1
+                    async with self.session.post(self.endpoint_uri, json=payload) as response:
+                        if response.status in RETRY_STATUSES:
+                            response.raise_for_status()
+                        if response.status >= 400:
+                            raise RPCError({"code": response.status, "message": response.reason})
+                        return await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt == self.retries:
+                    raise
+                self.stats["retries"] += 1
+                # jitter keeps the retries of concurrent requests from arriving together
+                await asyncio.sleep(self.backoff * 2 ** attempt * (1 + random.random()))
+
+    async def batch(self, calls, raise_errors=True):
+        """
+        Send calls in batch requests of at most batch_size calls, concurrently
+        @param calls list of (method, params) tuples
+        @param raise_errors whether an error returned for a call is raised, or returned as an RPCError in its place
+        @return the results in the order of the calls
+        """
+        chunks = [calls[i : i + self.batch_size] for i in range(0, len(calls), self.batch_size)]
+        results = await asyncio.gather(*(self._batch(chunk) for chunk in chunks))
+        results = [result for chunk in results for result in chunk]
+        if raise_errors:
+            for result in results:
+                if isinstance(result, RPCError):
+                    raise result
+        return results
+
+    async def _batch(self, calls):
+        ids = [next(self.ids) for _ in calls]
+        self.stats["calls"] += len(calls)
+        responses = await self.post(
+            [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": list(params)}
+                for i, (method, params) in zip(ids, calls)
+            ]
+        )
+        if isinstance(responses, dict):
+            # a batch refused as a whole is answered with a single error
+            raise RPCError(responses.get("error", {"message": str(responses)}))
+        by_id = {response["id"]: response for response in responses}
+        results = []
+        for i in ids:
+            response = by_id.get(i, {"error": {"message": f"No response to call {i} of the batch"}})
+            results.append(RPCError(response["error"]) if "error" in response else response["result"])
+        return results
+
+    async def request(self, method, params=()):
+        return (await self.batch([(method, params)]))[0]
+
+    async def block_number(self):
+        return int(await self.request("eth_blockNumber"), 16)
+
+    async def get_blocks(self, block_numbers):
+        """
+        Headers of blocks, without their transactions, with their quantities as ints
+        """
+        results = await self.batch(
+            [("eth_getBlockByNumber", (quantity(n), False)) for n in block_numbers]
+        )
+        return [parse_quantities(block, BLOCK_QUANTITIES) for block in results]
+
+    async def get_logs(self, params):
+        params = {k: quantity(v) for k, v in params.items()}
+        return [
+            parse_quantities(log, LOG_QUANTITIES)
+            for log in await self.request("eth_getLogs", (params,))
+        ]
+
+    async def calls(self, transactions, block="latest", raise_errors=True):
+        """
+        eth_call every transaction at the same block
+        @param transactions list of {"to": ..., "data": ...} dicts
+        @return the return data of every call as bytes, or an RPCError for the reverted ones if not raise_errors
+        """
+        results = await self.batch(
+            [("eth_call", (tx, quantity(block))) for tx in transactions], raise_errors
+        )
+        return [
+            r if isinstance(r, RPCError) else bytes.fromhex(r[2:]) for r in results
+        ]
+
+
+class SyncRPC:
+    """
+    Blocking wrapper of an RPCClient with the web3 calls the Indexer makes, pass it to an Indexer as its web3
+    @param endpoint_uri http endpoint of the node
+    @param kwargs options of the RPCClient
+    """
+
+    def __init__(self, endpoint_uri, **kwargs):
+        self.loop = asyncio.new_event_loop()
+        self.client = RPCClient(endpoint_uri, **kwargs)
+        self.run(self.client.open())
+        self.eth = self
+
+    def run(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
+
+    def close(self):
+        self.run(self.client.close())
+        self.loop.close()
+
+    @property
+    def blockNumber(self):
+        return self.run(self.client.block_number())
+
+    def getBlock(self, block_number):
+        return self.getBlocks([block_number])[0]
+
+    def getBlocks(self, block_numbers):
+        return self.run(self.client.get_blocks(block_numbers))
+
+    def getLogs(self, params):
+        return self.run(self.client.get_logs(params))
+
+    def call(self, transaction, block="latest"):
+        return self.calls([transaction], block)[0]
+
+    def calls(self, transactions, block="latest", raise_errors=True):
+        return self.run(self.client.calls(transactions, block, raise_errors))
@@ -0,0 +1,269 @@
+"""
+SQLite store for the decoded events of a Polylaunch system. Every batch of events is written in a single
+transaction together with the block cursor, so an interrupted indexer resumes from the last committed batch.
+"""
+
+import json
+import sqlite3
+from indexer.derived import SCHEMA as DERIVED_SCHEMA, apply_events, derived_tables
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursor (
+    name TEXT PRIMARY KEY,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS contracts (
+    address TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    launch TEXT,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS launches (
+    launch_id INTEGER PRIMARY KEY,
+    launch TEXT NOT NULL UNIQUE,
+    governor TEXT NOT NULL,
+    ipfs_hash TEXT NOT NULL,
+    sale_price TEXT NOT NULL,
+    soft_cap TEXT NOT NULL,
+    end_time INTEGER NOT NULL,
+    launcher_vesting INTEGER NOT NULL,
+    block_number INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS events (
+    block_number INTEGER NOT NULL,
+    log_index INTEGER NOT NULL,
+    tx_hash TEXT NOT NULL,
+    address TEXT NOT NULL,
+    event TEXT NOT NULL,
+    launch TEXT,
+    args TEXT NOT NULL,
+    PRIMARY KEY (block_number, log_index)
+);
+CREATE INDEX IF NOT EXISTS events_by_name ON events (event, block_number);
+CREATE INDEX IF NOT EXISTS events_by_launch ON events (launch, event);
+CREATE INDEX IF NOT EXISTS events_by_launch_block ON events (launch, block_number);
+CREATE TABLE IF NOT EXISTS blocks (
+    block_number INTEGER PRIMARY KEY,
+    hash TEXT NOT NULL,
+    parent_hash TEXT NOT NULL,
+    timestamp INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS launch_snapshots (
+    launch TEXT NOT NULL,
+    block_number INTEGER NOT NULL,
+    state TEXT NOT NULL,
+    PRIMARY KEY (launch, block_number)
+);
+"""
+
+
+def dumps(args):
+    # uint256 values do not fit sqlite integers, they are kept as json numbers in the args column
+    return json.dumps(args, separators=(",", ":"))
+
+
+class EventStore:
+    """
+    Event store backed by a sqlite database, use ":memory:" for a throwaway store
+    """
+
+    def __init__(self, path=":memory:"):
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self.conn.executescript(DERIVED_SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def get_cursor(self, name="events"):
+        row = self.conn.execute(
+            "SELECT block_number FROM cursor WHERE name = ?", (name,)
+        ).fetchone()
+        return None if row is None else row["block_number"]
+
+    def contracts(self):
+        return {
+            row["address"]: (row["kind"], row["launch"])
+            for row in self.conn.execute("SELECT * FROM contracts")
+        }
+
+    def commit_batch(self, to_block, events, contracts=(), launches=(), blocks=(), name="events"):
+        """
+        Write a batch of events, update the derived tables and move the cursor to to_block in one transaction
+        @param to_block the last block covered by the batch
+        @param events list of (block_number, log_index, tx_hash, address, event, launch, args) tuples
+        @param contracts list of (address, kind, launch, block_number) tuples discovered in the batch
+        @param launches list of (launch_id, launch, governor, ipfs_hash, sale_price, soft_cap, end_time,
+        launcher_vesting, block_number) tuples created in the batch
+        @param blocks list of (block_number, hash, parent_hash, timestamp) checkpoints of the batch
+        """
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO contracts VALUES (?, ?, ?, ?)", contracts
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO launches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", launches
+            )
+            events = self._new_events(events)
+            self.conn.executemany(
+                "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [e[:6] + (dumps(e[6]),) for e in events],
+            )
+            apply_events(self.conn, [e[3:] for e in events])
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO blocks VALUES (?, ?, ?, ?)", blocks
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cursor VALUES (?, ?)", (name, to_block)
+            )
+
+    def _new_events(self, events):
+        # events already in the store (e.g. a backfill over indexed blocks) must not be counted twice
+        if not events:
+            return events
+        existing = set(
+            self.conn.execute(
+                "SELECT block_number, log_index FROM events WHERE block_number BETWEEN ? AND ?",
+                (events[0][0], events[-1][0]),
+            )
+        )
+        return [e for e in events if (e[0], e[1]) not in existing]
+
+    def rollback(self, block_number, name="events"):
+        """
+        Remove everything indexed after block_number and undo its effect on the derived tables
+        """
+        with self.conn:
+            removed = [
+                (row["address"], row["event"], row["launch"], json.loads(row["args"]))
+                for row in self.conn.execute(
+                    "SELECT * FROM events WHERE block_number > ? ORDER BY block_number, log_index",
+                    (block_number,),
+                )
+            ]
+            apply_events(self.conn, removed, sign=-1)
+            for table in ("events", "contracts", "launches", "blocks", "launch_snapshots"):
+                self.conn.execute(
+                    f"DELETE FROM {table} WHERE block_number > ?", (block_number,)
+                )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO cursor VALUES (?, ?)", (name, block_number)
+            )
+        return len(removed)
+
+    def block_hash(self, block_number):
+        row = self.conn.execute(
+            "SELECT hash FROM blocks WHERE block_number = ?", (block_number,)
+        ).fetchone()
+        return None if row is None else row["hash"]
+
+    def checkpoints(self, before):
+        # stored block hashes at or below a block, newest first
+        return [
+            (row["block_number"], row["hash"])
+            for row in self.conn.execute(
+                "SELECT block_number, hash FROM blocks WHERE block_number <= ? ORDER BY block_number DESC",
+                (before,),
+            )
+        ]
+
+    def add_contracts(self, contracts, launches=()):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO contracts VALUES (?, ?, ?, ?)", contracts
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO launches VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", launches
+            )
+
+    def launches(self):
+        return [dict(row) for row in self.conn.execute("SELECT * FROM launches ORDER BY launch_id")]
+
+    def events(self, event=None, launch=None, from_block=0, to_block=None):
+        query = "SELECT * FROM events WHERE block_number >= ?"
+        params = [from_block]
+        if to_block is not None:
+            query += " AND block_number <= ?"
+            params.append(to_block)
+        if event is not None:
+            query += " AND event = ?"
+            params.append(event)
+        if launch is not None:
+            query += " AND launch = ?"
+            params.append(launch)
+        query += " ORDER BY block_number, log_index"
+        rows = []
+        for row in self.conn.execute(query, params):
+            row = dict(row)
+            row["args"] = json.loads(row["args"])
+            rows.append(row)
+        return rows
+
+    def launch_funding(self, launch):
+        totals = self.launch_aggregates(launch)
+        return (totals["raised"], totals["deposits"])
+
+    def launch_aggregates(self, launch):
+        return self._aggregates("launches", (launch,))
+
+    def bond_aggregates(self, token_id):
+        return self._aggregates("bonds", (str(token_id),))
+
+    def _aggregates(self, table, key):
+        row = derived_tables(self.conn)[table].get(key)
+        return dict(row)
+
+    def launch_supporters(self, launch):
+        return [
+            (row["supporter"], int(row["provided"]))
+            for row in self.conn.execute(
+                "SELECT supporter, provided FROM launch_supporters WHERE launch = ? ORDER BY supporter",
+                (launch,),
+            )
+        ]
+
+    def bond_owner(self, token_id):
+        row = self.conn.execute(
+            "SELECT owner FROM bond_owners WHERE token_id = ?", (str(token_id),)
+        ).fetchone()
+        return None if row is None else row["owner"]
+
+    def vote_tally(self, governor, proposal_id):
+        row = self.conn.execute(
+            "SELECT for_votes, against_votes, voters FROM vote_tallies WHERE governor = ? AND proposal_id = ?",
+            (governor, proposal_id),
+        ).fetchone()
+        return (0, 0, 0) if row is None else (int(row[0]), int(row[1]), row[2])
+
+    def portfolio(self, address):
+        """
+        Everything an address holds across launches, each part is an index lookup on the address
+        @return dict of deposits, bonds, bids, asks and votes rows
+        """
+        queries = {
+            "deposits": "SELECT launch, provided FROM launch_supporters WHERE supporter = ?",
+            "bonds": "SELECT token_id, launch FROM bond_owners WHERE owner = ?",
+            "bids": "SELECT token_id, launch, amount, currency, recipient FROM market_bids WHERE bidder = ?",
+            "asks": "SELECT a.token_id, a.launch, a.amount, a.currency FROM bond_owners o "
+            "JOIN market_asks a ON a.token_id = o.token_id WHERE o.owner = ? AND a.amount IS NOT NULL",
+            "votes": "SELECT governor, proposal_id, token_id, launch, support, votes FROM vote_receipts WHERE voter = ?",
+        }
+        portfolio = {}
+        for part, query in queries.items():
+            rows = [dict(row) for row in self.conn.execute(query, (address,))]
+            for row in rows:
+                for column in ("token_id", "provided", "amount", "votes"):
+                    if column in row:
+                        row[column] = int(row[column])
+                if "support" in row:
+                    row["support"] = bool(row["support"])
+            portfolio[part] = rows
+        return portfolio
+
+    def count(self, event=None):
+        if event is None:
+            return self.conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+        return self.conn.execute(
+            "SELECT COUNT(*) FROM events WHERE event = ?", (event,)
+        ).fetchone()[0]
@@ -0,0 +1,151 @@
+"""
+Vectorised projection of the tap schedules of VentureBonds and launchers, mirroring the integer arithmetic of
+LaunchUtils.getSupporterWithdrawableFunds and LaunchUtils.launcherTapDue so the results are exact to the wei.
+
+Amounts are (lo, hi) uint64 pairs as in the column store, so balances must fit in 128 bits. Tap rates must fit in
+64 bits and the seconds elapsed since the last withdrawal in 32 bits, which keeps rate * elapsed within 128 bits
+without leaving uint64 arithmetic. Every function broadcasts, pass times of shape (T, 1) against N bonds to get a
+(T, N) grid. Times before the last withdrawal count as no time elapsed, where the contracts would revert.
+"""
+
+import numpy as np
+from indexer.columnar import MASK_64, approximate_amounts, split_amounts
+
+MASK_32 = (1 << 32) - 1
+# completion time of the bonds that never vest fully
+NEVER = np.iinfo(np.uint64).max
+
+
+def uint64s(values, name):
+    try:
+        return np.asarray(values, dtype=np.uint64)
+    except OverflowError:
+        raise ValueError(f"{name} does not fit in 64 bits")
+
+
+def elapsed(now, since):
+    seconds = np.maximum(now, since) - since
+    if seconds.size and seconds.max() > MASK_32:
+        raise ValueError("More than 2**32 seconds elapsed")
+    return seconds
+
+
+def multiply(rate, seconds):
+    """
+    Exact product of uint64 rates and uint32 seconds as (lo, hi) uint64 arrays
+    """
+    low = (rate & MASK_32) * seconds
+    high = (rate >> 32) * seconds
+    lo = low + (high << 32)
+    hi = (high >> 32) + (lo < low)
+    return lo, hi
+
+
+def less(a_lo, a_hi, b_lo, b_hi):
+    return (a_hi < b_hi) | ((a_hi == b_hi) & (a_lo < b_lo))
+
+
+def minimum(a_lo, a_hi, b_lo, b_hi):
+    a_less = less(a_lo, a_hi, b_lo, b_hi)
+    return np.where(a_less, a_lo, b_lo), np.where(a_less, a_hi, b_hi)
+
+
+class BondSchedules:
+    """
+    Tap schedules of a set of VentureBonds, from the tapRate, lastWithdrawnTime and tappableBalance of each
+    @param tap_rate tokens per second of each bond
+    @param last_withdrawn last withdrawal time of each bond
+    @param tappable_balance python ints, or a (lo, hi) pair of uint64 arrays
+    @param successful whether the launch of each bond was successful, bonds of other launches never tap
+    """
+
+    def __init__(self, tap_rate, last_withdrawn, tappable_balance, successful=True):
+        self.tap_rate = np.where(successful, uint64s(tap_rate, "Tap rate"), np.uint64(0))
+        self.last_withdrawn = uint64s(last_withdrawn, "Last withdrawn time")
+        if isinstance(tappable_balance, tuple):
+            self.balance = tuple(uint64s(half, "Tappable balance") for half in tappable_balance)
+        else:
+            self.balance = split_amounts(list(tappable_balance))
+
+    @classmethod
+    def from_bonds(cls, bonds):
+        """
+        Schedules from PolylaunchLens.getBond results, or any dicts with the same keys
+        """
+        return cls(
+            [b["tapRate"] for b in bonds],
+            [b["lastWithdrawnTime"] for b in bonds],
+            [b["tappableBalance"] for b in bonds],
+            [b["successful"] for b in bonds],
+        )
+
+    def withdrawable(self, now):
+        """
+        What every bond could tap at the given times, as getSupporterWithdrawableFunds computes it
+        @return (lo, hi) uint64 arrays
+        """
+        due = multiply(self.tap_rate, elapsed(uint64s(now, "Time"), self.last_withdrawn))
+        return minimum(*due, *self.balance)
+
+    def fully_vested_at(self):
+        """
+        First time at which every bond could tap its whole tappable balance, NEVER for bonds with a balance and no
+        tap rate
+        """
+        rate = np.maximum(self.tap_rate, np.uint64(1))
+        # the float estimate is within a second of the exact ceiling, which the corrections below settle
+        estimate = np.ceil(approximate_amounts(*self.balance) / rate.astype(np.float64))
+        seconds = np.minimum(estimate, MASK_32).astype(np.uint64)
+        for _ in range(2):
+            short = less(*multiply(rate, seconds), *self.balance)
+            seconds = np.where(short & (seconds < MASK_32), seconds + np.uint64(1), seconds)
+            previous = np.where(seconds > 0, seconds - np.uint64(1), seconds)
+            enough = ~less(*multiply(rate, previous), *self.balance)
+            seconds = np.where(enough & (seconds > 0), previous, seconds)
+        unreachable = less(*multiply(rate, seconds), *self.balance)
+        empty = (self.balance[0] == 0) & (self.balance[1] == 0)
+        unreachable |= (self.tap_rate == 0) & ~empty
+        return np.where(unreachable, NEVER, self.last_withdrawn + seconds)
+
+
+class LauncherSchedules:
+    """
+    Tap schedules of a set of launches, as LaunchUtils.launcherTapDue computes them
+    @param launches dicts with the finalized, successful, refund_mode, tap_rate, total_funding, soft_cap,
+    vesting_period, end_time, available and last_withdrawn of each launch; tap_rate is only read once finalized
+    """
+
+    def __init__(self, launches):
+        # before finalizing the contract uses the rate finalize would set
+        rates = [
+            l["tap_rate"]
+            if l["finalized"]
+            else (l["total_funding"] // l["vesting_period"] if l["total_funding"] > l["soft_cap"] else 0)
+            for l in launches
+        ]
+        self.tap_rate = uint64s(rates, "Tap rate")
+        self.finalized = np.array([l["finalized"] for l in launches], dtype=bool)
+        self.paid_out = np.array(
+            [l["finalized"] and l["successful"] and not l["refund_mode"] for l in launches], dtype=bool
+        )
+        self.end_time = uint64s([l["end_time"] for l in launches], "End time")
+        self.last_withdrawn = uint64s([l["last_withdrawn"] for l in launches], "Last withdrawn time")
+        self.available = split_amounts([l["available"] for l in launches])
+
+    def tap_due(self, now):
+        """
+        What every launcher could tap at the given times
+        @return (lo, hi) uint64 arrays
+        """
+        now = uint64s(now, "Time")
+        tapping = np.where(self.finalized, self.paid_out, now > self.end_time)
+        rate = np.where(tapping, self.tap_rate, np.uint64(0))
+        due = multiply(rate, elapsed(now, self.last_withdrawn))
+        return minimum(*due, *self.available)
+
+
+def to_ints(lo, hi):
+    """
+    Python ints of (lo, hi) uint64 arrays of any shape, as nested lists
+    """
+    return (hi.astype(object) * (MASK_64 + 1) + lo.astype(object)).tolist()
@@ -9,6 +9,8 @@ interface BasicLaunchInterface {
 
     function launcher() external view returns (address);
 
+    function launchId() external view returns (uint256);
+
     function launcherTapRate() external view returns (uint256);
 
     function increaseTap(uint256 newRate) external;
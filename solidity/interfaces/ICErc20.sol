@@ -11,5 +11,6 @@ interface ICErc20 {
     function redeemUnderlying(uint) external returns (uint);
     function balanceOf(address) external view returns (uint256);
     function balanceOfUnderlying(address) external view returns (uint256);
+    function exchangeRateStored() external view returns (uint256);
 
 }
\ No newline at end of file
@@ -33,8 +33,8 @@ interface ILaunchFactory {
         uint256 _fixedSwapRate;
         // generic data for an NFT
         IVentureBond.MediaData _genericNftData;
-        // IPFS hash where launch details such as name, logo and description are stored
-        string _ipfsHash;
+        // sha2-256 digest of the IPFS content (CIDv0) where launch details such as name, logo and description are stored
+        bytes32 _ipfsHash;
     }
 
     function getVaultRegistryAddress() external returns (address);
@@ -1,9 +1,26 @@
 pragma solidity 0.7.4;
+pragma experimental ABIEncoderV2;
 
 /**
  * @title Interface for Aave
  */
 interface ILendingPool {
+    struct ReserveData {
+        uint256 configuration;
+        uint128 liquidityIndex;
+        uint128 variableBorrowIndex;
+        uint128 currentLiquidityRate;
+        uint128 currentVariableBorrowRate;
+        uint128 currentStableBorrowRate;
+        uint40 lastUpdateTimestamp;
+        address aTokenAddress;
+        address stableDebtTokenAddress;
+        address variableDebtTokenAddress;
+        address interestRateStrategyAddress;
+        uint8 id;
+    }
+
     function deposit(address, uint256, address, uint16) external;
     function withdraw(address, uint256, address) external returns (uint256);
+    function getReserveData(address) external view returns (ReserveData memory);
 }
\ No newline at end of file
@@ -5,8 +5,10 @@ import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
 interface IPolyVault {
     function _deposit(address, uint256, uint256, IERC20, address) external;
 
-    function _exitFromVault(address, IERC20, address) external;
+    function _exitFromVault(IERC20, address) external returns (uint256);
 
-    function _launcherYieldTap(address, uint256, IERC20, address, address) external;
+    function _launcherYieldTap(uint256, IERC20, address, address) external;
+
+    function _harvest(IERC20, address) external returns (uint256);
 
 }
\ No newline at end of file
@@ -0,0 +1,20 @@
+pragma solidity 0.7.4;
+
+import "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+
+/**
+ * @title Interface for PolyVault provider adapters
+ * @notice Every launch or PolyPool holds its position through its own clone of the registered adapter, which pulls
+ * the stable it is approved for on activate and returns everything to its owner on exit
+ */
+interface IPolyVaultAdapter {
+    function initialize(address owner) external;
+
+    function activate(address vault, IERC20 stable, uint256 amount) external;
+
+    function withdraw(address vault, IERC20 stable, uint256 amount, address recipient) external returns (uint256);
+
+    function exit(address vault, IERC20 stable) external;
+
+    function balanceOf(address vault, IERC20 stable, address account) external view returns (uint256);
+}
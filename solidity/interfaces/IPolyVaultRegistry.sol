@@ -7,9 +7,11 @@ interface IPolyVaultRegistry {
         uint256 vaultId;
         address vaultContractAddress;
         string vaultDesignation;
-        uint256 vaultProvider;
+        address vaultAdapter;
         bool vaultActive;
     }
 
     function getRegisteredVault(uint256 _vaultId) external view returns (Vault memory);
+
+    function getVaultDescriptor(uint256 _vaultId) external view returns (address vaultContractAddress, address vaultAdapter, bool vaultActive);
 }
\ No newline at end of file
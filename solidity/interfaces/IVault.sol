@@ -15,5 +15,5 @@ interface IVault {
     function depositAll() external;
     function withdraw(uint256) external returns (uint256);
     function withdraw() external returns (uint256);
-    function balanceOf(address) external returns (uint256);
+    function balanceOf(address) external view returns (uint256);
 }
\ No newline at end of file
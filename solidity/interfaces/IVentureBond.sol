@@ -12,8 +12,8 @@ interface IVentureBond {
 
 
     struct MediaData {
-        // A valid URI of the content represented by this token
-        string tokenURI;
+        // sha2-256 digest of the IPFS content represented by this token, the tokenURI is built from it on read
+        bytes32 tokenURIDigest;
         // A SHA256 hash of the content pointed to by metadataURI
         bytes32 metadataHash;
     }
@@ -120,8 +120,9 @@ interface IVentureBond {
 
     /**
      * @notice Authorise a launch to be able to interact with the VentureBond contract, i.e. minting, updating parameters etc.
+     * the launchId is encoded in the ids of the bonds the launch mints
      */
-    function authoriseLaunch(address launch) external;
+    function authoriseLaunch(address launch, uint256 launchId) external;
 
     /**
      * @notice Check which launch the provided tokenId is associated with
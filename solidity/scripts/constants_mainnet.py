@@ -21,44 +21,54 @@ ASK_PRICE = 200
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 BID_PRICE = 200
 stable_AMOUNT = 5000
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def cid_to_digest(cid):
+    # launches and bonds store the sha2-256 digest of a CIDv0 ("Qm...") rather than the string
+    value = 0
+    for char in cid:
+        value = value * 58 + BASE58_ALPHABET.index(char)
+    multihash = value.to_bytes(34, "big")
+    assert multihash[:2] == b"\x12\x20", "not a sha2-256 CIDv0"
+    return "0x" + multihash[2:].hex()
+
+
 GENERIC_NFT_DATA = [
-    "https://test",
+    "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
     "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
 ]
 SPECIAL_NFT_DATA = [
-    "https://test",
+    "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
     "194F55A6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
 ]
 BATCH_SPECIAL_NFT_DATA = [
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "d9a7e81efacc5660697cf4866d1af38e99275e02b2454b1dccaeb15adf66f575",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "f9a7e81efacc5660697cf4866d1af38e99275e02b2454b1dccaeb15adf66f575",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
 ]
 
 FAILURE_NFT_DATA = [
-    ["", "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078"],
-    [
-        "https://test",
-        "",
-    ],
-    ["https://test", "0"],
+    ["0x" + "00" * 32, "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078"],
+    ["80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782", "0x" + "00" * 32],
+    ["0x" + "00" * 32, "0x" + "00" * 32],
 ]
 
-DUMMY_IPFS_HASH = "QmSVw4PiXLNarB9jt27qQaT5uhGepnMgsn7Duba6pj7R9k"
+DUMMY_IPFS_HASH = cid_to_digest("QmSVw4PiXLNarB9jt27qQaT5uhGepnMgsn7Duba6pj7R9k")
@@ -0,0 +1,35 @@
+"""
+Index the events of a Polylaunch system into a sqlite database, resuming from the block the last run stopped at.
+
+SYSTEM_ADDRESS=0x... START_BLOCK=0 INDEX_DB=polylaunch.db brownie run scripts/index_events.py --network development
+"""
+
+import os
+from brownie import PolylaunchSystem, VentureBond, Market, GovernorAlpha, web3
+from indexer import EventStore, Indexer, LaunchHistory
+
+
+def system_abis():
+    return {
+        "system": PolylaunchSystem.abi,
+        "venture_bond": VentureBond.abi,
+        "market": Market.abi,
+        "governor": GovernorAlpha.abi,
+    }
+
+
+def main():
+    store = EventStore(os.environ.get("INDEX_DB", "polylaunch.db"))
+    indexer = Indexer(
+        web3,
+        store,
+        os.environ["SYSTEM_ADDRESS"],
+        system_abis(),
+        start_block=int(os.environ.get("START_BLOCK", 0)),
+        confirmations=int(os.environ.get("CONFIRMATIONS", 0)),
+    )
+    start = indexer.next_block()
+    written = indexer.sync()
+    snapshots = LaunchHistory(store).compact()
+    print(f"Indexed {written} events from block {start} to {store.get_cursor()}, {snapshots} new snapshots")
+    store.close()
@@ -0,0 +1,72 @@
+"""
+Keeper for launcher taps and vault harvesting. Picks the launches with something due using keeperStatus view
+calls over pages of launches, sent together through the batched RPC client, then taps and harvests them in one
+transaction each.
+
+FACTORY_ADDRESS=0x... KEEPER_ACCOUNT=keeper brownie run scripts/keeper.py --network mainnet
+"""
+
+import os
+from brownie import LaunchFactory, PolylaunchSystem, accounts, web3
+from indexer.rpc import SyncRPC
+
+# smallest amounts (in stable) worth the gas of including a launch in a batch
+MIN_TAP = 100e18
+MIN_HARVEST = 100e18
+# launch records read per getLaunchRecords call
+PAGE_SIZE = 500
+# launches per keeperStatus call, kept well under the gas limit of an eth_call
+STATUS_PAGE_SIZE = 200
+
+
+def known_launches(factory, page_size=PAGE_SIZE):
+    launches = []
+    for start in range(0, factory.launchIdCounter(), page_size):
+        launches += [record[0] for record in factory.getLaunchRecords(start, page_size)]
+    return launches
+
+
+def due_launches(system, launches, rpc, page_size=STATUS_PAGE_SIZE):
+    pages = [launches[start : start + page_size] for start in range(0, len(launches), page_size)]
+    results = rpc.calls(
+        [{"to": system.address, "data": system.keeperStatus.encode_input(page)} for page in pages]
+    )
+    tap_due = []
+    harvestable = []
+    for result in results:
+        page_tap_due, page_harvestable = system.keeperStatus.decode_output("0x" + result.hex())
+        tap_due += page_tap_due
+        harvestable += page_harvestable
+    to_tap = [l for l, due in zip(launches, tap_due) if due >= MIN_TAP]
+    to_harvest = [l for l, due in zip(launches, harvestable) if due >= MIN_HARVEST]
+    return to_tap, to_harvest
+
+
+def main():
+    factory = LaunchFactory.at(os.environ["FACTORY_ADDRESS"])
+    system = PolylaunchSystem.at(factory.polylaunchSystemAddress())
+    keeper = (
+        accounts.load(os.environ["KEEPER_ACCOUNT"])
+        if "KEEPER_ACCOUNT" in os.environ
+        else accounts[0]
+    )
+
+    launches = known_launches(factory)
+    if not launches:
+        print("No launches found")
+        return
+    rpc = SyncRPC(web3.provider.endpoint_uri)
+    try:
+        to_tap, to_harvest = due_launches(system, launches, rpc)
+    finally:
+        rpc.close()
+    print(
+        f"{len(launches)} launches, {len(to_tap)} due a tap, {len(to_harvest)} due a harvest"
+    )
+
+    if to_tap:
+        tx = system.batchLauncherTap(to_tap, {"from": keeper})
+        print(f"Tapped {sum(tx.return_value)} of {len(to_tap)} launches")
+    if to_harvest:
+        tx = system.batchHarvest(to_harvest, {"from": keeper})
+        print(f"Harvested {tx.return_value / 1e18} stable")
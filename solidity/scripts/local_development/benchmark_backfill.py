@@ -0,0 +1,43 @@
+"""
+Benchmark of the event indexer backfill against the local development network. Without SYSTEM_ADDRESS the chain
+is first seeded with deploy_and_run_multiple_sales.py (which needs a local ipfs daemon), ROUNDS times over.
+
+ROUNDS=5 brownie run scripts/local_development/benchmark_backfill.py
+"""
+
+import os
+import time
+from brownie import PolylaunchSystem, web3
+from indexer import EventStore, Indexer, backfill
+from scripts.index_events import system_abis
+from scripts.local_development import deploy_and_run_multiple_sales
+
+WORKER_COUNTS = [1, 2, 4, os.cpu_count()]
+
+
+def new_indexer(system):
+    return Indexer(web3, EventStore(), system, system_abis(), batch_size=500)
+
+
+def main():
+    if "SYSTEM_ADDRESS" in os.environ:
+        systems = [os.environ["SYSTEM_ADDRESS"]]
+    else:
+        for _ in range(int(os.environ.get("ROUNDS", 1))):
+            deploy_and_run_multiple_sales.main()
+        systems = [system.address for system in PolylaunchSystem]
+    head = web3.eth.blockNumber
+
+    print(f"\nBackfill of blocks 0 to {head} for {len(systems)} systems")
+    results = {}
+    started = time.perf_counter()
+    events = sum(new_indexer(system).sync(head) for system in systems)
+    results["incremental"] = time.perf_counter() - started
+    for workers in sorted(set(WORKER_COUNTS)):
+        started = time.perf_counter()
+        for system in systems:
+            backfill(new_indexer(system), web3.provider.endpoint_uri, head, workers)
+        results[f"backfill ({workers} workers)"] = time.perf_counter() - started
+
+    for name, elapsed in results.items():
+        print(f"{name:<28}{elapsed:>10.2f}s{events / elapsed:>12.0f} events/s")
@@ -0,0 +1,107 @@
+"""
+Benchmark of analytical scans over the columnar event store against the same scans over sqlite rows, on synthetic
+SupporterFundsDeposited and SupporterFundsTapped events. sqlite is loaded with a sample of SQLITE_ROWS rows and its
+throughput extrapolated, loading tens of millions of json rows takes longer than the scans being measured.
+
+ROWS=20000000 SQLITE_ROWS=1000000 brownie run scripts/local_development/benchmark_columnar.py
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+from indexer import EventStore
+from indexer.columnar import ColumnStore, columns_of
+
+LAUNCHES = 1000
+WALLETS = 100000
+EVENTS_PER_BLOCK = 20
+BLOCK_TIME = 13
+GENESIS_TIME = 1600000000
+
+
+def synthetic_columns(event, rows, seed):
+    random = np.random.default_rng(seed)
+    block = np.arange(rows, dtype="<u8") // EVENTS_PER_BLOCK + 1
+    columns = {
+        "block": block,
+        "log_index": np.arange(rows, dtype="<u4") % EVENTS_PER_BLOCK,
+        "timestamp": GENESIS_TIME + block * BLOCK_TIME,
+        "launch": random.integers(0, LAUNCHES, rows, dtype="<u4"),
+    }
+    for column, dtype in columns_of(event):
+        if column in columns:
+            continue
+        if column.endswith("_hi"):
+            # amounts of up to a few thousand tokens of 18 decimals
+            columns[column] = random.integers(0, 256, rows, dtype=dtype)
+        elif column.endswith("_lo") or column == "tokenId":
+            columns[column] = random.integers(0, 2 ** 63, rows, dtype=dtype)
+        else:
+            columns[column] = random.integers(0, WALLETS, rows, dtype=dtype)
+    return columns
+
+
+def sqlite_rows(event, columns, rows):
+    for i in range(rows):
+        amount = int(columns["amount_hi"][i]) << 64 | int(columns["amount_lo"][i])
+        yield (
+            int(columns["block"][i]),
+            i,
+            "0x",
+            "0x",
+            event,
+            f"launch-{columns['launch'][i]}",
+            f'{{"amount":{amount}}}',
+        )
+
+
+def timed(name, rows, scan, results):
+    started = time.perf_counter()
+    scan()
+    elapsed = time.perf_counter() - started
+    results.append((name, elapsed, rows / elapsed))
+
+
+def main():
+    rows = int(os.environ.get("ROWS", 20000000))
+    sample = min(int(os.environ.get("SQLITE_ROWS", 1000000)), rows // 2)
+    path = tempfile.mkdtemp()
+    try:
+        columns = ColumnStore(path)
+        for i in range(LAUNCHES):
+            columns.launches.id(f"launch-{i}")
+        started = time.perf_counter()
+        for seed, event in enumerate(("SupporterFundsDeposited", "SupporterFundsTapped")):
+            generated = synthetic_columns(event, rows // 2, seed)
+            columns.write(event, generated)
+        columns.launches.flush()
+        columns.set_cursor(int(generated["block"][-1]))
+        print(f"\nWrote {rows} rows in {time.perf_counter() - started:.2f}s")
+
+        store = EventStore()
+        with store.conn:
+            store.conn.executemany(
+                "INSERT INTO events VALUES (?, ?, ?, ?, ?, ?, ?)",
+                sqlite_rows("SupporterFundsDeposited", synthetic_columns("SupporterFundsDeposited", sample, 0), sample),
+            )
+
+        results = []
+        timed("columnar funding by launch", rows // 2, columns.funding_by_launch, results)
+        timed("columnar tap volume by day", rows // 2, columns.volume_by_day, results)
+        timed("columnar funding curve", rows // 2, lambda: columns.funding_curve("launch-0"), results)
+        timed(
+            "sqlite funding by launch",
+            sample,
+            lambda: store.conn.execute(
+                "SELECT launch, SUM(json_extract(args, '$.amount')) FROM events "
+                "WHERE event = 'SupporterFundsDeposited' GROUP BY launch"
+            ).fetchall(),
+            results,
+        )
+        for name, elapsed, throughput in results:
+            print(f"{name:<30}{elapsed:>10.3f}s{throughput:>16.0f} rows/s")
+        store.close()
+    finally:
+        shutil.rmtree(path)
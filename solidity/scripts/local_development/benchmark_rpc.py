@@ -0,0 +1,60 @@
+"""
+Throughput benchmark of the asyncio RPC client against brownie's synchronous calls, reading the views of every
+launch of a factory on the local development network. Without FACTORY_ADDRESS the chain is first seeded with
+deploy_and_run_multiple_sales.py (which needs a local ipfs daemon).
+
+REPEAT=20 brownie run scripts/local_development/benchmark_rpc.py
+"""
+
+import asyncio
+import os
+import time
+from brownie import BasicLaunch, LaunchFactory, web3
+from indexer.rpc import RPCClient
+from scripts.keeper import known_launches
+from scripts.local_development import deploy_and_run_multiple_sales
+
+VIEWS = [
+    "totalFundsProvided",
+    "stableBalance",
+    "launcherTapRate",
+    "launchOutcome",
+    "keeperStatus",
+    "hardCap",
+    "salePrice",
+    "tokensForSale",
+]
+# (batch_size, concurrency) settings of the client
+SETTINGS = [(1, 1), (1, 8), (50, 1), (50, 8), (200, 8)]
+
+
+async def batched_reads(transactions, batch_size, concurrency):
+    async with RPCClient(
+        web3.provider.endpoint_uri, batch_size=batch_size, concurrency=concurrency
+    ) as client:
+        return await client.calls(transactions)
+
+
+def main():
+    if "FACTORY_ADDRESS" in os.environ:
+        factory = LaunchFactory.at(os.environ["FACTORY_ADDRESS"])
+    else:
+        deploy_and_run_multiple_sales.main()
+        factory = LaunchFactory[-1]
+    launches = [BasicLaunch.at(l) for l in known_launches(factory)] * int(os.environ.get("REPEAT", 20))
+    calls = [(launch, view) for launch in launches for view in VIEWS]
+    transactions = [{"to": l.address, "data": getattr(l, v).encode_input()} for l, v in calls]
+    print(f"\n{len(calls)} view calls over {len(launches)} launches")
+
+    started = time.perf_counter()
+    expected = [getattr(l, v)() for l, v in calls]
+    results = {"brownie": time.perf_counter() - started}
+    for batch_size, concurrency in SETTINGS:
+        started = time.perf_counter()
+        data = asyncio.run(batched_reads(transactions, batch_size, concurrency))
+        results[f"batch {batch_size}, {concurrency} in flight"] = time.perf_counter() - started
+        decoded = [getattr(l, v).decode_output("0x" + d.hex()) for (l, v), d in zip(calls, data)]
+        assert decoded == expected
+
+    for name, elapsed in results.items():
+        print(f"{name:<28}{elapsed:>10.2f}s{len(calls) / elapsed:>12.0f} calls/s")
@@ -0,0 +1,126 @@
+"""
+Offline gas benchmark for the PolyVault adapter paths, runs against the local development network
+
+brownie run scripts/local_development/benchmark_vault_adapters.py
+"""
+
+import time
+from brownie import (
+    LaunchRedemption,
+    LaunchLogger,
+    LaunchGovernance,
+    LaunchFactory,
+    BasicLaunch,
+    BasicERC20,
+    GovernableERC20,
+    LaunchUtils,
+    PolylaunchConstants,
+    PolylaunchSystem,
+    PreLaunchRegistry,
+    GovernorAlpha,
+    MockYieldVault,
+    MockVaultAdapter,
+    accounts,
+    chain,
+)
+
+AMOUNT_FOR_SALE = 9_000_000e18
+FIXED_SWAP_RATE = 1000e18
+VESTING = 31536000
+GENERIC_NFT_DATA = ["0x" + "22" * 32, "0x" + "11" * 32]
+IPFS_DIGEST = "0x" + "33" * 32
+SUPPORTERS = 9
+
+
+def deploy_system(deployer, stable):
+    PolylaunchConstants.deploy({"from": deployer})
+    PreLaunchRegistry.deploy({"from": deployer})
+    LaunchUtils.deploy({"from": deployer})
+    LaunchRedemption.deploy({"from": deployer})
+    LaunchLogger.deploy({"from": deployer})
+    LaunchGovernance.deploy({"from": deployer})
+    governor = GovernorAlpha.deploy({"from": deployer})
+    launch = BasicLaunch.deploy({"from": deployer})
+    system = PolylaunchSystem.deploy(
+        stable.address, launch.address, governor.address, {"from": deployer}
+    )
+    factory = LaunchFactory.at(
+        system.tx.events["PolylaunchSystemLaunched"]["factoryAddress"]
+    )
+    vault_registry = system.tx.events["PolylaunchSystemLaunched"]["vaultRegistry"]
+    return system, factory, vault_registry
+
+
+def create_successful_launch(factory, stable, launcher, supporters):
+    token = GovernableERC20.deploy(
+        launcher,
+        launcher,
+        chain.time() + 1000,
+        "BenchToken",
+        "BNCH",
+        AMOUNT_FOR_SALE,
+        {"from": launcher},
+    )
+    token.approve(factory, AMOUNT_FOR_SALE, {"from": launcher})
+    start = chain.time() + 100
+    end = start + 1000
+    tx = factory.createBasicLaunch(
+        [
+            launcher,
+            token.address,
+            AMOUNT_FOR_SALE,
+            start,
+            end,
+            1000e18,
+            VESTING,
+            VESTING,
+            5000e18,
+            FIXED_SWAP_RATE,
+            GENERIC_NFT_DATA,
+            IPFS_DIGEST,
+        ],
+        {"from": launcher},
+    )
+    launch = BasicLaunch.at(tx.return_value)
+    launch.batchAddToWhitelist(supporters, {"from": launcher})
+    chain.sleep(101)
+    for supporter in supporters:
+        stable.mint(1000e18, {"from": supporter})
+        stable.approve(launch, 1000e18, {"from": supporter})
+        launch.sendStable(1000e18, {"from": supporter})
+    chain.sleep(1001)
+    return launch
+
+
+def main():
+    deployer = accounts[0]
+    stable = BasicERC20.deploy("Dai Stablecoin", "DAI", {"from": deployer})
+    system, factory, vault_registry = deploy_system(deployer, stable)
+
+    vault = MockYieldVault.deploy(stable, {"from": deployer})
+    adapter = MockVaultAdapter.deploy({"from": deployer})
+    system.registerNewVault(
+        vault_registry, vault, "MOCK_DAI", adapter, {"from": deployer}
+    )
+
+    launch = create_successful_launch(
+        factory, stable, deployer, accounts[1 : SUPPORTERS + 1]
+    )
+
+    gas = {}
+    gas["deposit"] = launch.deposit(1, {"from": deployer}).gas_used
+    chain.sleep(86400)
+    gas["launcherTap (vault)"] = launch.launcherTap({"from": deployer}).gas_used
+    stable.mint(100e18, {"from": deployer})
+    stable.transfer(vault, 100e18, {"from": deployer})
+    chain.sleep(86400)
+    gas["launcherTap (vault, after yield)"] = launch.launcherTap(
+        {"from": deployer}
+    ).gas_used
+    gas["exitFromVault"] = launch.exitFromVault({"from": deployer}).gas_used
+    chain.sleep(86400)
+    gas["launcherTap (no vault)"] = launch.launcherTap({"from": deployer}).gas_used
+
+    print("\nPolyVault adapter gas usage")
+    for name, used in gas.items():
+        print(f"{name:<36}{used:>10}")
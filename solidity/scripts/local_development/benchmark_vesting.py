@@ -0,0 +1,52 @@
+"""
+Benchmark of the vectorised VentureBond tap projection against evaluating getSupporterWithdrawableFunds one bond at a
+time in python, on synthetic bonds. The python loop runs on a sample of SAMPLE bonds and is extrapolated.
+
+BONDS=1000000 brownie run scripts/local_development/benchmark_vesting.py
+"""
+
+import os
+import time
+import numpy as np
+from indexer.vesting import BondSchedules
+
+START = 1600000000
+MONTH = 2592000
+GRID_POINTS = 24
+
+
+def withdrawable(tap_rate, last_withdrawn, tappable_balance, now):
+    return min(tap_rate * max(now - last_withdrawn, 0), tappable_balance)
+
+
+def main():
+    bonds = int(os.environ.get("BONDS", 1000000))
+    sample = min(int(os.environ.get("SAMPLE", 100000)), bonds)
+    random = np.random.default_rng(0)
+    tap_rate = random.integers(0, 10 ** 17, bonds, dtype=np.uint64)
+    last_withdrawn = START + random.integers(0, MONTH, bonds, dtype=np.uint64)
+    balance = (
+        random.integers(0, 2 ** 63, bonds, dtype=np.uint64),
+        random.integers(0, 2 ** 16, bonds, dtype=np.uint64),
+    )
+    times = START + MONTH * np.arange(1, GRID_POINTS + 1, dtype=np.uint64)[:, None]
+
+    started = time.perf_counter()
+    schedules = BondSchedules(tap_rate, last_withdrawn, balance)
+    grid = schedules.withdrawable(times)
+    vested = schedules.fully_vested_at()
+    vectorised = time.perf_counter() - started
+
+    rows = [
+        (int(r), int(w), int(hi) << 64 | int(lo))
+        for r, w, lo, hi in zip(tap_rate[:sample], last_withdrawn[:sample], *(half[:sample] for half in balance))
+    ]
+    started = time.perf_counter()
+    for now in times[:, 0]:
+        expected = [withdrawable(*row, int(now)) for row in rows]
+    looped = (time.perf_counter() - started) * bonds / sample
+    assert expected == [int(hi) << 64 | int(lo) for lo, hi in zip(grid[0][-1, :sample], grid[1][-1, :sample])]
+
+    print(f"\n{bonds} bonds over {GRID_POINTS} points, {np.count_nonzero(vested <= times[-1, 0])} fully vested")
+    print(f"{'vectorised':<28}{vectorised:>10.3f}s")
+    print(f"{'python loop (extrapolated)':<28}{looped:>10.3f}s")
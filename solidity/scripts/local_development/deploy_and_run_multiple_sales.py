@@ -133,7 +133,7 @@ def main():
                 constants.INDIVIDUAL_FUNDING_CAP * random_multiplier,
                 constants.FIXED_SWAP_RATE,
                 constants.GENERIC_NFT_DATA,
-                sale_details,
+                constants.cid_to_digest(sale_details),
             ],
             {"from": accounts[i]},
         )
@@ -0,0 +1,2 @@
+from sdk.cache import ReadCache
+from sdk.contracts import ContractView, PolylaunchClient, ViewFunction
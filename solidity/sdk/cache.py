@@ -0,0 +1,97 @@
+"""
+Least recently used cache of view call results, with hit rate metrics. Entries are grouped by contract and view and
+by contract, view and first argument, so the events that change a view can drop every entry they make stale.
+"""
+
+from collections import OrderedDict, defaultdict
+
+
+def groups_of(key):
+    address, view, args = key
+    groups = [(address, view)]
+    if args:
+        groups.append((address, view, args[0]))
+    return groups
+
+
+class ReadCache:
+    """
+    @param max_entries number of results kept, the least recently used are evicted first
+    """
+
+    def __init__(self, max_entries=10000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.groups = defaultdict(set)
+        self.hits = defaultdict(int)
+        self.misses = defaultdict(int)
+        self.evictions = 0
+        self.invalidations = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def lookup(self, key, valid):
+        """
+        Cached result of a call, counted as a hit or a miss
+        @param key (address, view, args) of the call
+        @param valid function of the block an entry was read at and the last block whose events had been observed
+        when it was stored, that tells whether it can still be served
+        @return (True, value) on a hit, (False, None) on a miss
+        """
+        entry = self.entries.get(key)
+        if entry is not None and not valid(entry[1], entry[2]):
+            self.discard(key)
+            entry = None
+        if entry is None:
+            self.misses[key[1]] += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits[key[1]] += 1
+        return True, entry[0]
+
+    def store(self, key, value, block_number, observed_block=None):
+        if key in self.entries:
+            self.discard(key)
+        self.entries[key] = (value, block_number, observed_block)
+        for group in groups_of(key):
+            self.groups[group].add(key)
+        while len(self.entries) > self.max_entries:
+            self.discard(next(iter(self.entries)))
+            self.evictions += 1
+
+    def discard(self, key):
+        del self.entries[key]
+        for group in groups_of(key):
+            keys = self.groups[group]
+            keys.discard(key)
+            if not keys:
+                del self.groups[group]
+
+    def invalidate(self, group):
+        """
+        Drop every entry of a group, (address, view) or (address, view, first argument)
+        """
+        for key in list(self.groups.get(group, ())):
+            self.discard(key)
+            self.invalidations += 1
+
+    def metrics(self):
+        """
+        @return dict with the hits, misses, hit rate, evictions, invalidations and size of the cache, and the hit
+        rate of every view
+        """
+        hits = sum(self.hits.values())
+        misses = sum(self.misses.values())
+        views = set(self.hits) | set(self.misses)
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "entries": len(self.entries),
+            "views": {
+                view: self.hits[view] / (self.hits[view] + self.misses[view]) for view in sorted(views)
+            },
+        }
@@ -0,0 +1,245 @@
+"""
+Python wrappers of BasicLaunch, VentureBond and GovernorAlpha views with a read-through cache, for API servers that
+read the same launches many times per block.
+
+Every call is made at the block the client is set to. Views that never change once the contract is set up are
+cached for good. Views whose every change is logged are cached across blocks while the client is fed the events of
+the system through observe, and dropped by the events that change them; only results read at or after the last
+observed block are reused this way, the events observed before they were stored could not drop them. Every other
+view, and every view of a client that is not fed events, is cached for the block it was read at only.
+"""
+
+from eth_abi import decode_abi, encode_abi
+from eth_utils import function_signature_to_4byte_selector, to_checksum_address
+from indexer.decoder import abi_type, normalise, to_bytes
+from sdk.cache import ReadCache
+
+# views fixed once the contract is set up
+IMMUTABLE_VIEWS = {
+    "launch": {
+        "launchStartTime",
+        "launchEndTime",
+        "tokenForLaunch",
+        "launcher",
+        "governor",
+        "launchId",
+        "launcherVestingPeriod",
+        "supporterVestingPeriod",
+        "launchVentureBondAddress",
+        "launchMarketAddress",
+        "softCap",
+        "hardCap",
+        "individualCap",
+        "salePrice",
+        "tokensForSale",
+    },
+    # the tap rate of a bond is set when it is minted, no launch updates it
+    "venture_bond": {"name", "symbol", "tapRate", "launchAddressAssociatedWithToken"},
+    "governor": {
+        "name",
+        "basicLaunch",
+        "launchId",
+        "launchToken",
+        "ventureBond",
+        "votingDelay",
+        "votingPeriod",
+        "executionDelay",
+        "gracePeriod",
+    },
+}
+
+# views changed by each event: the contract they belong to, the view and the event argument that is its first
+# argument, if only the calls with that argument are changed. "launch" is the launch the event is attributed to and
+# "bond" its VentureBond, "venture_bond" and "governor" are the contract that emitted the event
+INVALIDATIONS = {
+    "SupporterFundsDeposited": [
+        ("launch", "totalFundsProvided", None),
+        ("launch", "stableBalance", None),
+    ],
+    "FundsWithdrawn": [("launch", "stableBalance", None)],
+    "LauncherFundsTapped": [("launch", "stableBalance", None)],
+    "VaultFundsDeposited": [("launch", "stableBalance", None)],
+    "VaultExited": [("launch", "stableBalance", None)],
+    "TokenMinted": [("launch", "totalVotingPower", None)],
+    "RefundClaimed": [
+        ("launch", "stableBalance", None),
+        ("launch", "totalVotingPower", None),
+        ("bond", "tappableBalance", "tokenId"),
+        ("bond", "votingPower", "tokenId"),
+    ],
+    "SupporterFundsTapped": [
+        ("bond", "tappableBalance", "tokenId"),
+        ("bond", "lastWithdrawnTime", "tokenId"),
+    ],
+    "Transfer": [
+        ("venture_bond", "ownerOf", "tokenId"),
+        ("venture_bond", "balanceOf", "from"),
+        ("venture_bond", "balanceOf", "to"),
+        ("venture_bond", "tokenOfOwnerByIndex", "from"),
+        ("venture_bond", "tokenOfOwnerByIndex", "to"),
+    ],
+    "VoteCast": [
+        ("governor", "proposals", "proposalId"),
+        ("governor", "getReceipt", "proposalId"),
+    ],
+    "ProposalQueued": [("governor", "proposals", "id"), ("governor", "queuedProposals", "id")],
+    "ProposalExecuted": [("governor", "proposals", "id")],
+    "ProposalCanceled": [("governor", "proposals", "id")],
+    "TapIncreaseProposalCreated": [
+        ("governor", "proposalCount", None),
+        ("governor", "latestTapIncreaseProposalId", None),
+    ],
+    "RefundProposalCreated": [
+        ("governor", "proposalCount", None),
+        ("governor", "latestRefundProposalId", None),
+    ],
+}
+
+KIND_OF_TARGET = {
+    "launch": "launch",
+    "bond": "venture_bond",
+    "venture_bond": "venture_bond",
+    "governor": "governor",
+}
+
+
+def event_views(kind):
+    # views of a contract kind that are only changed by logged events
+    return {
+        view
+        for changes in INVALIDATIONS.values()
+        for target, view, _ in changes
+        if KIND_OF_TARGET[target] == kind
+    }
+
+
+class ViewFunction:
+    """
+    Encodes the calls to a view of an abi and decodes their results
+    """
+
+    def __init__(self, function):
+        self.name = function["name"]
+        self.input_types = [abi_type(i) for i in function["inputs"]]
+        self.output_types = [abi_type(o) for o in function["outputs"]]
+        signature = f"{self.name}({','.join(self.input_types)})"
+        self.selector = function_signature_to_4byte_selector(signature)
+
+    def encode(self, args):
+        return "0x" + (self.selector + encode_abi(self.input_types, args)).hex()
+
+    def decode(self, data):
+        values = [
+            normalise(t, v) for t, v in zip(self.output_types, decode_abi(self.output_types, to_bytes(data)))
+        ]
+        return values[0] if len(values) == 1 else values
+
+
+class ContractView:
+    """
+    Cached views of one contract, called as methods: client.launch(address).hardCap()
+    """
+
+    def __init__(self, client, kind, address):
+        self.client = client
+        self.kind = kind
+        self.address = to_checksum_address(address)
+
+    def __getattr__(self, name):
+        if name not in self.client.functions[self.kind]:
+            raise AttributeError(f"{self.kind} has no view {name}")
+        return lambda *args: self.client.call(self.kind, self.address, name, args)
+
+
+class PolylaunchClient:
+    """
+    Read-through cached views of the Polylaunch contracts
+    @param web3 connected web3 instance, or an indexer.rpc.SyncRPC
+    @param abis dict of contract kind ("launch", "venture_bond", "governor") to abi
+    @param max_entries number of results kept in the cache
+    """
+
+    def __init__(self, web3, abis, max_entries=10000):
+        self.web3 = web3
+        self.cache = ReadCache(max_entries)
+        self.functions = {
+            kind: {
+                f["name"]: ViewFunction(f)
+                for f in abi
+                if f.get("type") == "function" and f.get("stateMutability") in ("view", "pure")
+            }
+            for kind, abi in abis.items()
+        }
+        self.event_views = {kind: event_views(kind) for kind in abis}
+        self.block = None
+        # last block whose events were observed
+        self.observed_block = None
+
+    def launch(self, address):
+        return ContractView(self, "launch", address)
+
+    def venture_bond(self, address):
+        return ContractView(self, "venture_bond", address)
+
+    def governor(self, address):
+        return ContractView(self, "governor", address)
+
+    def at_block(self, block_number=None):
+        """
+        Make the next calls at a block, the head of the chain by default
+        """
+        self.block = self.web3.eth.blockNumber if block_number is None else block_number
+
+    def call(self, kind, address, name, args):
+        if self.block is None:
+            self.at_block()
+        block = self.block
+        function = self.functions[kind][name]
+        # addresses are keyed as the events carry them
+        args = tuple(
+            to_checksum_address(a) if t == "address" else a for t, a in zip(function.input_types, args)
+        )
+        key = (address, name, args)
+
+        def valid(read_at, observed_at_store):
+            if name in IMMUTABLE_VIEWS[kind] or read_at == block:
+                return True
+            # events between the read and the block have dropped the entry if it went stale, which only holds for
+            # the events observed after it was stored
+            return (
+                name in self.event_views[kind]
+                and observed_at_store is not None
+                and observed_at_store <= read_at <= block <= self.observed_block
+            )
+
+        hit, value = self.cache.lookup(key, valid)
+        if hit:
+            return value
+        data = self.web3.eth.call({"to": address, "data": function.encode(args)}, block)
+        value = function.decode(data)
+        self.cache.store(key, value, block, self.observed_block)
+        return value
+
+    def observe(self, events, to_block):
+        """
+        Drop the results changed by events, and cache the views changed only by events across blocks up to to_block
+        @param events events of every block since the previous call up to to_block, as returned by EventStore.events
+        """
+        for event in events:
+            for target, view, argument in INVALIDATIONS.get(event["event"], ()):
+                if target in ("venture_bond", "governor"):
+                    address = event["address"]
+                elif event["launch"] is None:
+                    continue
+                elif target == "launch":
+                    address = event["launch"]
+                else:
+                    address = self.launch(event["launch"]).launchVentureBondAddress()
+                if argument is None:
+                    self.cache.invalidate((address, view))
+                else:
+                    self.cache.invalidate((address, view, event["args"][argument]))
+        self.observed_block = to_block
+
+    def metrics(self):
+        return self.cache.metrics()
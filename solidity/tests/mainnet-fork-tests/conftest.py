@@ -18,6 +18,9 @@ from brownie import (
     PolylaunchSystemAuthority,
     PreLaunchRegistry,
     PolyVaultRegistry,
+    CompoundAdapter,
+    YearnV2Adapter,
+    AaveAdapter,
     GovernorAlpha,
     VentureBond,
     Market,
@@ -117,17 +120,28 @@ def deployed_factory(dai, accounts, cdai, ydai):
     vault_registry = PolyVaultRegistry.at(
         system.tx.events["PolylaunchSystemLaunched"]["vaultRegistry"]
     )
+    compound_adapter = CompoundAdapter.deploy({"from": deployer})
+    yearn_adapter = YearnV2Adapter.deploy({"from": deployer})
+    aave_adapter = AaveAdapter.deploy({"from": deployer})
     system.registerNewVault(
-        vault_registry.address, cdai.address, "COMPOUND_DAI", 1, {"from": deployer}
+        vault_registry.address,
+        cdai.address,
+        "COMPOUND_DAI",
+        compound_adapter.address,
+        {"from": deployer},
     )
     system.registerNewVault(
-        vault_registry.address, ydai.address, "YEARN_VAULTS_DAI", 2, {"from": deployer}
+        vault_registry.address,
+        ydai.address,
+        "YEARN_VAULTS_DAI",
+        yearn_adapter.address,
+        {"from": deployer},
     )
     system.registerNewVault(
         vault_registry.address,
         constants.AAVE_LENDING_POOL,
         "AAVE_LENDING_DAI",
-        3,
+        aave_adapter.address,
         {"from": deployer},
     )
     accounts.remove(deployer)
@@ -22,43 +22,40 @@ ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 BID_PRICE = 200
 stable_AMOUNT = 5000
 GENERIC_NFT_DATA = [
-    "https://test",
+    "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
     "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
 ]
 SPECIAL_NFT_DATA = [
-    "https://test",
+    "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
     "194F55A6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
 ]
 BATCH_SPECIAL_NFT_DATA = [
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "d9a7e81efacc5660697cf4866d1af38e99275e02b2454b1dccaeb15adf66f575",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "f9a7e81efacc5660697cf4866d1af38e99275e02b2454b1dccaeb15adf66f575",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
 ]
 
 FAILURE_NFT_DATA = [
-    ["", "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078"],
-    [
-        "https://test",
-        "",
-    ],
-    ["https://test", "0"],
+    ["0x" + "00" * 32, "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078"],
+    ["80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782", "0x" + "00" * 32],
+    ["0x" + "00" * 32, "0x" + "00" * 32],
 ]
 
-DUMMY_IPFS_HASH = "dummyhash"
+DUMMY_IPFS_HASH = "0x2db67be2bb0ea22be6b7dd77bc9bec240a8d72c617e3cd5ca582fd80b10a3db6"
@@ -4,11 +4,11 @@ import constants_mainnet as constants
 import pytest
 
 def test_sale_governor_exit_vaults_router(launch_with_queued_proposal, accounts, gen_lev_farm_strat, dai, ydai, cdai, adai):
-    if launch_with_queued_proposal[1].selectedVaultProvider() == 1:
+    if launch_with_queued_proposal[1].selectedVaultId() == 1:
         claim_refund_after_succeeded_proposal_succeeds_comp(launch_with_queued_proposal, accounts, dai, cdai)
-    elif launch_with_queued_proposal[1].selectedVaultProvider() == 2:
+    elif launch_with_queued_proposal[1].selectedVaultId() == 2:
         claim_refund_after_succeeded_proposal_succeeds_yearn(launch_with_queued_proposal, accounts, dai, ydai)
-    elif launch_with_queued_proposal[1].selectedVaultProvider() == 3:
+    elif launch_with_queued_proposal[1].selectedVaultId() == 3:
         claim_refund_after_succeeded_proposal_succeeds_aave(launch_with_queued_proposal, accounts, dai, adai)
 
 
@@ -22,12 +22,13 @@ def claim_refund_after_succeeded_proposal_succeeds_comp(
         "newRate"
     ]
 
+    position = launch.selectedVaultAdapter()
     initial_dai_balance = dai.balanceOf(launch.address)
-    initial_cdai_balance = cdai.balanceOf(launch.address)
+    initial_cdai_balance = cdai.balanceOf(position)
 
     brownie.chain.sleep(86400 + 1)  # just over 1 day
     governor.execute(proposal_id, {"from": accounts[0]})
-    after_cdai_balance = cdai.balanceOf(launch.address)
+    after_cdai_balance = cdai.balanceOf(position)
     after_dai_balance = dai.balanceOf(launch.address)
     token_address = launch.tokenForLaunch({"from": accounts[1]})
     token_contract = brownie.GovernableERC20.at(token_address)
@@ -47,13 +48,14 @@ def claim_refund_after_succeeded_proposal_succeeds_yearn(
         "newRate"
     ]
 
+    position = launch.selectedVaultAdapter()
     initial_dai_balance = dai.balanceOf(launch.address)
-    initial_ydai_balance = ydai.balanceOf(launch.address)
+    initial_ydai_balance = ydai.balanceOf(position)
     ydai_before_price = ydai.pricePerShare({"from": accounts[0]})
 
     brownie.chain.sleep(86400 + 1)  # just over 1 day
     governor.execute(proposal_id, {"from": accounts[0]})
-    after_ydai_balance = ydai.balanceOf(launch.address)
+    after_ydai_balance = ydai.balanceOf(position)
     after_dai_balance = dai.balanceOf(launch.address)
     ydai_after_price = ydai.pricePerShare({"from": accounts[0]})
     token_address = launch.tokenForLaunch({"from": accounts[1]})
@@ -75,12 +77,13 @@ def claim_refund_after_succeeded_proposal_succeeds_aave(
         "newRate"
     ]
 
+    position = launch.selectedVaultAdapter()
     initial_dai_balance = dai.balanceOf(launch.address)
-    initial_adai_balance = adai.balanceOf(launch.address)
+    initial_adai_balance = adai.balanceOf(position)
 
     brownie.chain.sleep(86400 + 1)  # just over 1 day
     governor.execute(proposal_id, {"from": accounts[0]})
-    after_adai_balance = adai.balanceOf(launch.address)
+    after_adai_balance = adai.balanceOf(position)
     after_dai_balance = dai.balanceOf(launch.address)
     token_address = launch.tokenForLaunch({"from": accounts[1]})
     token_contract = brownie.GovernableERC20.at(token_address)
@@ -11,14 +11,15 @@ def test_deposit_to_all_funds_withdrawn(successful_launch, accounts, adai, deplo
     launch_contract, stable_contract = successful_launch
     initial_dai_balance = stable_contract.balanceOf(launch_contract.address)
     launch_contract.deposit(3, {"from": accounts[0]})
-    initial_adai_balance = adai.scaledBalanceOf(launch_contract.address)
+    position = launch_contract.selectedVaultAdapter()
+    initial_adai_balance = adai.scaledBalanceOf(position)
     initial_dai_own_balance = stable_contract.balanceOf(accounts[0])
     system_i_dai_balance = stable_contract.balanceOf(deployed_factory[1])
     brownie.chain.sleep(10000000)
     brownie.chain.mine(1000)
     tx = launch_contract.launcherTap({"from": accounts[0]})
     after_dai_balance = stable_contract.balanceOf(launch_contract.address)
-    after_adai_balance = adai.balanceOf(launch_contract.address)
+    after_adai_balance = adai.balanceOf(position)
     after_dai_own_balance = stable_contract.balanceOf(accounts[0])
 
     assert initial_dai_balance > after_dai_balance
@@ -28,7 +29,7 @@ def test_deposit_to_all_funds_withdrawn(successful_launch, accounts, adai, deplo
     assert after_adai_balance != 0
     launch_contract.exitFromVault({"from": accounts[0]})
     system_a_dai_balance = stable_contract.balanceOf(deployed_factory[1])
-    assert adai.balanceOf(launch_contract.address) == 0
+    assert adai.balanceOf(position) == 0
     assert system_i_dai_balance < system_a_dai_balance
     brownie.chain.sleep(1000000000)
     tx = launch_contract.launcherTap({"from": accounts[0]})
@@ -51,15 +52,15 @@ Deposit scenarios
 def test_dev_deposit_aave(successful_launch, accounts, dai, adai):
     launch_contract, stable_contract = successful_launch
     initial_balance = dai.balanceOf(adai.address)
-    initial_adai = adai.balanceOf(launch_contract.address)
 
     tx = launch_contract.deposit(3, {"from": accounts[0]})
 
     after_balance = dai.balanceOf(adai.address)
-    after_adai = adai.balanceOf(launch_contract.address)
+    position = launch_contract.selectedVaultAdapter()
+    after_adai = adai.balanceOf(position)
 
     assert "VaultFundsDeposited" in tx.events
-    assert initial_adai < after_adai
+    assert after_adai > 0
     assert initial_balance < after_balance
     assert dai.balanceOf(launch_contract.address) == 0
 
@@ -96,12 +97,13 @@ def test_deposit_empty_funds_reverts(successful_launch, accounts, adai):
 def test_deposit_exit_deposit_different(successful_launch, accounts, adai, ydai, deployed_factory):
     launch_contract, stable_contract = successful_launch
     launch_contract.deposit(3, {"from": accounts[0]})
+    first_position = launch_contract.selectedVaultAdapter()
     brownie.chain.sleep(10000)
     launch_contract.exitFromVault({"from": accounts[0]})
     launch_contract.deposit(2, {"from": accounts[0]})
     assert stable_contract.balanceOf(launch_contract.address) == 0
-    assert ydai.balanceOf(launch_contract.address) > 0
-    assert adai.balanceOf(launch_contract.address) == 0
+    assert ydai.balanceOf(launch_contract.selectedVaultAdapter()) > 0
+    assert adai.balanceOf(first_position) == 0
     assert stable_contract.balanceOf(deployed_factory[1]) > 0
 
 
@@ -139,12 +141,13 @@ Exit Scenarios
 def test_exit_vault_aave(success_launch_aave, accounts, adai, send_10_eth_of_dai_to_accounts, deployed_factory):
     deployed_factory, system = deployed_factory
     dai = send_10_eth_of_dai_to_accounts
+    position = success_launch_aave.selectedVaultAdapter()
     initial_dai_balance = dai.balanceOf(success_launch_aave.address)
-    initial_adai_balance = adai.balanceOf(success_launch_aave.address)
+    initial_adai_balance = adai.balanceOf(position)
     brownie.chain.mine(100)
     tx = success_launch_aave.exitFromVault({"from": accounts[0]})
     after_dai_balance = dai.balanceOf(success_launch_aave.address)
-    after_adai_balance = adai.balanceOf(success_launch_aave.address)
+    after_adai_balance = adai.balanceOf(position)
     assert "VaultExited" in tx.events
     assert initial_dai_balance < after_dai_balance
     assert initial_adai_balance > after_adai_balance
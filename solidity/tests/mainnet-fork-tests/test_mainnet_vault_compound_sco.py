@@ -11,14 +11,15 @@ def test_deposit_to_all_funds_withdrawn(successful_launch, accounts, cdai, deplo
     launch_contract, stable_contract = successful_launch
     initial_dai_balance = stable_contract.balanceOf(launch_contract.address)
     launch_contract.deposit(1, {"from": accounts[0]})
-    initial_cdai_balance = cdai.balanceOf(launch_contract.address)
+    position = launch_contract.selectedVaultAdapter()
+    initial_cdai_balance = cdai.balanceOf(position)
     initial_dai_own_balance = stable_contract.balanceOf(accounts[0])
     system_i_dai_balance = stable_contract.balanceOf(deployed_factory[1])
     brownie.chain.sleep(10000000000)
     brownie.chain.mine(1000)
     launch_contract.launcherTap({"from": accounts[0]})
     after_dai_balance = stable_contract.balanceOf(launch_contract.address)
-    after_cdai_balance = cdai.balanceOf(launch_contract.address)
+    after_cdai_balance = cdai.balanceOf(position)
     after_dai_own_balance = stable_contract.balanceOf(accounts[0])
 
     assert initial_dai_balance > after_dai_balance
@@ -28,7 +29,7 @@ def test_deposit_to_all_funds_withdrawn(successful_launch, accounts, cdai, deplo
     assert after_cdai_balance != 0
     launch_contract.exitFromVault({"from": accounts[0]})
     system_a_dai_balance = stable_contract.balanceOf(deployed_factory[1])
-    assert cdai.balanceOf(launch_contract.address) == 0
+    assert cdai.balanceOf(position) == 0
     assert system_i_dai_balance < system_a_dai_balance
     brownie.chain.sleep(10000000000)
     tx = launch_contract.launcherTap({"from": accounts[0]})
@@ -50,15 +51,15 @@ Deposit scenarios
 def test_dev_deposit_compound(successful_launch, accounts, dai, cdai):
     launch_contract, stable_contract = successful_launch
     initial_balance = dai.balanceOf(cdai.address)
-    initial_cdai = cdai.balanceOf(launch_contract.address)
 
     tx = launch_contract.deposit(1, {"from": accounts[0]})
 
     after_balance = dai.balanceOf(cdai.address)
-    after_cdai = cdai.balanceOf(launch_contract.address)
+    position = launch_contract.selectedVaultAdapter()
+    after_cdai = cdai.balanceOf(position)
 
     assert "VaultFundsDeposited" in tx.events
-    assert initial_cdai < after_cdai
+    assert after_cdai > 0
     assert initial_balance < after_balance
     assert dai.balanceOf(launch_contract.address) == 0
 
@@ -95,12 +96,13 @@ def test_deposit_empty_funds_reverts(successful_launch, accounts, cdai):
 def test_deposit_exit_deposit_different(successful_launch, accounts, cdai, ydai, deployed_factory):
     launch_contract, stable_contract = successful_launch
     launch_contract.deposit(1, {"from": accounts[0]})
+    first_position = launch_contract.selectedVaultAdapter()
     brownie.chain.mine(10)
     launch_contract.exitFromVault({"from": accounts[0]})
     launch_contract.deposit(2, {"from": accounts[0]})
     assert stable_contract.balanceOf(launch_contract.address) == 0
-    assert ydai.balanceOf(launch_contract.address) > 0
-    assert cdai.balanceOf(launch_contract.address) == 0
+    assert ydai.balanceOf(launch_contract.selectedVaultAdapter()) > 0
+    assert cdai.balanceOf(first_position) == 0
     assert stable_contract.balanceOf(deployed_factory[1]) > 0
 
 
@@ -138,12 +140,13 @@ Exit Scenarios
 def test_exit_vault_comp(success_launch_comp, accounts, cdai, send_10_eth_of_dai_to_accounts, deployed_factory):
     deployed_factory, system = deployed_factory
     dai = send_10_eth_of_dai_to_accounts
+    position = success_launch_comp.selectedVaultAdapter()
     initial_dai_balance = dai.balanceOf(success_launch_comp.address)
-    initial_cdai_balance = cdai.balanceOf(success_launch_comp.address)
+    initial_cdai_balance = cdai.balanceOf(position)
     brownie.chain.mine(100)
     tx = success_launch_comp.exitFromVault({"from": accounts[0]})
     after_dai_balance = dai.balanceOf(success_launch_comp.address)
-    after_cdai_balance = cdai.balanceOf(success_launch_comp.address)
+    after_cdai_balance = cdai.balanceOf(position)
     assert "VaultExited" in tx.events
     assert initial_dai_balance < after_dai_balance
     assert initial_cdai_balance > after_cdai_balance
@@ -11,7 +11,8 @@ def test_deposit_to_all_funds_withdrawn(successful_launch, accounts, ydai, gen_l
     launch_contract, stable_contract = successful_launch
     initial_dai_balance = stable_contract.balanceOf(launch_contract.address)
     launch_contract.deposit(2, {"from": accounts[0]})
-    initial_ydai_balance = ydai.balanceOf(launch_contract.address)
+    position = launch_contract.selectedVaultAdapter()
+    initial_ydai_balance = ydai.balanceOf(position)
     initial_dai_own_balance = stable_contract.balanceOf(accounts[0])
     system_i_dai_balance = stable_contract.balanceOf(deployed_factory[1])
 
@@ -22,7 +23,7 @@ def test_deposit_to_all_funds_withdrawn(successful_launch, accounts, ydai, gen_l
     # brownie.chain.sleep(10000000000)
     tx = launch_contract.launcherTap({"from": accounts[0]})
     after_dai_balance = stable_contract.balanceOf(launch_contract.address)
-    after_ydai_balance = ydai.balanceOf(launch_contract.address)
+    after_ydai_balance = ydai.balanceOf(position)
     after_dai_own_balance = stable_contract.balanceOf(accounts[0])
 
     assert initial_dai_balance > after_dai_balance
@@ -32,7 +33,7 @@ def test_deposit_to_all_funds_withdrawn(successful_launch, accounts, ydai, gen_l
     assert after_ydai_balance != 0
     launch_contract.exitFromVault({"from": accounts[0]})
     system_a_dai_balance = stable_contract.balanceOf(deployed_factory[1])
-    assert ydai.balanceOf(launch_contract.address) == 0
+    assert ydai.balanceOf(position) == 0
     assert system_i_dai_balance < system_a_dai_balance
     brownie.chain.sleep(10000000000)
     tx = launch_contract.launcherTap({"from": accounts[0]})
@@ -53,12 +54,12 @@ Deposit scenarios
 def test_dev_deposit_yvDAI(successful_launch, accounts, dai, ydai):
     launch_contract, stable_contract = successful_launch
     initial_balance = dai.balanceOf(ydai.address)
-    initial_ydai = ydai.balanceOf(launch_contract.address)
     tx = launch_contract.deposit(2, {"from": accounts[0]})
     assert "VaultFundsDeposited" in tx.events
     after_balance = dai.balanceOf(ydai.address)
-    after_ydai = ydai.balanceOf(launch_contract.address)
-    assert initial_ydai < after_ydai
+    position = launch_contract.selectedVaultAdapter()
+    after_ydai = ydai.balanceOf(position)
+    assert after_ydai > 0
     assert initial_balance < after_balance
     assert dai.balanceOf(launch_contract.address) == 0
 
@@ -94,6 +95,7 @@ def test_deposit_empty_funds_reverts(successful_launch, accounts, cdai):
 def test_deposit_exit_deposit_different(successful_launch, accounts, cdai, ydai, gen_lev_farm_strat):
     launch_contract, stable_contract = successful_launch
     launch_contract.deposit(2, {"from": accounts[0]})
+    first_position = launch_contract.selectedVaultAdapter()
 
     keeper = brownie.accounts.at("0xC3D6880fD95E06C816cB030fAc45b3ffe3651Cb0", force=True)
     brownie.chain.mine(1000)
@@ -102,8 +104,8 @@ def test_deposit_exit_deposit_different(successful_launch, accounts, cdai, ydai,
     launch_contract.exitFromVault({"from": accounts[0]})
     launch_contract.deposit(1, {"from": accounts[0]})
     assert stable_contract.balanceOf(launch_contract.address) == 0
-    assert ydai.balanceOf(launch_contract.address) == 0
-    assert cdai.balanceOf(launch_contract.address) > 0
+    assert ydai.balanceOf(first_position) == 0
+    assert cdai.balanceOf(launch_contract.selectedVaultAdapter()) > 0
 
 '''
 Tap Scenarios
@@ -154,12 +156,13 @@ def test_exit_vault_yearn(
     brownie.chain.mine(10000)
     gen_lev_farm_strat.harvest({"from": keeper})
 
+    position = success_launch_yearn.selectedVaultAdapter()
     initial_dai_balance = dai.balanceOf(success_launch_yearn.address)
-    initial_ydai_balance = ydai.balanceOf(success_launch_yearn.address)
+    initial_ydai_balance = ydai.balanceOf(position)
 
     tx = success_launch_yearn.exitFromVault({"from": accounts[0]})
     after_dai_balance = dai.balanceOf(success_launch_yearn.address)
-    after_ydai_balance = ydai.balanceOf(success_launch_yearn.address)
+    after_ydai_balance = ydai.balanceOf(position)
     assert "VaultExited" in tx.events
     assert initial_dai_balance < after_dai_balance
     assert initial_ydai_balance > after_ydai_balance
@@ -23,6 +23,12 @@ from brownie import (
     PolyVault,
     PolyVaultRegistry,
     GovernorAlpha,
+    PolylaunchForwarder,
+    MockYieldVault,
+    MockVaultAdapter,
+    PolyPool,
+    PooledVaultAdapter,
+    PolylaunchLens,
     accounts,
     web3,
     Wei,
@@ -30,10 +36,12 @@ from brownie import (
     Contract,
 )
 
+DEPLOYER = "0xC3D6880fD95E06C817cB030fAc45b3fae3651Cb0"
+
 
 @pytest.fixture(scope="module", autouse=True)
 def deployed_factory(stable_contract, accounts):
-    deployer = accounts.at("0xC3D6880fD95E06C817cB030fAc45b3fae3651Cb0", force=True)
+    deployer = accounts.at(DEPLOYER, force=True)
     constants = PolylaunchConstants.deploy({"from": deployer})
     registry = PreLaunchRegistry.deploy({"from": deployer})
     utils = LaunchUtils.deploy({"from": deployer})
@@ -56,6 +64,58 @@ def deployed_factory(stable_contract, accounts):
     yield factory
 
 
+@pytest.fixture(scope="module")
+def forwarder(deployed_factory):
+    yield PolylaunchForwarder.at(deployed_factory.trustedForwarderAddress())
+
+
+@pytest.fixture(scope="module")
+def mock_vault(deployed_factory, stable_contract):
+    deployer = accounts.at(DEPLOYER, force=True)
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    vault = MockYieldVault.deploy(stable_contract, {"from": deployer})
+    adapter = MockVaultAdapter.deploy({"from": deployer})
+    system.registerNewVault(
+        deployed_factory.getVaultRegistryAddress.call(),
+        vault,
+        "MOCK_DAI",
+        adapter,
+        {"from": deployer},
+    )
+    accounts.remove(deployer)
+    yield vault, adapter
+
+
+@pytest.fixture(scope="module")
+def poly_pool(deployed_factory, stable_contract, mock_vault):
+    deployer = accounts.at(DEPLOYER, force=True)
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    vault, vault_adapter = mock_vault
+    pool = PolyPool.deploy(
+        system,
+        stable_contract,
+        vault,
+        vault_adapter,
+        constants.POOL_RESERVE_RATIO,
+        {"from": deployer},
+    )
+    adapter = PooledVaultAdapter.deploy({"from": deployer})
+    system.registerNewVault(
+        deployed_factory.getVaultRegistryAddress.call(),
+        pool,
+        "POOLED_DAI",
+        adapter,
+        {"from": deployer},
+    )
+    accounts.remove(deployer)
+    yield pool, adapter
+
+
+@pytest.fixture(scope="module")
+def lens(accounts):
+    yield PolylaunchLens.deploy({"from": accounts[0]})
+
+
 @pytest.fixture(scope="module", autouse=True)
 def stable_contract(BasicERC20, accounts):
     contract = BasicERC20.deploy("Dai Stablecoin", "DAI", {"from": accounts[0]})
@@ -21,43 +21,66 @@ ASK_PRICE = 200e18
 ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
 BID_PRICE = 200e18
 stable_AMOUNT = 5000e18
+ZERO_DIGEST = "0x" + "00" * 32
+BASE58_ALPHABET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+def cid_v0(digest):
+    # base58 encoding of the sha2-256 multihash 0x1220 ++ digest
+    value = int.from_bytes(bytes.fromhex("1220" + digest.replace("0x", "")), "big")
+    encoded = ""
+    while value:
+        value, remainder = divmod(value, 58)
+        encoded = BASE58_ALPHABET[remainder] + encoded
+    return encoded
+
+
+def token_uri(digest, base="ipfs://"):
+    return base + cid_v0(digest)
+
+
 GENERIC_NFT_DATA = [
-    "https://test",
+    "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
     "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
 ]
 SPECIAL_NFT_DATA = [
-    "https://test",
+    "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
     "194F55A6FA5CD48B9DD2CACDD9698792602A4EDCB72B9B7CB410124CCFD79078",
 ]
 BATCH_SPECIAL_NFT_DATA = [
     [
-        "https://test",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
         "d9a7e81efacc5660697cf4866d1af38e99275e02b2454b1dccaeb15adf66f575",
     ],
     [
-        "https://test1",
+        "d0cd2351c4f8bd0980e134209c33d2c7ae98faa3231c42b669c7d276acf8519a",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
     [
-        "https://test2",
+        "5108b9dade9e0b876bd88252dc28519d879e97d701d70e41496223e801544d7c",
         "f9a7e81efacc5660697cf4866d1af38e99275e02b2454b1dccaeb15adf66f575",
     ],
     [
-        "https://test3",
+        "c00795ee2024f1624f18f855337735415850e3e04e07b2894d23fb14b4b1b10e",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
     [
-        "https://test4",
+        "9ac13ef5bf842de60a1f8f927d6dfbaa048e8dc798b46c9ea694619f87edd096",
         "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078",
     ],
 ]
 
 FAILURE_NFT_DATA = [
-    ["", "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078"],
+    [ZERO_DIGEST, "194F55B6FA5CD48B9DD2CACDD9598792602A4EDCB72B9B7CB410124CCFD79078"],
     [
-        "https://test",
-        "",
+        "80ca539203d1e28a2ae239450df6299d3b90e266ffafe6c393c5c328aa54f782",
+        ZERO_DIGEST,
     ],
-    ["https://test", "0"],
+    [ZERO_DIGEST, ZERO_DIGEST],
 ]
-DUMMY_IPFS_HASH = "dummyhash"
+DUMMY_IPFS_HASH = "0x2db67be2bb0ea22be6b7dd77bc9bec240a8d72c617e3cd5ca582fd80b10a3db6"
+POOL_RESERVE_RATIO = 2000
+POOL_VIRTUAL_SHARES = 10 ** 6
+LAUNCH_FILTER_ACTIVE = 0
+LAUNCH_FILTER_ENDED = 1
+LAUNCH_FILTER_SUCCESSFUL = 2
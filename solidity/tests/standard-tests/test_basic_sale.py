@@ -8,7 +8,7 @@ def test_alt_launch(minted_launch, alt_launch_minted, accounts):
     alt_launch, stable, nft = alt_launch_minted
     launch, _ = minted_launch
     nft_main_id = 0
-    nft_alt_id = 9
+    nft_alt_id = 1 << 128
     assert nft.ownerOf(nft_main_id) == accounts[1]
     assert nft.ownerOf(nft_alt_id) == accounts[1]
     assert nft.launchAddressAssociatedWithToken(nft_main_id) == launch.address
@@ -55,6 +55,47 @@ def test_create_basic_launch(mint_dummy_token, deployed_factory, accounts):
     assert mint_dummy_token.balanceOf(launch_contract) == constants.AMOUNT_FOR_SALE
 
 
+def test_launch_registry_records_launch(running_launch, deployed_factory):
+    record = deployed_factory.launchRecords(0)
+    assert record == (
+        running_launch,
+        running_launch.launchStartTime(),
+        running_launch.governor(),
+        running_launch.launchEndTime(),
+        running_launch.tokenForLaunch(),
+    )
+    assert deployed_factory.getLaunchRecords(0, 10) == [record]
+    assert deployed_factory.getLaunchRecords(1, 10) == []
+
+
+def test_launch_registry_filters(running_launch, deployed_factory, accounts):
+    # before the start the launch is neither active nor ended
+    for launch_filter in (
+        constants.LAUNCH_FILTER_ACTIVE,
+        constants.LAUNCH_FILTER_ENDED,
+        constants.LAUNCH_FILTER_SUCCESSFUL,
+    ):
+        assert deployed_factory.getLaunchIds(launch_filter, 0, 10) == ([], 1)
+
+    start_delta = constants.START_DATE - time.time()
+    brownie.chain.sleep(int(start_delta) + 1)
+    brownie.chain.mine()
+    assert deployed_factory.getLaunchIds(constants.LAUNCH_FILTER_ACTIVE, 0, 10) == ([0], 1)
+
+    brownie.chain.sleep(int(constants.END_DATE - constants.START_DATE) + 1)
+    brownie.chain.mine()
+    assert deployed_factory.getLaunchIds(constants.LAUNCH_FILTER_ACTIVE, 0, 10) == ([], 1)
+    assert deployed_factory.getLaunchIds(constants.LAUNCH_FILTER_ENDED, 0, 10) == ([0], 1)
+    # nothing was raised so the launch did not succeed
+    assert deployed_factory.getLaunchIds(constants.LAUNCH_FILTER_SUCCESSFUL, 0, 10) == ([], 1)
+
+
+def test_launch_registry_successful_filter(successful_launch, deployed_factory):
+    brownie.chain.mine()
+    assert deployed_factory.getLaunchIds(constants.LAUNCH_FILTER_SUCCESSFUL, 0, 10) == ([0], 1)
+    assert deployed_factory.getLaunchIds(constants.LAUNCH_FILTER_SUCCESSFUL, 1, 10) == ([], 1)
+
+
 def test_create_basic_launch_fails_with_bad_nft_data(
     mint_dummy_token, deployed_factory, accounts
 ):
@@ -109,6 +150,31 @@ def test_no_send_if_not_whitelisted(
 
     
 
+def test_individual_cap_overrides_launch_cap(
+    running_launch, send_1000_stable_to_accounts, accounts
+):
+    stable_contract = send_1000_stable_to_accounts
+    investors = accounts[1:3]
+    running_launch.batchAddToWhitelist(investors, {"from": accounts[0]})
+    running_launch.batchSetIndividualCaps(
+        [accounts[1]], [constants.LOW_INPUT_AMOUNT], {"from": accounts[0]}
+    )
+    with brownie.reverts("Caller must be launcher"):
+        running_launch.batchSetIndividualCaps(
+            [accounts[2]], [constants.LOW_INPUT_AMOUNT], {"from": accounts[2]}
+        )
+    start_delta = constants.START_DATE - time.time()
+    brownie.chain.sleep(int(start_delta) + 1)
+    for inv in investors:
+        stable_contract.increaseAllowance(running_launch, 1000e18, {"from": inv})
+    running_launch.sendStable(constants.LOW_INPUT_AMOUNT, {"from": accounts[1]})
+    with brownie.reverts("You have reached the individual funding cap"):
+        running_launch.sendStable(1, {"from": accounts[1]})
+    running_launch.sendStable(1000e18, {"from": accounts[2]})
+    assert running_launch.fundsProvidedByAddress(accounts[1]) == constants.LOW_INPUT_AMOUNT
+    assert running_launch.fundsProvidedByAddress(accounts[2]) == 1000e18
+
+
 def test_receive_stable_from_same_twice(
     running_launch, send_1000_stable_to_accounts, accounts
 ):
@@ -139,7 +205,7 @@ def test_receive_stable_from_same_twice(
     for n, inv in enumerate(investors):
 
         assert nft.ownerOf(n) == inv
-        assert nft.tokenURI(n, {"from": inv}) == constants.BATCH_SPECIAL_NFT_DATA[n][0]
+        assert nft.tokenURI(n, {"from": inv}) == constants.token_uri(constants.BATCH_SPECIAL_NFT_DATA[n][0])
         assert (
             nft.tokenMetadataHashes(n, {"from": inv})
             == "0x" + constants.BATCH_SPECIAL_NFT_DATA[n][1]
@@ -194,6 +260,19 @@ def test_dev_can_tap_after_successful_launch(successful_launch, accounts):
     assert new_balance > initial_balance
 
 
+def test_stray_transfers_do_not_change_ledger(successful_launch, accounts):
+    launch_contract, stable_contract = successful_launch
+    stable_contract.transfer(launch_contract, 100e18, {"from": accounts[1]})
+    assert launch_contract.stableBalance() == launch_contract.totalFundsProvided()
+    assert launch_contract.tokenBalance() == constants.AMOUNT_FOR_SALE
+
+    initial_balance = stable_contract.balanceOf(accounts[0])
+    launch_contract.launcherTap({"from": accounts[0]})
+    tapped = stable_contract.balanceOf(accounts[0]) - initial_balance
+    assert launch_contract.stableBalance() == launch_contract.totalFundsProvided() - tapped
+    assert stable_contract.balanceOf(launch_contract) == launch_contract.stableBalance() + 100e18
+
+
 def test_dev_cannot_tap_after_failed_launch(failed_launch, accounts):
     with brownie.reverts(
         "The minimum amount was not raised or the launch has not finished"
@@ -395,6 +474,58 @@ def test_launcher_withdraw_unsold_tokens_fails(successful_launch, accounts):
         tx = launch_contract.withdrawUnsoldTokens({"from": accounts[0]})
 
 
+def test_finalize_caches_settlement(successful_launch, accounts):
+    launch_contract, _ = successful_launch
+    assert launch_contract.launchOutcome() == (False, False)
+    launch_contract.finalize({"from": accounts[5]})
+    assert launch_contract.launchOutcome() == (True, True)
+    assert (
+        launch_contract.launcherTapRate()
+        == launch_contract.totalFundsProvided() // constants.INITIAL_DEV_VESTING
+    )
+    with brownie.reverts("Launch already finalized"):
+        launch_contract.finalize({"from": accounts[5]})
+
+
+def test_claimed_tap_rate_is_exact(successful_launch, accounts):
+    launch_contract, _ = successful_launch
+    venture_bond_contract = brownie.VentureBond.at(
+        launch_contract.launchVentureBondAddress()
+    )
+    tx = launch_contract.claim({"from": accounts[1]})
+    token_id = tx.events["TokenMinted"]["tokenId"]
+    token_amount = venture_bond_contract.tappableBalance(token_id)
+    assert token_amount == int(constants.INVESTMENT_AMOUNT) * int(constants.FIXED_SWAP_RATE) // 10 ** 18
+    assert venture_bond_contract.tapRate(token_id) == token_amount // constants.INITIAL_INV_VESTING
+
+
+def test_finalize_before_end_fails(running_launch, accounts):
+    with brownie.reverts("The offering has not finished"):
+        running_launch.finalize({"from": accounts[0]})
+
+
+def test_unsold_tokens_withdrawn_once(
+    running_launch, accounts, send_1000_stable_to_accounts
+):
+    investors = accounts[1:3]
+    running_launch.batchAddToWhitelist(investors, {"from": accounts[0]})
+    brownie.chain.sleep(int(constants.START_DATE - time.time()) + 1)
+    for account in investors:
+        send_1000_stable_to_accounts.increaseAllowance(
+            running_launch, 1000e18, {"from": account}
+        )
+        running_launch.sendStable(1000e18, {"from": account})
+    brownie.chain.sleep(int(constants.END_DATE - constants.START_DATE) + 1)
+
+    withdraw = running_launch.withdrawUnsoldTokens({"from": accounts[0]})
+    assert (
+        withdraw.events["UnsoldTokensWithdrawn"]["amount"]
+        == constants.AMOUNT_FOR_SALE - 2000e18 * constants.FIXED_SWAP_RATE / 1e18
+    )
+    with brownie.reverts("All tokens sold"):
+        running_launch.withdrawUnsoldTokens({"from": accounts[0]})
+
+
 # this test scenario will use the same parameters but will have one less investor meaning there are left over tokens to withdraw
 def test_launcher_withdraw_unsold_tokens_succeeds(
     running_launch, accounts, send_1000_stable_to_accounts
@@ -472,3 +603,24 @@ def test_investors_tap_nft_after_failed_launch(
         launch_contract.supporterTap(0, {"from": accounts[1]})
 
 
+
+
+def test_deposits_filterable_by_supporter(successful_launch, deployed_factory, accounts):
+    launch, _ = successful_launch
+    system = brownie.PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    assert system.LOG_SCHEMA_VERSION() == 3
+
+    topic = brownie.web3.keccak(text="SupporterFundsDeposited(address,address,uint256)")
+    logs = brownie.web3.eth.get_logs(
+        {
+            "address": system.address,
+            "fromBlock": 0,
+            "topics": [
+                topic.hex(),
+                "0x" + launch.address[2:].lower().rjust(64, "0"),
+                "0x" + accounts[1].address[2:].lower().rjust(64, "0"),
+            ],
+        }
+    )
+    assert len(logs) == 1
+    assert int(logs[0]["data"], 16) == 1000e18
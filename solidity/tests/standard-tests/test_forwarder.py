@@ -0,0 +1,145 @@
+import brownie
+import time
+import constants
+from brownie import accounts, chain, web3, VentureBond
+from eth_abi import encode_abi
+from eth_account import Account
+
+FORWARD_REQUEST_TYPEHASH = web3.keccak(
+    text="ForwardRequest(address from,address to,uint256 value,uint256 gas,uint256 nonce,bytes data)"
+)
+
+
+def sign_request(forwarder, signer, to, data, gas=1000000):
+    nonce = forwarder.getNonce(signer.address)
+    struct_hash = web3.keccak(
+        encode_abi(
+            ["bytes32", "address", "address", "uint256", "uint256", "uint256", "bytes32"],
+            [
+                FORWARD_REQUEST_TYPEHASH,
+                signer.address,
+                to,
+                0,
+                gas,
+                nonce,
+                web3.keccak(hexstr=data),
+            ],
+        )
+    )
+    digest = web3.keccak(
+        b"\x19\x01" + bytes(forwarder.domainSeparator()) + bytes(struct_hash)
+    )
+    signed = Account.signHash(digest, signer.private_key)
+    request = [signer.address, to, 0, gas, nonce, data]
+    return request, signed.signature.hex()
+
+
+def relayed_supporter(running_launch, stable_contract, accounts):
+    supporter = accounts.add()
+    accounts[0].transfer(supporter, "1 ether")
+    stable_contract.mint(1000e18, {"from": supporter})
+    stable_contract.increaseAllowance(running_launch, 1000e18, {"from": supporter})
+    running_launch.batchAddToWhitelist([supporter], {"from": accounts[0]})
+    return supporter
+
+
+def test_relayed_send_stable(running_launch, stable_contract, forwarder, accounts):
+    start_delta = constants.START_DATE - time.time()
+    chain.sleep(int(start_delta) + 1)
+    supporter = relayed_supporter(running_launch, stable_contract, accounts)
+    relayer = accounts[9]
+
+    data = running_launch.sendStable.encode_input(1000e18)
+    request, signature = sign_request(forwarder, supporter, running_launch.address, data)
+    assert forwarder.verify(request, signature)
+    forwarder.execute(request, signature, {"from": relayer})
+
+    assert running_launch.fundsProvidedByAddress(supporter) == 1000e18
+    assert running_launch.fundsProvidedByAddress(relayer) == 0
+    assert forwarder.getNonce(supporter) == 1
+    # the same request cannot be replayed
+    assert not forwarder.verify(request, signature)
+    with brownie.reverts("PolylaunchForwarder: signature does not match request"):
+        forwarder.execute(request, signature, {"from": relayer})
+
+
+def test_relayed_batch_claim(running_launch, stable_contract, forwarder, accounts):
+    start_delta = constants.START_DATE - time.time()
+    chain.sleep(int(start_delta) + 1)
+    supporters = [
+        relayed_supporter(running_launch, stable_contract, accounts) for _ in range(3)
+    ]
+    send_data = running_launch.sendStable.encode_input(1000e18)
+    requests, signatures = zip(
+        *[sign_request(forwarder, s, running_launch.address, send_data) for s in supporters]
+    )
+    tx = forwarder.batchExecute(requests, signatures, {"from": accounts[9]})
+    assert tx.return_value == (True, True, True)
+    assert running_launch.totalFundsProvided() == 3000e18
+
+    chain.sleep(int(constants.END_DATE - constants.START_DATE) + 1)
+    claim_data = running_launch.claim.encode_input()
+    requests, signatures = zip(
+        *[sign_request(forwarder, s, running_launch.address, claim_data) for s in supporters]
+    )
+    # a request signed by the wrong key is skipped rather than reverting the batch
+    bad_request, bad_signature = sign_request(
+        forwarder, accounts.add(), running_launch.address, claim_data
+    )
+    bad_request[0] = supporters[0].address
+    tx = forwarder.batchExecute(
+        list(requests) + [bad_request],
+        list(signatures) + [bad_signature],
+        {"from": accounts[9]},
+    )
+    assert tx.return_value == (True, True, True, False)
+
+    nft = VentureBond.at(running_launch.launchVentureBondAddress())
+    for supporter in supporters:
+        assert nft.balanceOf(supporter) == 1
+    assert nft.balanceOf(accounts[9]) == 0
+
+
+def test_malformed_signatures_skipped_in_batch(running_launch, stable_contract, forwarder, accounts):
+    start_delta = constants.START_DATE - time.time()
+    chain.sleep(int(start_delta) + 1)
+    supporters = [
+        relayed_supporter(running_launch, stable_contract, accounts) for _ in range(2)
+    ]
+    data = running_launch.sendStable.encode_input(1000e18)
+    (request, signature), (other_request, other_signature) = [
+        sign_request(forwarder, s, running_launch.address, data) for s in supporters
+    ]
+    truncated = other_signature[:-2]
+    high_s = "0x" + "ff" * 65
+    bad_v = other_signature[:-2] + "00"
+    # r = 0 recovers to the zero address, which must not pass as a request from it
+    zero_request = [constants.ZERO_ADDRESS] + request[1:]
+    zero_signature = "0x" + "00" * 32 + "00" * 31 + "01" + "1b"
+    for bad_request, bad_signature in [
+        (other_request, truncated),
+        (other_request, high_s),
+        (other_request, bad_v),
+        (zero_request, zero_signature),
+    ]:
+        assert not forwarder.verify(bad_request, bad_signature)
+
+    tx = forwarder.batchExecute(
+        [request, other_request, other_request, other_request, zero_request],
+        [signature, truncated, high_s, bad_v, zero_signature],
+        {"from": accounts[9]},
+    )
+
+    assert tx.return_value == (True, False, False, False, False)
+    assert running_launch.fundsProvidedByAddress(supporters[0]) == 1000e18
+    assert running_launch.fundsProvidedByAddress(supporters[1]) == 0
+    assert forwarder.getNonce(supporters[1]) == 0
+
+
+def test_appended_sender_ignored_without_forwarder(running_launch, accounts):
+    start_delta = constants.START_DATE - time.time()
+    chain.sleep(int(start_delta) + 1)
+    data = running_launch.sendStable.encode_input(1000e18) + accounts[1].address[2:]
+    # accounts[2] is not whitelisted, appending a whitelisted address must not impersonate it
+    with brownie.reverts("msg.sender not whitelisted"):
+        accounts[2].transfer(running_launch, 0, data=data)
@@ -0,0 +1,574 @@
+import asyncio
+import time
+import aiohttp
+import constants
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+from brownie import chain, web3, GovernableERC20, GovernorAlpha, PolylaunchSystem, VentureBond
+from indexer import EventStore, Indexer, LaunchHistory, backfill, partition
+from indexer.columnar import ColumnStore, join_amounts, sum_amounts
+from indexer.rpc import RPCClient, RPCError, SyncRPC
+from scripts.index_events import system_abis
+
+MOCK_VAULT_ID = 1
+
+
+class RangeLimitedNode:
+    # node that refuses log queries over more than max_range blocks, like hosted providers do
+    def __init__(self, max_range):
+        self.max_range = max_range
+        self.queries = 0
+        self.eth = self
+
+    @property
+    def blockNumber(self):
+        return web3.eth.blockNumber
+
+    def getLogs(self, params):
+        self.queries += 1
+        if params["toBlock"] - params["fromBlock"] + 1 > self.max_range:
+            raise ValueError(
+                {"code": -32005, "message": "query returned more than 10000 results"}
+            )
+        return web3.eth.getLogs(params)
+
+    def getBlock(self, block_number):
+        return web3.eth.getBlock(block_number)
+
+    def call(self, transaction):
+        return web3.eth.call(transaction)
+
+
+class ReorgingNode(RangeLimitedNode):
+    # node whose chain is reorganised once, between the log queries and the header fetches of a batch
+    def __init__(self, reorg):
+        super().__init__(max_range=10 ** 9)
+        self.reorg = reorg
+
+    def getBlock(self, block_number):
+        if self.reorg is not None:
+            reorg, self.reorg = self.reorg, None
+            reorg()
+        return web3.eth.getBlock(block_number)
+
+
+def evm_snapshot():
+    # raw ganache snapshots, chain.snapshot() would replace the snapshot used for test isolation
+    return web3.provider.make_request("evm_snapshot", [])["result"]
+
+
+def evm_revert(snapshot_id):
+    web3.provider.make_request("evm_revert", [snapshot_id])
+
+
+def new_indexer(deployed_factory, store=None, node=web3, **kwargs):
+    return Indexer(
+        node,
+        store or EventStore(),
+        deployed_factory.polylaunchSystemAddress(),
+        system_abis(),
+        **kwargs
+    )
+
+
+def test_indexes_launch_events(minted_launch, deployed_factory):
+    launch, nft = minted_launch
+    indexer = new_indexer(deployed_factory)
+
+    indexer.sync()
+    store = indexer.store
+
+    assert store.get_cursor() == web3.eth.blockNumber
+    created = [l for l in store.launches() if l["launch"] == launch.address]
+    assert len(created) == 1
+    assert created[0]["ipfs_hash"] == constants.DUMMY_IPFS_HASH
+    deposits = store.events("SupporterFundsDeposited", launch=launch.address)
+    assert len(deposits) == 9
+    assert sum(e["args"]["amount"] for e in deposits) == launch.totalFundsProvided()
+    minted = store.events("TokenMinted", launch=launch.address)
+    assert [e["args"]["owner"] for e in minted] == [nft.ownerOf(e["args"]["tokenId"]) for e in minted]
+    assert store.count("Transfer") == 9
+
+
+def test_ignores_events_logged_for_unknown_launches(minted_launch, deployed_factory, accounts):
+    launch, _ = minted_launch
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    fake_launch = accounts[8].address
+    # the logger is open to anyone, a deposit can be logged for a launch that was never created
+    system.logSupporterFundsDeposited(fake_launch, accounts[1], 1000e18, {"from": accounts[1]})
+    indexer = new_indexer(deployed_factory)
+
+    indexer.sync()
+
+    assert indexer.store.events(launch=fake_launch) == []
+    assert indexer.store.launch_funding(fake_launch)[1] == 0
+    deposits = indexer.store.portfolio(accounts[1].address)["deposits"]
+    assert fake_launch not in [d["launch"] for d in deposits]
+    assert indexer.store.launch_funding(launch.address) == (launch.totalFundsProvided(), 9)
+
+
+def test_resumes_from_cursor(minted_launch, deployed_factory, accounts):
+    launch, _ = minted_launch
+    store = EventStore()
+    first = new_indexer(deployed_factory, store).sync()
+
+    chain.sleep(86400)
+    launch.launcherTap({"from": accounts[0]})
+    # a new indexer over the same store picks up from the committed cursor
+    second = new_indexer(deployed_factory, store).sync()
+
+    assert second == 1
+    assert store.count() == first + 1
+    assert store.events("LauncherFundsTapped")[0]["launch"] == launch.address
+    assert new_indexer(deployed_factory, store).sync() == 0
+
+
+def test_splits_ranges_the_node_refuses(minted_launch, deployed_factory):
+    expected = new_indexer(deployed_factory)
+    expected.sync()
+    node = RangeLimitedNode(max_range=8)
+    indexer = new_indexer(deployed_factory, node=node, batch_size=64)
+
+    indexer.sync()
+
+    assert indexer.batch_size <= 16
+    assert indexer.store.count() == expected.store.count()
+    assert [e["tx_hash"] for e in indexer.store.events()] == [
+        e["tx_hash"] for e in expected.store.events()
+    ]
+
+
+def test_partitions_cover_range():
+    assert partition(0, 9, 4) == [(0, 2), (3, 5), (6, 8), (9, 9)]
+    assert partition(5, 5, 8) == [(5, 5)]
+
+
+def test_parallel_backfill_matches_incremental(minted_launch, deployed_factory):
+    expected = new_indexer(deployed_factory)
+    expected.sync()
+    indexer = new_indexer(deployed_factory, batch_size=16)
+
+    written = backfill(indexer, web3.provider.endpoint_uri, workers=2, partitions=5)
+
+    assert written == expected.store.count()
+    assert indexer.store.get_cursor() == expected.store.get_cursor()
+    assert indexer.store.launches() == expected.store.launches()
+    assert indexer.store.events() == expected.store.events()
+    # the incremental indexer carries on from the backfilled cursor
+    assert indexer.sync() == 0
+
+
+def test_rolls_back_reorganised_deposits(
+    running_launch, send_1000_stable_to_accounts, deployed_factory, accounts
+):
+    stable = send_1000_stable_to_accounts
+    start_delta = constants.START_DATE - time.time()
+    chain.sleep(int(start_delta) + 1)
+    running_launch.batchAddToWhitelist(accounts[1:4], {"from": accounts[0]})
+    for account in accounts[1:4]:
+        stable.increaseAllowance(running_launch, 1000e18, {"from": account})
+    running_launch.sendStable(1000e18, {"from": accounts[1]})
+    indexer = new_indexer(deployed_factory)
+    indexer.sync()
+
+    snapshot = evm_snapshot()
+    running_launch.sendStable(1000e18, {"from": accounts[2]})
+    indexer.sync()
+    assert indexer.store.launch_funding(running_launch.address) == (2000e18, 2)
+
+    evm_revert(snapshot)
+    # the replacing chain has a different deposit and overtakes the orphaned blocks
+    running_launch.sendStable(500e18, {"from": accounts[3]})
+    chain.mine(2)
+    indexer.sync()
+
+    assert indexer.store.launch_funding(running_launch.address) == (
+        running_launch.totalFundsProvided(),
+        2,
+    )
+    deposits = indexer.store.events("SupporterFundsDeposited")
+    assert [e["args"]["sender"] for e in deposits] == [accounts[1], accounts[3]]
+
+
+def test_rolls_back_reorganised_transfers_and_votes(
+    minted_launch, deployed_factory, accounts
+):
+    launch, nft = minted_launch
+    governor = GovernorAlpha.at(launch.governor())
+    token_ids = [nft.tokenOfOwnerByIndex(account, 0) for account in accounts[1:4]]
+    proposal_id = governor.proposeTapIncrease(
+        launch.launcherTapRate() + 5, "Increase tap rate by 5", {"from": accounts[0]}
+    ).return_value
+    chain.sleep(61)
+    governor.castVote(token_ids[0], proposal_id, True, {"from": accounts[1]})
+    indexer = new_indexer(deployed_factory)
+    indexer.sync()
+
+    snapshot = evm_snapshot()
+    governor.castVote(token_ids[1], proposal_id, False, {"from": accounts[2]})
+    nft.transferFrom(accounts[3], accounts[9], token_ids[2], {"from": accounts[3]})
+    indexer.sync()
+    assert indexer.store.bond_owner(token_ids[2]) == accounts[9]
+    assert indexer.store.vote_tally(governor.address, proposal_id)[2] == 2
+
+    evm_revert(snapshot)
+    # a reorg to a shorter chain is caught without waiting for new blocks
+    indexer.sync()
+
+    proposal = governor.proposals(proposal_id)
+    assert indexer.store.vote_tally(governor.address, proposal_id) == (
+        proposal["forVotes"],
+        proposal["againstVotes"],
+        1,
+    )
+    assert indexer.store.bond_owner(token_ids[2]) == accounts[3]
+    assert indexer.store.count("VoteCast") == 1
+    assert indexer.store.get_cursor() == web3.eth.blockNumber
+
+
+def test_recollects_batch_reorganised_while_fetched(
+    running_launch, send_1000_stable_to_accounts, deployed_factory, accounts
+):
+    stable = send_1000_stable_to_accounts
+    start_delta = constants.START_DATE - time.time()
+    chain.sleep(int(start_delta) + 1)
+    running_launch.batchAddToWhitelist(accounts[1:4], {"from": accounts[0]})
+    for account in accounts[1:4]:
+        stable.increaseAllowance(running_launch, 1000e18, {"from": account})
+    running_launch.sendStable(1000e18, {"from": accounts[1]})
+    snapshot = evm_snapshot()
+    running_launch.sendStable(1000e18, {"from": accounts[2]})
+
+    def reorg():
+        evm_revert(snapshot)
+        running_launch.sendStable(500e18, {"from": accounts[3]})
+        chain.mine(2)
+
+    # the logs are read from the orphaned chain and the headers from the one replacing it
+    indexer = new_indexer(deployed_factory, node=ReorgingNode(reorg))
+    indexer.sync()
+
+    assert indexer.store.launch_funding(running_launch.address) == (
+        running_launch.totalFundsProvided(),
+        2,
+    )
+    deposits = indexer.store.events("SupporterFundsDeposited")
+    assert [e["args"]["sender"] for e in deposits] == [accounts[1], accounts[3]]
+    for block_number, block_hash in indexer.store.checkpoints(indexer.store.get_cursor()):
+        assert block_hash == web3.toHex(web3.eth.getBlock(block_number)["hash"])
+
+
+def test_aggregates_match_launch_and_bonds(minted_launch, deployed_factory, accounts):
+    launch, nft = minted_launch
+    token_ids = [nft.tokenOfOwnerByIndex(account, 0) for account in accounts[1:10]]
+    chain.sleep(1000000)
+    for account, token_id in zip(accounts[1:4], token_ids):
+        launch.supporterTap(token_id, {"from": account})
+    launcher_tapped = launch.launcherTap({"from": accounts[0]}).events[
+        "LauncherFundsTapped"
+    ]["amount"]
+    indexer = new_indexer(deployed_factory)
+
+    indexer.sync()
+
+    totals = indexer.store.launch_aggregates(launch.address)
+    assert totals["raised"] == launch.totalFundsProvided()
+    assert totals["deposits"] == 9
+    assert totals["supporters"] == 9
+    assert totals["launcher_tapped"] == launcher_tapped
+    assert totals["supporter_taps"] == 3
+    for token_id in token_ids:
+        bond = indexer.store.bond_aggregates(token_id)
+        assert bond["launch"] == launch.address
+        assert bond["remaining"] == nft.tappableBalance(token_id)
+        assert bond["remaining"] + bond["tapped"] == nft.votingPower(token_id)
+    assert sum(indexer.store.bond_aggregates(t)["tapped"] for t in token_ids) == totals[
+        "supporter_tapped"
+    ]
+    assert len(indexer.store.launch_supporters(launch.address)) == 9
+
+
+def test_aggregates_track_refunds(successful_launch, deployed_factory, accounts):
+    launch, _ = successful_launch
+    governor = GovernorAlpha.at(launch.governor())
+    token = GovernableERC20.at(launch.tokenForLaunch())
+    nft = VentureBond.at(launch.launchVentureBondAddress())
+    chain.sleep(1000000)
+    for account in accounts[1:10]:
+        launch.claim({"from": account})
+        token.delegate(account, {"from": account})
+    token_ids = [nft.tokenOfOwnerByIndex(account, 0) for account in accounts[1:10]]
+    launch.supporterTap(token_ids[1], {"from": accounts[2]})
+    proposal_id = governor.proposeRefund(
+        "Want a refund because reasons", token_ids[0], {"from": accounts[1]}
+    ).return_value
+    chain.sleep(61)
+    for account, token_id in zip(accounts[1:10], token_ids):
+        governor.castVote(token_id, proposal_id, True, {"from": account})
+    chain.sleep(86400)
+    governor.queue(proposal_id, {"from": accounts[0]})
+    chain.sleep(86401)
+    governor.execute(proposal_id, {"from": accounts[0]})
+    refunded = 0
+    for account, token_id in zip(accounts[1:4], token_ids):
+        token.approve(launch, token.balanceOf(account), {"from": account})
+        refunded += launch.claimRefund(token_id, {"from": account}).return_value
+    indexer = new_indexer(deployed_factory)
+
+    indexer.sync()
+
+    totals = indexer.store.launch_aggregates(launch.address)
+    assert totals["refunded"] == refunded
+    assert totals["refunds"] == 3
+    assert totals["supporter_taps"] == 1
+    for token_id in token_ids:
+        assert indexer.store.bond_aggregates(token_id)["remaining"] == nft.tappableBalance(
+            token_id
+        )
+    assert indexer.store.vote_tally(governor.address, proposal_id)[2] == 9
+
+
+def test_bond_minted_without_indexed_deposit(accounts):
+    store = EventStore()
+    launch, bond, owner = accounts[7].address, accounts[8].address, accounts[1].address
+    # the deposits were made before the indexer's start block
+    minted = (10, 0, "0x" + "00" * 32, bond, "TokenMinted", launch, {"tokenId": 5, "owner": owner})
+    store.commit_batch(10, [minted], blocks=[(10, "0x" + "01" * 32, "0x" + "00" * 32, 0)])
+
+    assert store.portfolio(owner)["deposits"] == []
+    assert store.launch_supporters(launch) == []
+    aggregates = store.bond_aggregates(5)
+    assert aggregates["launch"] == launch
+    assert aggregates["remaining"] == 0
+
+
+def test_portfolio_of_wallet(minted_launch_with_bid, deployed_factory, stable_contract, accounts):
+    launch, nft = minted_launch_with_bid
+    token_id = nft.tokenOfOwnerByIndex(accounts[1], 0)
+    nft.setAsk(token_id, [constants.ASK_PRICE, stable_contract.address], {"from": accounts[1]})
+    governor = GovernorAlpha.at(launch.governor())
+    proposal_id = governor.proposeTapIncrease(
+        launch.launcherTapRate() + 5, "Increase tap rate by 5", {"from": accounts[0]}
+    ).return_value
+    chain.sleep(61)
+    governor.castVote(token_id, proposal_id, True, {"from": accounts[1]})
+    indexer = new_indexer(deployed_factory)
+    indexer.sync()
+
+    portfolio = indexer.store.portfolio(accounts[1].address)
+    assert portfolio["deposits"] == [{"launch": launch.address, "provided": 1000e18}]
+    assert portfolio["bonds"] == [{"token_id": token_id, "launch": launch.address}]
+    assert portfolio["asks"] == [
+        {
+            "token_id": token_id,
+            "launch": launch.address,
+            "amount": constants.ASK_PRICE,
+            "currency": stable_contract.address,
+        }
+    ]
+    assert [(v["proposal_id"], v["token_id"], v["support"]) for v in portfolio["votes"]] == [
+        (proposal_id, token_id, True)
+    ]
+    bids = indexer.store.portfolio(accounts[2].address)["bids"]
+    assert [(b["token_id"], b["amount"]) for b in bids] == [(0, constants.BID_PRICE)]
+
+    # a transfer moves the bond and drops its ask, a removed bid is no longer open
+    nft.transferFrom(accounts[1], accounts[5], token_id, {"from": accounts[1]})
+    nft.removeBid(0, {"from": accounts[2]})
+    indexer.sync()
+
+    portfolio = indexer.store.portfolio(accounts[1].address)
+    assert portfolio["bonds"] == []
+    assert portfolio["asks"] == []
+    assert len(portfolio["votes"]) == 1
+    assert token_id in [b["token_id"] for b in indexer.store.portfolio(accounts[5].address)["bonds"]]
+    assert indexer.store.portfolio(accounts[5].address)["asks"] == []
+    assert indexer.store.portfolio(accounts[2].address)["bids"] == []
+
+
+def test_launch_state_at_past_blocks(successful_launch, mock_vault, deployed_factory, accounts):
+    launch, _ = successful_launch
+    # settled through the bare finalize() call, before any claim or tap
+    finalized_at = launch.finalize({"from": accounts[0]}).block_number
+    for account in accounts[1:10]:
+        launch.claim({"from": account})
+    nft = VentureBond.at(launch.launchVentureBondAddress())
+    governor = GovernorAlpha.at(launch.governor())
+    launch.deposit(MOCK_VAULT_ID, {"from": accounts[0]})
+    proposal_id = governor.proposeTapIncrease(
+        launch.launcherTapRate() + 5, "Increase tap rate by 5", {"from": accounts[0]}
+    ).return_value
+    chain.sleep(61)
+    for account in accounts[1:10]:
+        governor.castVote(nft.tokenOfOwnerByIndex(account, 0), proposal_id, True, {"from": account})
+    chain.sleep(86400)
+    governor.queue(proposal_id, {"from": accounts[0]})
+    chain.sleep(86401)
+    governor.execute(proposal_id, {"from": accounts[0]})
+    indexer = new_indexer(deployed_factory)
+    indexer.sync()
+    history = LaunchHistory(indexer.store, interval=4)
+
+    event_blocks = {e["block_number"] for e in indexer.store.events(launch=launch.address)}
+    blocks = sorted(event_blocks | {b - 1 for b in event_blocks} | {web3.eth.blockNumber})
+    expected = {}
+    for block in blocks:
+        state = history.state_at(launch.address, block)
+        finalized, successful = launch.launchOutcome(block_identifier=block)
+        assert state["raised"] == launch.totalFundsProvided(block_identifier=block)
+        assert state["tap_rate"] == launch.launcherTapRate(block_identifier=block)
+        assert (state["finalized"], state["successful"]) == (finalized, successful)
+        assert state["vault_activated"] == launch.activated(block_identifier=block)
+        expected[block] = state
+
+    assert finalized_at in blocks
+    assert expected[finalized_at]["tap_rate"] == launch.launcherTapRate(block_identifier=finalized_at) > 0
+    assert history.compact() > 0
+    # replaying from the snapshots gives the same states, and the next compaction has nothing left to do
+    assert {b: history.state_at(launch.address, b) for b in blocks} == expected
+    assert history.compact() == 0
+    assert expected[blocks[-1]]["vault_id"] == MOCK_VAULT_ID
+
+
+def test_columns_follow_store(minted_launch, deployed_factory, accounts, tmp_path):
+    launch, nft = minted_launch
+    store = EventStore()
+    indexer = new_indexer(deployed_factory, store, columns=ColumnStore(tmp_path / "live"))
+    indexer.sync()
+    chain.sleep(86400)
+    tapped = launch.launcherTap({"from": accounts[0]}).events["LauncherFundsTapped"]["amount"]
+    indexer.sync()
+
+    columns = ColumnStore(tmp_path / "live")
+    assert columns.cursor == store.get_cursor()
+    assert columns.funding_by_launch() == {launch.address: launch.totalFundsProvided()}
+    deposits = columns.scan("SupporterFundsDeposited")
+    assert join_amounts(deposits["amount_lo"], deposits["amount_hi"]) == [
+        e["args"]["amount"] for e in store.events("SupporterFundsDeposited")
+    ]
+    assert [columns.addresses.addresses[i] for i in deposits["sender"]] == accounts[1:10]
+    taps = columns.scan("LauncherFundsTapped")
+    assert sum_amounts(taps["amount_lo"], taps["amount_hi"]) == tapped
+    # a column store added to an existing index is filled from the sqlite store
+    late = ColumnStore(tmp_path / "late")
+    new_indexer(deployed_factory, store, columns=late)
+    assert late.funding_by_launch() == columns.funding_by_launch()
+    assert late.volume_by_day("LauncherFundsTapped")[1] == [tapped]
+
+
+def test_indexes_over_batched_rpc(minted_launch, deployed_factory):
+    expected = new_indexer(deployed_factory)
+    expected.sync()
+    node = SyncRPC(web3.provider.endpoint_uri, batch_size=4)
+    indexer = new_indexer(deployed_factory, node=node)
+
+    indexer.sync()
+
+    assert indexer.store.events() == expected.store.events()
+    assert indexer.store.launches() == expected.store.launches()
+    assert indexer.store.checkpoints(web3.eth.blockNumber) == expected.store.checkpoints(
+        web3.eth.blockNumber
+    )
+    # headers are fetched in batches rather than one request each
+    assert node.client.stats["requests"] < node.client.stats["calls"]
+    node.close()
+
+
+def test_batched_view_calls(minted_launch, accounts):
+    launch, nft = minted_launch
+    node = SyncRPC(web3.provider.endpoint_uri, batch_size=2, concurrency=2)
+    views = [launch.totalFundsProvided, launch.salePrice, launch.launcherTapRate]
+    token_ids = [nft.tokenOfOwnerByIndex(account, 0) for account in accounts[1:10]]
+    transactions = [{"to": launch.address, "data": view.encode_input()} for view in views] + [
+        {"to": nft.address, "data": nft.tappableBalance.encode_input(t)} for t in token_ids
+    ]
+
+    results = node.calls(transactions)
+
+    assert [v.decode_output("0x" + r.hex()) for v, r in zip(views, results)] == [v() for v in views]
+    assert [nft.tappableBalance.decode_output("0x" + r.hex()) for r in results[3:]] == [
+        nft.tappableBalance(t) for t in token_ids
+    ]
+    # a reverting call fails on its own when errors are returned in place
+    reverting = {"to": launch.address, "data": launch.supporterTap.encode_input(token_ids[0])}
+    results = node.calls([reverting, transactions[0]], raise_errors=False)
+    assert isinstance(results[0], RPCError)
+    assert results[1] == node.call(transactions[0])
+    node.close()
+
+
+def stub_node(statuses):
+    # node answering eth_blockNumber after failing with each of statuses in turn, it never answers other methods
+    async def handle(request):
+        payload = await request.json()
+        if statuses:
+            return web.Response(status=statuses.pop(0))
+        return web.json_response(
+            [
+                {"jsonrpc": "2.0", "id": call["id"], "result": "0x10"}
+                for call in payload
+                if call["method"] == "eth_blockNumber"
+            ]
+        )
+
+    app = web.Application()
+    app.router.add_post("/", handle)
+    return TestServer(app)
+
+
+def run_against(server, test):
+    async def run():
+        await server.start_server()
+        try:
+            return await test(str(server.make_url("/")))
+        finally:
+            await server.close()
+
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(run())
+    finally:
+        loop.close()
+
+
+def test_retries_throttled_requests():
+    async def test(url):
+        async with RPCClient(url, backoff=0.01) as client:
+            number = await client.block_number()
+            return number, dict(client.stats)
+
+    number, stats = run_against(stub_node([429, 503, 502]), test)
+
+    assert number == 16
+    assert stats["requests"] == 4
+    assert stats["retries"] == 3
+
+
+def test_gives_up_after_retries():
+    async def test(url):
+        async with RPCClient(url, retries=2, backoff=0.01) as client:
+            with pytest.raises(aiohttp.ClientResponseError) as error:
+                await client.block_number()
+            return error.value.status, dict(client.stats)
+
+    status, stats = run_against(stub_node([504] * 3), test)
+
+    assert status == 504
+    assert stats["requests"] == 3
+
+
+def test_missing_batch_responses_are_errors():
+    async def test(url):
+        async with RPCClient(url) as client:
+            results = await client.batch(
+                [("eth_blockNumber", ()), ("eth_chainId", ())], raise_errors=False
+            )
+            with pytest.raises(RPCError):
+                await client.request("eth_chainId")
+            return results
+
+    results = run_against(stub_node([]), test)
+
+    assert results[0] == "0x10"
+    assert isinstance(results[1], RPCError)
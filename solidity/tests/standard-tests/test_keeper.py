@@ -0,0 +1,90 @@
+import brownie
+from brownie import accounts, chain, web3, PolylaunchSystem
+from indexer.rpc import SyncRPC
+from scripts.keeper import due_launches, known_launches
+
+MOCK_VAULT_ID = 1
+
+
+def test_keeper_status_before_finalize(successful_launch, deployed_factory):
+    launch, _ = successful_launch
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    chain.sleep(86400)
+    chain.mine()
+
+    tap_due, harvestable = system.keeperStatus([launch])
+
+    assert launch.launchOutcome() == (False, False)
+    assert tap_due[0] > 0
+    assert harvestable[0] == 0
+
+
+def test_due_launches_over_batched_rpc(successful_launch, deployed_factory):
+    launch, _ = successful_launch
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    chain.sleep(30 * 86400)
+    chain.mine()
+    node = SyncRPC(web3.provider.endpoint_uri)
+
+    # one keeperStatus call per launch, sent in a single batch request
+    to_tap, to_harvest = due_launches(system, [launch, launch], node, page_size=1)
+    node.close()
+
+    assert to_tap == [launch, launch]
+    assert to_harvest == []
+
+
+def test_batch_launcher_tap_skips_launches(successful_launch, deployed_factory, accounts):
+    launch, stable = successful_launch
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    chain.sleep(86400)
+    initial_balance = stable.balanceOf(accounts[0])
+
+    # the second entry has nothing due once the first has tapped, the stable contract reverts
+    tx = system.batchLauncherTap([launch, launch, stable], {"from": accounts[9]})
+
+    assert tx.return_value == (True, False, False)
+    tapped = tx.events["LauncherFundsTapped"]["amount"]
+    assert tapped > 0
+    # a keeper tap still pays the launcher, not the keeper
+    assert stable.balanceOf(accounts[0]) - initial_balance == tapped
+
+
+def test_keeper_tap_only_from_system(successful_launch, accounts):
+    launch, _ = successful_launch
+    with brownie.reverts("Caller must be PolylaunchSystem contract"):
+        launch.keeperTap({"from": accounts[0]})
+    with brownie.reverts("Caller must be PolylaunchSystem contract"):
+        launch.harvest({"from": accounts[0]})
+
+
+def test_batch_harvest(successful_launch, mock_vault, deployed_factory, accounts):
+    launch, stable = successful_launch
+    vault, _ = mock_vault
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    raised = launch.totalFundsProvided()
+    launch.deposit(MOCK_VAULT_ID, {"from": accounts[0]})
+    # simulate yield accruing to the vault
+    stable.mint(900e18, {"from": accounts[9]})
+    stable.transfer(vault, 900e18, {"from": accounts[9]})
+    system_balance = stable.balanceOf(system)
+    assert system.keeperStatus([launch])[1][0] == 900e18
+
+    tx = system.batchHarvest([launch, launch], {"from": accounts[9]})
+
+    assert tx.return_value == 450e18
+    assert stable.balanceOf(system) - system_balance == 450e18
+    assert launch.retainedYield() == 450e18
+    assert launch.activated()
+
+    # yield already harvested is not charged again on exit
+    launch.exitFromVault({"from": accounts[0]})
+    assert stable.balanceOf(system) - system_balance == 450e18
+    assert launch.stableBalance() == raised + 450e18
+    assert launch.retainedYield() == 0
+
+
+def test_known_launches_pages_the_launch_records(running_launch, deployed_factory):
+    launches = known_launches(deployed_factory, page_size=1)
+    assert len(launches) == deployed_factory.launchIdCounter()
+    assert running_launch in launches
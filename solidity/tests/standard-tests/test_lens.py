@@ -0,0 +1,132 @@
+import constants
+from brownie import chain
+
+LAUNCH_VIEW_FIELDS = [
+    "launchId",
+    "launchAddress",
+    "launcher",
+    "governor",
+    "token",
+    "ventureBond",
+    "market",
+    "startTime",
+    "endTime",
+    "softCap",
+    "hardCap",
+    "individualCap",
+    "salePrice",
+    "tokensForSale",
+    "totalFundsProvided",
+    "stableBalance",
+    "tokenBalance",
+    "launcherTapRate",
+    "launcherVestingPeriod",
+    "supporterVestingPeriod",
+    "totalVotingPower",
+    "finalized",
+    "successful",
+    "vaultActivated",
+    "vaultId",
+    "vaultRemainingBalance",
+    "ipfsHash",
+]
+
+
+def as_dict(view):
+    return dict(zip(LAUNCH_VIEW_FIELDS, view))
+
+
+def test_get_launch_matches_launch_views(successful_launch, lens, accounts):
+    launch, _ = successful_launch
+    launch.finalize({"from": accounts[0]})
+
+    view = as_dict(lens.getLaunch(launch))
+
+    assert view["launchId"] == launch.launchId()
+    assert view["launchAddress"] == launch
+    assert view["launcher"] == accounts[0]
+    assert view["governor"] == launch.governor()
+    assert view["token"] == launch.tokenForLaunch()
+    assert view["startTime"] == launch.launchStartTime()
+    assert view["endTime"] == launch.launchEndTime()
+    assert view["softCap"] == constants.MINIMUM_FUNDING
+    assert view["totalFundsProvided"] == launch.totalFundsProvided()
+    assert view["launcherTapRate"] == launch.launcherTapRate()
+    assert view["finalized"] and view["successful"]
+    assert not view["vaultActivated"]
+    assert view["ipfsHash"] == constants.DUMMY_IPFS_HASH
+
+
+def test_get_launches_paginates(running_launch, alt_launch_minted, deployed_factory, lens):
+    alt_launch, _, _ = alt_launch_minted
+    assert deployed_factory.launchIdCounter() == 2
+
+    first_page = lens.getLaunches(deployed_factory, 0, 1)
+    second_page = lens.getLaunches(deployed_factory, 1, 10)
+
+    assert len(first_page) == 1
+    assert as_dict(first_page[0])["launchAddress"] == running_launch
+    assert len(second_page) == 1
+    assert as_dict(second_page[0])["launchAddress"] == alt_launch
+    assert len(lens.getLaunches(deployed_factory, 2, 10)) == 0
+
+
+def test_get_launches_by_address(running_launch, alt_launch_minted, lens):
+    alt_launch, _, _ = alt_launch_minted
+    views = lens.getLaunchesByAddress([alt_launch, running_launch])
+    assert [as_dict(v)["launchAddress"] for v in views] == [alt_launch, running_launch]
+
+
+BOND_VIEW_FIELDS = [
+    "tokenId",
+    "launchAddress",
+    "launchId",
+    "token",
+    "tapRate",
+    "lastWithdrawnTime",
+    "tappableBalance",
+    "votingPower",
+    "withdrawable",
+    "successful",
+]
+
+
+def bond_dict(view):
+    return dict(zip(BOND_VIEW_FIELDS, view))
+
+
+def test_get_bonds_of_owner(alt_launch_minted, lens, accounts):
+    launch, _, nft = alt_launch_minted
+    for holder in accounts[2:4]:
+        nft.transferFrom(holder, accounts[1], nft.tokenOfOwnerByIndex(holder, 0), {"from": holder})
+    chain.sleep(86400)
+    chain.mine()
+
+    first_page, total = lens.getBondsOfOwner(nft, accounts[1], 0, 2)
+    second_page, _ = lens.getBondsOfOwner(nft, accounts[1], 2, 2)
+
+    assert total == 3
+    assert len(first_page) == 2
+    assert len(second_page) == 1
+    token_ids = [bond_dict(v)["tokenId"] for v in list(first_page) + list(second_page)]
+    assert token_ids == [nft.tokenOfOwnerByIndex(accounts[1], i) for i in range(3)]
+
+    bond = bond_dict(first_page[0])
+    token_id = bond["tokenId"]
+    assert bond["launchAddress"] == launch
+    assert bond["token"] == launch.tokenForLaunch()
+    assert bond["tapRate"] == nft.tapRate(token_id)
+    assert bond["votingPower"] == nft.votingPower(token_id)
+    assert bond["successful"]
+    expected = min(
+        nft.tapRate(token_id) * (chain.time() - nft.lastWithdrawnTime(token_id)),
+        nft.tappableBalance(token_id),
+    )
+    assert abs(bond["withdrawable"] - expected) <= nft.tapRate(token_id)
+
+
+def test_get_bonds_of_owner_without_bonds(alt_launch_minted, lens, accounts):
+    _, _, nft = alt_launch_minted
+    views, total = lens.getBondsOfOwner(nft, accounts[0], 0, 10)
+    assert total == 0
+    assert len(views) == 0
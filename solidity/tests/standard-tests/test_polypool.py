@@ -0,0 +1,160 @@
+import brownie
+import constants
+from brownie import accounts, chain, PolylaunchSystem
+
+POOL_ID = 2
+
+
+def test_deposit_issues_pool_shares(successful_launch, poly_pool, mock_vault, accounts):
+    launch, stable = successful_launch
+    pool, adapter = poly_pool
+    vault, _ = mock_vault
+    raised = launch.totalFundsProvided()
+
+    tx = launch.deposit(POOL_ID, {"from": accounts[0]})
+
+    assert tx.events["VaultFundsDeposited"]["vaultAdapter"] == adapter
+    # the shares are held by the launch's clone of the pooled adapter
+    position = launch.selectedVaultAdapter()
+    assert pool.sharesOf(position) == raised
+    assert pool.balanceOfUnderlying(position) == raised
+    # deposits wait in the reserve until the pool is rebalanced
+    assert pool.reserve() == raised
+    assert vault.balanceOfUnderlying(pool.underlyingAdapter()) == 0
+
+
+def test_rebalance_invests_surplus(successful_launch, poly_pool, mock_vault, accounts):
+    launch, _ = successful_launch
+    pool, _ = poly_pool
+    vault, _ = mock_vault
+    raised = launch.totalFundsProvided()
+    launch.deposit(POOL_ID, {"from": accounts[0]})
+
+    tx = pool.rebalance({"from": accounts[9]})
+
+    target = raised * constants.POOL_RESERVE_RATIO // 10000
+    assert tx.events["PoolRebalanced"]["invested"] == raised - target
+    assert pool.reserve() == target
+    assert vault.balanceOfUnderlying(pool.underlyingAdapter()) == raised - target
+    assert pool.totalAssets() == raised
+
+
+def test_tap_is_paid_from_reserve(successful_launch, poly_pool, mock_vault, accounts):
+    launch, stable = successful_launch
+    pool, _ = poly_pool
+    vault, _ = mock_vault
+    launch.deposit(POOL_ID, {"from": accounts[0]})
+    pool.rebalance({"from": accounts[9]})
+    invested = vault.balanceOfUnderlying(pool.underlyingAdapter())
+    chain.sleep(86400)
+
+    initial_balance = stable.balanceOf(accounts[0])
+    tx = launch.launcherTap({"from": accounts[0]})
+    tapped = tx.events["VaultFundsTapped"]["amount"]
+
+    assert tapped > 0
+    assert stable.balanceOf(accounts[0]) - initial_balance == tapped
+    # the underlying vault is not touched while the reserve can cover the tap
+    assert vault.balanceOfUnderlying(pool.underlyingAdapter()) == invested
+
+
+def test_yield_is_shared_by_depositors(successful_launch, poly_pool, mock_vault, accounts):
+    launch, stable = successful_launch
+    pool, _ = poly_pool
+    vault, _ = mock_vault
+    raised = launch.totalFundsProvided()
+    launch.deposit(POOL_ID, {"from": accounts[0]})
+    stable.mint(raised, {"from": accounts[9]})
+    stable.approve(pool, raised, {"from": accounts[9]})
+    pool.deposit(raised, {"from": accounts[9]})
+    pool.rebalance({"from": accounts[9]})
+
+    # simulate yield accruing to the underlying vault
+    stable.mint(1000e18, {"from": accounts[8]})
+    stable.transfer(vault, 1000e18, {"from": accounts[8]})
+
+    position = launch.selectedVaultAdapter()
+    assert pool.sharesOf(position) == pool.sharesOf(accounts[9])
+    assert pool.balanceOfUnderlying(position) == pool.balanceOfUnderlying(accounts[9])
+    # the virtual shares take a negligible part of the yield
+    assert 0 <= raised + 500e18 - pool.balanceOfUnderlying(position) <= constants.POOL_VIRTUAL_SHARES
+
+
+def test_exit_divests_shortfall(
+    successful_launch, poly_pool, mock_vault, deployed_factory, accounts
+):
+    launch, stable = successful_launch
+    pool, _ = poly_pool
+    vault, _ = mock_vault
+    raised = launch.totalFundsProvided()
+    system = deployed_factory.polylaunchSystemAddress()
+    launch.deposit(POOL_ID, {"from": accounts[0]})
+    position = launch.selectedVaultAdapter()
+    pool.rebalance({"from": accounts[9]})
+    stable.mint(900e18, {"from": accounts[9]})
+    stable.transfer(vault, 900e18, {"from": accounts[9]})
+    system_balance = stable.balanceOf(system)
+
+    launch.exitFromVault({"from": accounts[0]})
+
+    excess = stable.balanceOf(system) - system_balance
+    assert not launch.activated()
+    assert pool.sharesOf(position) == 0
+    assert pool.totalShares() == 0
+    assert launch.stableBalance() == stable.balanceOf(launch)
+    assert 0 <= raised + 900e18 - (launch.stableBalance() + excess) <= constants.POOL_VIRTUAL_SHARES
+
+
+def test_donations_do_not_inflate_shares(successful_launch, poly_pool, mock_vault, accounts):
+    launch, stable = successful_launch
+    pool, _ = poly_pool
+    vault, _ = mock_vault
+    attacker = accounts[9]
+    stable.mint(20000e18, {"from": attacker})
+    stable.approve(pool, 1, {"from": attacker})
+    pool.deposit(1, {"from": attacker})
+
+    # stable sent straight to the pool is not counted as assets
+    stable.transfer(pool, 10000e18, {"from": attacker})
+    assert pool.reserve() == pool.totalAssets() == 1
+
+    # a donation to the pool's position in the underlying vault mostly accrues to the virtual shares
+    pool.rebalance({"from": attacker})
+    stable.transfer(vault, 10000e18, {"from": attacker})
+    raised = launch.totalFundsProvided()
+    launch.deposit(POOL_ID, {"from": accounts[0]})
+    position = launch.selectedVaultAdapter()
+
+    assert raised - pool.balanceOfUnderlying(position) <= raised // constants.POOL_VIRTUAL_SHARES
+    assert pool.balanceOfUnderlying(attacker) < 20000e18 // constants.POOL_VIRTUAL_SHARES
+
+
+def test_withdraw_reverts_on_illiquid_vault(successful_launch, poly_pool, mock_vault, accounts):
+    launch, stable = successful_launch
+    pool, _ = poly_pool
+    vault, _ = mock_vault
+    raised = launch.totalFundsProvided()
+    launch.deposit(POOL_ID, {"from": accounts[0]})
+    pool.rebalance({"from": accounts[9]})
+    # the underlying vault can only return part of what the pool holds in it
+    vault.setWithdrawalLimit(raised // 2, {"from": accounts[9]})
+
+    with brownie.reverts("PolyPool: insufficient liquidity"):
+        launch.exitFromVault({"from": accounts[0]})
+    vault.setWithdrawalLimit(2 ** 256 - 1, {"from": accounts[9]})
+    launch.exitFromVault({"from": accounts[0]})
+    assert launch.stableBalance() == raised
+
+
+def test_set_reserve_ratio(deployed_factory, poly_pool, accounts):
+    pool, _ = poly_pool
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    with brownie.reverts("Caller must be PolylaunchSystem contract"):
+        pool.setReserveRatio(5000, {"from": accounts[0]})
+
+    owner = accounts.at(system.owner(), force=True)
+    system.setPoolReserveRatio(pool, 5000, {"from": owner})
+    assert pool.reserveRatio() == 5000
+    with brownie.reverts("PolyPool: reserve ratio too high"):
+        system.setPoolReserveRatio(pool, 10001, {"from": owner})
+    accounts.remove(owner)
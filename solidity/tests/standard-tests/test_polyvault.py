@@ -0,0 +1,97 @@
+import brownie
+import constants
+from brownie import accounts, chain, MockVaultAdapter, PolylaunchSystem, PolyVaultRegistry
+
+MOCK_VAULT_ID = 1
+
+
+def test_deposit_uses_registered_adapter(successful_launch, mock_vault, accounts):
+    launch, stable = successful_launch
+    vault, adapter = mock_vault
+    raised = launch.totalFundsProvided()
+
+    tx = launch.deposit(MOCK_VAULT_ID, {"from": accounts[0]})
+
+    assert tx.events["VaultFundsDeposited"]["vaultAdapter"] == adapter
+    assert launch.selectedVaultAddress() == vault
+    # the position is held by a clone of the adapter owned by the launch
+    position = MockVaultAdapter.at(launch.selectedVaultAdapter())
+    assert position != adapter
+    assert position.owner() == launch
+    assert launch.activated()
+    assert launch.stableBalance() == 0
+    assert vault.balanceOfUnderlying(position) == raised
+    assert stable.balanceOf(launch) == 0
+    assert stable.allowance(launch, position) == 0
+
+
+def test_adapter_position_only_serves_its_launch(successful_launch, mock_vault, accounts):
+    launch, stable = successful_launch
+    vault, _ = mock_vault
+    launch.deposit(MOCK_VAULT_ID, {"from": accounts[0]})
+    position = MockVaultAdapter.at(launch.selectedVaultAdapter())
+
+    with brownie.reverts("PolyVaultAdapter: Caller must be owner"):
+        position.withdraw(vault, stable, 1, accounts[1], {"from": accounts[1]})
+    with brownie.reverts("PolyVaultAdapter: Caller must be owner"):
+        position.exit(vault, stable, {"from": accounts[1]})
+    with brownie.reverts("PolyVaultAdapter: Already initialized"):
+        position.initialize(accounts[1], {"from": accounts[1]})
+
+
+def test_launcher_yield_tap_through_adapter(successful_launch, mock_vault, accounts):
+    launch, stable = successful_launch
+    vault, _ = mock_vault
+    launch.deposit(MOCK_VAULT_ID, {"from": accounts[0]})
+    chain.sleep(86400)
+
+    initial_balance = stable.balanceOf(accounts[0])
+    tx = launch.launcherTap({"from": accounts[0]})
+    tapped = tx.events["VaultFundsTapped"]["amount"]
+
+    assert tapped > 0
+    assert stable.balanceOf(accounts[0]) - initial_balance == tapped
+    assert launch.remainingBalance() == launch.totalFundsProvided() - tapped
+
+
+def test_exit_sends_excess_yield_to_system(
+    successful_launch, mock_vault, deployed_factory, accounts
+):
+    launch, stable = successful_launch
+    vault, _ = mock_vault
+    system = deployed_factory.polylaunchSystemAddress()
+    launch.deposit(MOCK_VAULT_ID, {"from": accounts[0]})
+    # simulate yield accruing to the vault
+    stable.mint(900e18, {"from": accounts[9]})
+    stable.transfer(vault, 900e18, {"from": accounts[9]})
+    system_balance = stable.balanceOf(system)
+
+    launch.exitFromVault({"from": accounts[0]})
+
+    excess = stable.balanceOf(system) - system_balance
+    assert excess > 0
+    assert not launch.activated()
+    assert launch.selectedVaultAdapter() == constants.ZERO_ADDRESS
+    assert launch.stableBalance() == stable.balanceOf(launch)
+    assert launch.stableBalance() + excess == launch.totalFundsProvided() + 900e18
+
+
+def test_register_vault_without_adapter_fails(deployed_factory, mock_vault):
+    vault, _ = mock_vault
+    system = PolylaunchSystem.at(deployed_factory.polylaunchSystemAddress())
+    owner = accounts.at(system.owner(), force=True)
+    with brownie.reverts("VaultRegistry: The vault adapter cannot be the zero address"):
+        system.registerNewVault(
+            deployed_factory.getVaultRegistryAddress.call(),
+            vault,
+            "NO_ADAPTER",
+            constants.ZERO_ADDRESS,
+            {"from": owner},
+        )
+    accounts.remove(owner)
+
+
+def test_vault_descriptor(deployed_factory, mock_vault):
+    vault, adapter = mock_vault
+    registry = PolyVaultRegistry.at(deployed_factory.getVaultRegistryAddress.call())
+    assert registry.getVaultDescriptor(MOCK_VAULT_ID) == (vault, adapter, True)
@@ -320,4 +320,63 @@ def test_claim_refund_after_succeeded_proposal_succeeds(
     launcher_balance_before = token_contract.balanceOf(accounts[0])
     launch.launcherClaimRefund( {"from": accounts[0]})
     launcher_balance_after = token_contract.balanceOf(accounts[0])
-    assert launcher_balance_after > launcher_balance_before
\ No newline at end of file
+    assert launcher_balance_after > launcher_balance_before
+
+def test_claim_refunds_for_multiple_bonds(launch_with_queued_proposal, accounts):
+    proposal_id, launch, governor = launch_with_queued_proposal
+    proposed_tap_rate = governor.proposals(proposal_id, {"from": accounts[0]})[
+        "newRate"
+    ]
+
+    brownie.chain.sleep(86400 + 1)  # just over 1 day
+    governor.execute(proposal_id, {"from": accounts[0]})
+
+    if proposed_tap_rate != 0:
+        # it means it's a tap increase proposal. 0 is a default value. we aren't testing tap increase here
+        return
+
+    nft_contract = brownie.VentureBond.at(governor.ventureBond({"from": accounts[1]}))
+    nft_contract.transferFrom(accounts[2], accounts[1], 1, {"from": accounts[2]})
+    total_voting_power = launch.totalVotingPower()
+
+    tx = launch.claimRefunds([0, 1], {"from": accounts[1]})
+
+    assert tx.return_value == 2000e18
+    assert len(tx.events["RefundClaimed"]) == 2
+    # each bond carries 1000e18 * FIXED_SWAP_RATE / 1e18 = 10**24 voting power
+    assert launch.totalVotingPower() == total_voting_power - 2 * 10 ** 24
+    # later claims are paid at the same rate as earlier ones
+    tx = launch.claimRefund(2, {"from": accounts[3]})
+    assert tx.return_value == 1000e18
+
+
+def test_bonds_claimed_in_refund_mode_are_refunded(successful_launch, accounts):
+    launch, _ = successful_launch
+    governor = get_governor(launch, accounts[0])
+    st = brownie.GovernableERC20.at(governor.launchToken())
+    brownie.chain.sleep(1000000)
+    token_ids = {}
+    for inv in accounts[1:6]:
+        token_ids[inv] = launch.claim({"from": inv}).events["TokenMinted"]["tokenId"]
+        st.delegate(inv.address, {"from": inv})
+
+    proposal_id = governor.proposeRefund(
+        "Want a refund because reasons", token_ids[accounts[1]], {"from": accounts[1]}
+    ).return_value
+    brownie.chain.sleep(61)
+    for inv, token_id in token_ids.items():
+        governor.castVote(token_id, proposal_id, True, {"from": inv})
+    brownie.chain.sleep(86400)
+    governor.queue(proposal_id, {"from": accounts[0]})
+    brownie.chain.sleep(86400 + 1)
+    tx = governor.execute(proposal_id, {"from": accounts[0]})
+    assert "RefundModeInitiated" in tx.events
+
+    # the supporters that had not claimed yet still get a bond, refunded at the same rate
+    for inv in accounts[6:10]:
+        token_ids[inv] = launch.claim({"from": inv}).events["TokenMinted"]["tokenId"]
+    for inv, token_id in token_ids.items():
+        tx = launch.claimRefund(token_id, {"from": inv})
+        assert tx.return_value == 1000e18
+    assert launch.stableBalance() == 0
+    assert launch.totalVotingPower() == 0
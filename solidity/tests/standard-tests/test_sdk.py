@@ -0,0 +1,115 @@
+import time
+import constants
+from brownie import chain, web3, BasicLaunch, GovernorAlpha, VentureBond
+from indexer import EventStore, Indexer
+from scripts.index_events import system_abis
+from sdk import PolylaunchClient
+
+
+def new_client(**kwargs):
+    abis = {
+        "launch": BasicLaunch.abi,
+        "venture_bond": VentureBond.abi,
+        "governor": GovernorAlpha.abi,
+    }
+    return PolylaunchClient(web3, abis, **kwargs)
+
+
+def test_caches_immutable_views_for_good(running_launch):
+    client = new_client()
+    launch = client.launch(running_launch.address)
+
+    assert launch.hardCap() == running_launch.hardCap()
+    assert launch.ipfsHash() == running_launch.ipfsHash()
+    chain.mine()
+    client.at_block()
+    assert launch.hardCap() == running_launch.hardCap()
+    launch.ipfsHash()
+
+    metrics = client.metrics()
+    assert metrics["views"] == {"hardCap": 0.5, "ipfsHash": 0.0}
+    assert metrics["hit_rate"] == 0.25
+
+
+def test_event_invalidation(running_launch, send_1000_stable_to_accounts, deployed_factory, accounts):
+    stable = send_1000_stable_to_accounts
+    chain.sleep(int(constants.START_DATE - time.time()) + 1)
+    running_launch.batchAddToWhitelist(accounts[1:3], {"from": accounts[0]})
+    for account in accounts[1:3]:
+        stable.increaseAllowance(running_launch, 1000e18, {"from": account})
+    running_launch.sendStable(1000e18, {"from": accounts[1]})
+    indexer = Indexer(
+        web3, EventStore(), deployed_factory.polylaunchSystemAddress(), system_abis()
+    )
+    client = new_client()
+    launch = client.launch(running_launch.address)
+
+    def follow():
+        start = indexer.next_block()
+        indexer.sync()
+        client.observe(indexer.store.events(from_block=start), indexer.store.get_cursor())
+        client.at_block(indexer.store.get_cursor())
+
+    follow()
+    assert launch.totalFundsProvided() == 1000e18
+    # blocks without deposits keep the funding cached, the stable balance per block stays cached too
+    chain.mine(3)
+    follow()
+    assert launch.totalFundsProvided() == 1000e18
+    assert client.metrics()["views"]["totalFundsProvided"] == 0.5
+
+    running_launch.sendStable(500e18, {"from": accounts[2]})
+    follow()
+    assert launch.totalFundsProvided() == running_launch.totalFundsProvided() == 1500e18
+    assert launch.stableBalance() == running_launch.stableBalance()
+    assert client.metrics()["invalidations"] == 1
+
+
+def test_reads_behind_observed_events_are_not_reused(
+    running_launch, send_1000_stable_to_accounts, deployed_factory, accounts
+):
+    stable = send_1000_stable_to_accounts
+    chain.sleep(int(constants.START_DATE - time.time()) + 1)
+    running_launch.batchAddToWhitelist(accounts[1:3], {"from": accounts[0]})
+    for account in accounts[1:3]:
+        stable.increaseAllowance(running_launch, 1000e18, {"from": account})
+    running_launch.sendStable(1000e18, {"from": accounts[1]})
+    deposited_at = running_launch.sendStable(500e18, {"from": accounts[2]}).block_number
+    indexer = Indexer(
+        web3, EventStore(), deployed_factory.polylaunchSystemAddress(), system_abis()
+    )
+    indexer.sync()
+    client = new_client()
+    client.observe(indexer.store.events(), indexer.store.get_cursor())
+    launch = client.launch(running_launch.address)
+
+    # the deposit was observed before the older read was stored, so it never dropped it
+    client.at_block(deposited_at - 1)
+    assert launch.totalFundsProvided() == 1000e18
+    client.at_block(deposited_at)
+    assert launch.totalFundsProvided() == 1500e18
+    assert client.metrics()["views"]["totalFundsProvided"] == 0.0
+
+
+def test_mutable_views_are_cached_per_block_without_events(minted_launch, accounts):
+    launch, nft = minted_launch
+    client = new_client(max_entries=4)
+    bond = client.venture_bond(nft.address)
+    token_id = nft.tokenOfOwnerByIndex(accounts[1], 0)
+    chain.sleep(86400)
+    launch.supporterTap(token_id, {"from": accounts[1]})
+
+    assert bond.tappableBalance(token_id) == nft.tappableBalance(token_id)
+    assert bond.tappableBalance(token_id) == nft.tappableBalance(token_id)
+    chain.sleep(100)
+    launch.supporterTap(token_id, {"from": accounts[1]})
+    client.at_block()
+    assert bond.tappableBalance(token_id) == nft.tappableBalance(token_id)
+    assert bond.ownerOf(token_id) == accounts[1]
+
+    for account in accounts[2:6]:
+        bond.balanceOf(account.address)
+    metrics = client.metrics()
+    assert metrics["views"]["tappableBalance"] == 1 / 3
+    assert metrics["entries"] == 4
+    assert metrics["evictions"] == 2
@@ -48,7 +48,7 @@ def test_mint_an_nft(successful_launch, accounts, deployed_factory):
         )
         assert (
             venture_bond_contract.tokenURI(token_id, {"from": inv})
-            == constants.GENERIC_NFT_DATA[0]
+            == constants.token_uri(constants.GENERIC_NFT_DATA[0])
         )
         assert (
             venture_bond_contract.tokenMetadataHashes(token_id, {"from": inv})
@@ -56,6 +56,24 @@ def test_mint_an_nft(successful_launch, accounts, deployed_factory):
         )
 
 
+def test_bond_ids_encode_launch(minted_launch, alt_launch_minted, accounts):
+    launch, _ = minted_launch
+    alt_launch, _, nft = alt_launch_minted
+    alt_launch_id = alt_launch.launchId()
+
+    first_id, count = nft.launchBondRange(alt_launch_id)
+    assert first_id == alt_launch_id << 128
+    assert count == 9
+    for token_id in range(first_id, first_id + count):
+        assert nft.launchAddressAssociatedWithToken(token_id) == alt_launch
+    assert nft.launchBondRange(launch.launchId()) == (0, 9)
+    with brownie.reverts("VentureBond: token with that id does not exist"):
+        nft.launchAddressAssociatedWithToken(first_id + count)
+    # a bond of another launch is rejected without looking up its launch
+    with brownie.reverts("supporterTap: ventureBond not associated with this launch"):
+        alt_launch.supporterTap(0, {"from": accounts[1]})
+
+
 def test_set_nft_data_and_mint(successful_launch, accounts, deployed_factory):
     special_investor = accounts[1]
     non_special_investor = accounts[2]
@@ -71,7 +89,7 @@ def test_set_nft_data_and_mint(successful_launch, accounts, deployed_factory):
     launch_contract.claim({"from": non_special_investor})
     assert (
         venture_bond_contract.tokenURI(0, {"from": special_investor})
-        == constants.SPECIAL_NFT_DATA[0]
+        == constants.token_uri(constants.SPECIAL_NFT_DATA[0])
     )
     assert (
         venture_bond_contract.tokenMetadataHashes(0, {"from": special_investor})
@@ -79,7 +97,7 @@ def test_set_nft_data_and_mint(successful_launch, accounts, deployed_factory):
     )
     assert (
         venture_bond_contract.tokenURI(1, {"from": special_investor})
-        == constants.GENERIC_NFT_DATA[0]
+        == constants.token_uri(constants.GENERIC_NFT_DATA[0])
     )
     assert (
         venture_bond_contract.tokenMetadataHashes(1, {"from": special_investor})
@@ -102,7 +120,7 @@ def test_batch_set_nft_data_and_mint(successful_launch, accounts, deployed_facto
         launch_contract.claim({"from": inv})
         assert (
             venture_bond_contract.tokenURI(n, {"from": inv})
-            == constants.BATCH_SPECIAL_NFT_DATA[n][0]
+            == constants.token_uri(constants.BATCH_SPECIAL_NFT_DATA[n][0])
         )
         assert (
             venture_bond_contract.tokenMetadataHashes(n, {"from": inv})
@@ -111,7 +129,7 @@ def test_batch_set_nft_data_and_mint(successful_launch, accounts, deployed_facto
     launch_contract.claim({"from": non_special_investor})
     assert (
         venture_bond_contract.tokenURI(5, {"from": non_special_investor})
-        == constants.GENERIC_NFT_DATA[0]
+        == constants.token_uri(constants.GENERIC_NFT_DATA[0])
     )
     assert (
         venture_bond_contract.tokenMetadataHashes(5, {"from": non_special_investor})
@@ -598,3 +616,17 @@ def test_manual_voting_power_update_reverts(minted_launch, accounts):
     for n, inv in enumerate(investors):
         with brownie.reverts("VentureBond: not an Authorised launch"):
             venture_bond_contract.updateVotingPower(n, 9999999, inv, {"from": inv})
+
+
+def test_launch_base_uri(minted_launch, accounts):
+    launch, nft = minted_launch
+    launch_id = launch.launchId()
+    with brownie.reverts("VentureBond: caller is not the launcher"):
+        nft.setLaunchBaseURI(launch_id, "https://gateway.polylaunch.io/ipfs/", {"from": accounts[1]})
+
+    nft.setLaunchBaseURI(launch_id, "https://gateway.polylaunch.io/ipfs/", {"from": accounts[0]})
+
+    assert nft.tokenURIDigests(0) == "0x" + constants.GENERIC_NFT_DATA[0]
+    assert nft.tokenURI(0) == constants.token_uri(
+        constants.GENERIC_NFT_DATA[0], "https://gateway.polylaunch.io/ipfs/"
+    )
@@ -0,0 +1,64 @@
+import constants
+import numpy as np
+from brownie import chain
+from indexer.vesting import BondSchedules, LauncherSchedules, to_ints
+
+
+def launcher_params(launch, last_withdrawn):
+    finalized, successful = launch.launchOutcome()
+    return {
+        "finalized": finalized,
+        "successful": successful,
+        "refund_mode": False,
+        "tap_rate": launch.launcherTapRate(),
+        "total_funding": launch.totalFundsProvided(),
+        "soft_cap": launch.softCap(),
+        "vesting_period": launch.launcherVestingPeriod(),
+        "end_time": launch.launchEndTime(),
+        "available": launch.stableBalance(),
+        "last_withdrawn": last_withdrawn,
+    }
+
+
+def test_bond_projection_matches_supporter_taps(minted_launch, accounts):
+    launch, nft = minted_launch
+    supporters = accounts[1:10]
+    token_ids = [nft.tokenOfOwnerByIndex(account, 0) for account in supporters]
+    schedules = BondSchedules(
+        [nft.tapRate(t) for t in token_ids],
+        [nft.lastWithdrawnTime(t) for t in token_ids],
+        [nft.tappableBalance(t) for t in token_ids],
+        launch.launchOutcome()[1],
+    )
+    vested = schedules.fully_vested_at()
+
+    # each bond is tapped once, after a longer wait than the one before, the last one after it fully vested
+    for i, delay in enumerate([1, 86400, 30 * 86400, constants.INITIAL_INV_VESTING]):
+        chain.sleep(delay)
+        tx = launch.supporterTap(token_ids[i], {"from": supporters[i]})
+        projected = to_ints(*schedules.withdrawable(np.uint64(tx.timestamp)))
+        assert tx.events["SupporterFundsTapped"]["amount"] == projected[i]
+        assert (vested[i] <= tx.timestamp) == (i == 3)
+    assert projected[3] == to_ints(*schedules.balance)[3]
+    assert nft.tappableBalance(token_ids[3]) == 0
+
+
+def test_launcher_projection_matches_launcher_taps(successful_launch, accounts):
+    launch, _ = successful_launch
+    schedules = LauncherSchedules([launcher_params(launch, launch.launchEndTime())])
+    assert to_ints(*schedules.tap_due(np.uint64(launch.launchEndTime()))) == [0]
+
+    chain.sleep(86400)
+    # the first tap finalizes the launch, the schedule projects the rate finalize sets
+    tx = launch.launcherTap({"from": accounts[0]})
+    assert to_ints(*schedules.tap_due(np.uint64(tx.timestamp))) == [
+        tx.events["LauncherFundsTapped"]["amount"]
+    ]
+
+    schedules = LauncherSchedules([launcher_params(launch, tx.timestamp)])
+    chain.sleep(10 * 86400)
+    tx = launch.launcherTap({"from": accounts[0]})
+    times = np.array([[tx.timestamp - 86400], [tx.timestamp]], dtype=np.uint64)
+    earlier, due = to_ints(*schedules.tap_due(times))
+    assert due == [tx.events["LauncherFundsTapped"]["amount"]]
+    assert earlier[0] < due[0]